@@ -13,6 +13,3 @@ class CommentAdmin(admin.ModelAdmin):
         "updated_at",
         "created_at",
     )
-
-    def score(self, obj):
-        return obj.activities.filter(activity=1).count() - obj.activities.filter(activity=0).count()
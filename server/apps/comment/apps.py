@@ -1,6 +1,31 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+from server.apps.core.logic.signals import (
+    invalidate_cached_list,
+    invalidate_voted_list,
+    record_deletion,
+    record_move,
+    remove_vote,
+    votes_changed,
+)
 
 
 class CommentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.comment"
+
+    def ready(self):
+        """Connect signal receivers"""
+        from .logic.events import publish_deleted_comment, publish_saved_comment
+
+        Comment = self.get_model("Comment")
+
+        post_delete.connect(remove_vote, sender=self.get_model("CommentActivity"))
+        post_save.connect(publish_saved_comment, sender=Comment)
+        post_delete.connect(publish_deleted_comment, sender=Comment)
+        post_delete.connect(record_deletion, sender=Comment)
+        post_save.connect(record_move, sender=Comment)
+        post_save.connect(invalidate_cached_list, sender=Comment)
+        post_delete.connect(invalidate_cached_list, sender=Comment)
+        votes_changed.connect(invalidate_voted_list, sender=Comment)
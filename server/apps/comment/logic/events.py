@@ -0,0 +1,71 @@
+import asyncio
+
+from django.conf import settings
+from django.db import transaction
+
+from server.apps.core.logic.events import get_broker
+from server.apps.core.logic.renderers import FastJSONRenderer
+
+from .serializers import CommentSerializer
+
+
+def get_channel(topic_id) -> str:
+    """Get broker channel of comment events of a topic"""
+    return f"topic.{topic_id}.comments"
+
+
+def publish_saved_comment(sender, instance, created=False, raw=False, **kwargs):
+    """Publish created or updated comment once the transaction commits, serialized once for all subscribers"""
+
+    if raw:
+        return
+
+    event = "created" if created else "updated"
+
+    transaction.on_commit(
+        lambda: get_broker().publish(
+            get_channel(instance.topic_id), {"event": event, "data": CommentSerializer(instance).data}
+        )
+    )
+
+
+def publish_deleted_comment(sender, instance, **kwargs):
+    """Publish deleted comment once the transaction commits"""
+
+    event = {"event": "deleted", "data": {"id": instance.id, "topic": instance.topic_id}}
+
+    transaction.on_commit(lambda: get_broker().publish(get_channel(instance.topic_id), event))
+
+
+def format_event(event: dict) -> bytes:
+    """Format event as a Server-Sent Events message"""
+    return b"event: " + event["event"].encode() + b"\ndata: " + FastJSONRenderer().render(event["data"]) + b"\n\n"
+
+
+async def stream_comments(topic_id):
+    """
+    Yield Server-Sent Events of comments of a topic, with heartbeats keeping idle connections open.
+
+    The stream ends after `EVENT_STREAM_TIMEOUT` seconds and clients reconnect, so streams of clients
+    that went away without the server noticing do not stay subscribed.
+    """
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.EVENT_STREAM_TIMEOUT
+
+    async with get_broker().subscribe(get_channel(topic_id)) as subscription:
+        yield f"retry: {settings.EVENT_STREAM_RETRY}\n\n".encode()
+
+        while loop.time() < deadline:
+            timeout = min(settings.EVENT_STREAM_HEARTBEAT, deadline - loop.time())
+
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                continue
+
+            if event is None:
+                return
+
+            yield format_event(event)
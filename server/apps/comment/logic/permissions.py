@@ -1,29 +1,45 @@
 from rest_framework import permissions
 
+from server.apps.group.logic.membership import is_member
 from server.apps.topic.models import Topic
 
 
+def get_topic_group_id(request, topic_id):
+    """Get id of the group of the topic with `topic_id`, loaded once per request"""
+
+    http_request = getattr(request, "_request", request)
+    group_ids = http_request.__dict__.setdefault("_topic_group_ids", {})
+
+    if topic_id not in group_ids:
+        group_ids[topic_id] = Topic.objects.filter(id=topic_id).values_list("group_id", flat=True).first()
+
+    return group_ids[topic_id]
+
+
 class CommentPermissions(permissions.BasePermission):
     """Permissions for Comment viewset."""
 
     def has_permission(self, request, view):
         """Permission for Comment viewset."""
 
+        if view.action == "bulk":
+            return request.user.is_authenticated
+
         if view.action not in ["list", "create"]:
             return True
 
         topic_id = request.data.get("topic") or request.query_params.get("topic")
 
-        if not topic_id or not Topic.objects.filter(id=topic_id).exists():
+        try:
+            group_id = get_topic_group_id(request, topic_id)
+        except (TypeError, ValueError):
             return False
 
-        topic = Topic.objects.get(id=topic_id)
-
-        return topic.group.has_member(request.user)
+        return is_member(request, group_id)
 
     def has_object_permission(self, request, view, obj):
         """Permission for Comment viewset object."""
-        if request.method in permissions.SAFE_METHODS:
-            return obj.topic.group.has_member(request.user)
+        if request.method in permissions.SAFE_METHODS or view.action == "vote":
+            return is_member(request, obj.topic.group_id)
 
-        return request.user == obj.user or request.user == obj.topic.group.owner
+        return request.user.id == obj.user_id or request.user.id == obj.topic.group.owner_id
@@ -1,22 +1,25 @@
 from rest_framework import serializers
 
+from server.apps.core.logic.serializers import PreloadedPrimaryKeyRelatedField
+from server.apps.core.logic.sparse import SparseFieldsMixin
 from server.apps.user.logic.serializers import UserSerializer
 
 from ..models import Comment
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
         model = Comment
-        fields = ("id", "user", "topic", "text", "updated_at", "created_at")
-        read_only_fields = ("id", "user", "updated_at", "created_at")
+        fields = ("id", "user", "topic", "text", "upvotes", "downvotes", "score", "updated_at", "created_at")
+        read_only_fields = ("id", "user", "upvotes", "downvotes", "score", "updated_at", "created_at")
 
     def to_representation(self, instance):
         """Convert instance to representation"""
         data = super().to_representation(instance)
 
-        data["user"] = UserSerializer(instance.user).data
+        self.represent(data, "user", UserSerializer, lambda: instance.user, instance.user_id)
 
         return data
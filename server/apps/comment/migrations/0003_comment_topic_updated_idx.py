@@ -0,0 +1,16 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comment", "0002_commentactivity"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["topic", "updated_at", "id"], name="comment_topic_updated_idx"),
+        ),
+    ]
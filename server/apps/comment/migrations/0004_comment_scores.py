@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comment", "0003_comment_topic_updated_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="downvotes",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="score",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="upvotes",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:51
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def remove_duplicate_votes(apps, schema_editor):
+    """Keep only the latest vote of every user on a comment, scores are recounted by `rebuild_scores`"""
+    CommentActivity = apps.get_model("comment", "CommentActivity")
+
+    latest = CommentActivity.objects.values("user", "comment").annotate(latest_id=Max("id")).values("latest_id")
+
+    CommentActivity.objects.exclude(id__in=list(latest)).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comment", "0004_comment_scores"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_votes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="commentactivity",
+            constraint=models.UniqueConstraint(fields=("user", "comment"), name="unique_comment_activity_user"),
+        ),
+    ]
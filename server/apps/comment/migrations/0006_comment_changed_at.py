@@ -0,0 +1,28 @@
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def copy_updated_at(apps, schema_editor):
+    """Start changed_at of existing rows at their updated_at"""
+    apps.get_model("comment", "Comment").objects.update(changed_at=F("updated_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comment", "0005_commentactivity_unique_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="changed_at",
+            field=models.DateTimeField(auto_now=True, default=timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["topic", "changed_at", "id"], name="comment_topic_changed_idx"),
+        ),
+    ]
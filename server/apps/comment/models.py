@@ -2,13 +2,15 @@ from django.contrib.auth import get_user_model
 from django.db import models
 
 from server.apps.core.constants import ACTIVITY_CHOICES
-from server.apps.core.models import BaseModel
+from server.apps.core.models import ActivityModel, ScoreModel
 from server.apps.topic.models import Topic
 
 User = get_user_model()
 
 
-class Comment(BaseModel):
+class Comment(ScoreModel):
+    delta_scope = "topic"
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="comments")
     topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name="comments")
     text = models.TextField()
@@ -16,12 +18,18 @@ class Comment(BaseModel):
     class Meta:
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            models.Index(fields=["topic", "updated_at", "id"], name="comment_topic_updated_idx"),
+            models.Index(fields=["topic", "changed_at", "id"], name="comment_topic_changed_idx"),
+        ]
 
     def __str__(self):
         return f"Comment by {self.user.username} on {self.topic.title}"
 
 
-class CommentActivity(BaseModel):
+class CommentActivity(ActivityModel):
+    target_field = "comment"
+
     activity = models.BooleanField(choices=ACTIVITY_CHOICES)
     comment = models.ForeignKey(Comment, on_delete=models.CASCADE, related_name="activities")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="comment_activities")
@@ -31,6 +39,9 @@ class CommentActivity(BaseModel):
 
         verbose_name = "CommentActivity"
         verbose_name_plural = "CommentActivities"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "comment"], name="unique_comment_activity_user"),
+        ]
 
     def __str__(self) -> str:
         return self.get_activity_display()
@@ -1,8 +1,10 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from server.apps.comment.models import Comment
+from server.apps.comment.models import Comment, CommentActivity
 from server.apps.group.models import Group
 from server.apps.topic.models import Topic
 
@@ -72,7 +74,7 @@ class TestCommentEndpoints(APITestCase):
         response = self.client.get(f"/api/comments/?topic={self.topic1.id}")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
         self.client.force_authenticate(user=self.user2)
 
@@ -143,8 +145,171 @@ class TestCommentEndpoints(APITestCase):
 
         self.assertEqual(response.status_code, 200)
 
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
         response = self.client.get(f"/api/comments/?topic={self.topic2.id}")
 
         self.assertEqual(response.status_code, 403)
+
+    def test_comment_list_pagination(self):
+        """Test Comment list cursor pagination walks every comment exactly once."""
+        self.client.force_authenticate(user=self.user1)
+
+        for i in range(3):
+            Comment.objects.create(user=self.user1, topic=self.topic1, text=f"Extra comment {i}")
+
+        Comment.objects.filter(topic=self.topic1).update(updated_at=self.comment1.updated_at)
+
+        response = self.client.get(f"/api/comments/?topic={self.topic1.id}&page_size=2")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["previous"])
+
+        pages = [response.data]
+
+        while pages[-1]["next"]:
+            pages.append(self.client.get(pages[-1]["next"]).data)
+
+        ids = [comment["id"] for page in pages for comment in page["results"]]
+
+        expected_ids = Comment.objects.filter(topic=self.topic1).order_by("-id").values_list("id", flat=True)
+
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(ids, list(expected_ids))
+
+        response = self.client.get(pages[-1]["previous"])
+
+        self.assertEqual([comment["id"] for comment in response.data["results"]], ids[2:4])
+
+        response = self.client.get(f"/api/comments/?topic={self.topic1.id}&cursor=invalid")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_comment_vote(self):
+        """Test Comment Vote Endpoint."""
+        self.client.force_authenticate(user=self.user1)
+
+        for _ in range(2):
+            response = self.client.post(f"/api/comments/{self.comment2.id}/vote/", {"activity": 0})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(CommentActivity.objects.filter(comment=self.comment2).count(), 1)
+
+        response = self.client.get(f"/api/comments/{self.comment2.id}/")
+
+        self.assertEqual(response.data["score"], -1)
+
+        self.client.force_authenticate(user=self.user2)
+
+        response = self.client.post(f"/api/comments/{self.comment2.id}/vote/", {"activity": 1})
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_comment_membership_loaded_once(self):
+        """Test Comment endpoints load memberships of the user at most once per request."""
+        self.client.force_authenticate(user=self.user1)
+
+        requests = [
+            lambda: self.client.get(f"/api/comments/?topic={self.topic1.id}"),
+            lambda: self.client.get(f"/api/comments/{self.comment1.id}/"),
+            lambda: self.client.post(f"/api/comments/{self.comment1.id}/vote/", {"activity": 1}),
+        ]
+
+        for request in requests:
+            with CaptureQueriesContext(connection) as queries:
+                response = request()
+
+            membership_queries = [query for query in queries if "group_group_members" in query["sql"]]
+
+            self.assertLess(response.status_code, 300)
+            self.assertLessEqual(len(membership_queries), 1)
+
+    def test_comment_list_sparse_fields(self):
+        """Test Comment list renders only requested fields."""
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.get(f"/api/comments/?topic={self.topic1.id}&fields=id,user,score")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted((comment["user"], comment["score"]) for comment in response.data["results"]),
+            [(self.user1.id, 0), (self.user2.id, 0)],
+        )
+        self.assertEqual(set(response.data["results"][0]), {"id", "user", "score"})
+
+        response = self.client.get(f"/api/comments/{self.comment1.id}/?fields=text&expand=user")
+
+        self.assertEqual(response.data["text"], "Sample comment by user1")
+        self.assertEqual(response.data["user"]["username"], "testuser1")
+
+    def test_comment_create_json(self):
+        """Test Comment Create and Vote Endpoints accept JSON bodies."""
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post("/api/comments/", {"topic": self.topic1.id, "text": "JSON Comment"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["text"], "JSON Comment")
+
+        response = self.client.post(f"/api/comments/{response.data['id']}/vote/", {"activity": 1}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post("/api/comments/", '{"topic": ', content_type="application/json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_comment_bulk_create(self):
+        """Test Comment Bulk Create Endpoint creates valid items in one request and reports the others."""
+        self.client.force_authenticate(user=self.user1)
+
+        data = [
+            {"topic": self.topic1.id, "text": "Imported 1"},
+            {"topic": self.topic1.id},
+            {"topic": self.topic2.id, "text": "Other group"},
+            {"topic": self.topic1.id, "text": "Imported 2"},
+        ]
+
+        response = self.client.post("/api/comments/bulk/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([result["status"] for result in response.data], [201, 400, 403, 201])
+        self.assertEqual(response.data[0]["data"]["text"], "Imported 1")
+        self.assertEqual(response.data[0]["data"]["user"]["id"], self.user1.id)
+        self.assertIn("text", response.data[1]["errors"])
+        self.assertEqual(
+            set(Comment.objects.filter(text__startswith="Imported").values_list("id", flat=True)),
+            {response.data[0]["data"]["id"], response.data[3]["data"]["id"]},
+        )
+
+        response = self.client.get(f"/api/comments/?topic={self.topic1.id}")
+
+        self.assertEqual(len(response.data["results"]), 4)
+
+        data = [{"topic": self.topic1.id, "text": f"Imported {i}"} for i in range(5)]
+        data += [{"topic": 0, "text": "Missing topic"}, {"topic": "first", "text": "Invalid topic"}]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post("/api/comments/bulk/", data, format="json")
+
+        self.assertEqual([result["status"] for result in response.data], [201] * 5 + [400, 400])
+        self.assertEqual(len([query for query in queries if query["sql"].startswith('SELECT "topic_topic"')]), 1)
+
+    def test_comment_bulk_create_invalid(self):
+        """Test Comment Bulk Create Endpoint rejects bodies that are not a list of at most 500 objects."""
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post("/api/comments/bulk/", [{"topic": self.topic1.id, "text": "a"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post("/api/comments/bulk/", {"topic": self.topic1.id}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post("/api/comments/bulk/", [{"text": "a"}] * 501, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=None)
+
+        response = self.client.post("/api/comments/bulk/", [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import override_settings, SimpleTestCase, TestCase
+
+from server.apps.comment.logic.events import get_channel
+from server.apps.comment.models import Comment
+from server.apps.core.logic.events import get_broker, InProcessBroker
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic
+
+User = get_user_model()
+
+
+class InProcessBrokerTest(SimpleTestCase):
+    """Test InProcessBroker."""
+
+    async def test_publish(self):
+        """Test subscribers of a channel receive its events only while subscribed."""
+        broker = InProcessBroker()
+
+        async with broker.subscribe("a") as first, broker.subscribe("a") as second, broker.subscribe("b") as other:
+            await sync_to_async(broker.publish)("a", {"event": "created"})
+
+            self.assertEqual(await asyncio.wait_for(first.get(), 1), {"event": "created"})
+            self.assertEqual(await asyncio.wait_for(second.get(), 1), {"event": "created"})
+            self.assertTrue(other.queue.empty())
+            self.assertEqual(broker.count("a"), 2)
+
+        self.assertEqual(broker.count("a"), 0)
+
+    async def test_overflow(self):
+        """Test subscriber falling behind gets `None` after the queued events."""
+        broker = InProcessBroker(queue_size=2)
+
+        async with broker.subscribe("a") as subscription:
+            for i in range(5):
+                broker.publish("a", {"event": i})
+
+            await asyncio.sleep(0)
+
+            self.assertEqual(await subscription.get(), {"event": 1})
+            self.assertIsNone(await subscription.get())
+
+
+class CommentStreamTest(TestCase):
+    """Test comment event stream endpoint."""
+
+    def setUp(self):
+        self.user1 = User.objects.create(username="testuser1", password="testpassword")
+        self.user2 = User.objects.create(username="testuser2", password="testpassword")
+
+        self.group = Group.objects.create(name="Test Group", description="Description", owner=self.user1)
+        self.topic = Topic.objects.create(
+            title="Topic", description="Description", author=self.user1, group=self.group
+        )
+
+        self.url = f"/api/topics/{self.topic.id}/comments/stream/"
+        self.token = self.user1.get_tokens()["access"]
+
+    def commit(self, write):
+        """Run write and its on commit callbacks"""
+        with self.captureOnCommitCallbacks(execute=True):
+            return write()
+
+    async def test_permissions(self):
+        """Test stream is only open to members of the topic group."""
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get(self.url, {"token": "invalid"})
+        self.assertEqual(response.status_code, 401)
+
+        token = await sync_to_async(self.user2.get_tokens)()
+
+        response = await self.async_client.get(self.url, AUTHORIZATION=f"Bearer {token['access']}")
+        self.assertEqual(response.status_code, 403)
+
+        response = await self.async_client.get("/api/topics/0/comments/stream/", {"token": self.token})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_stream(self):
+        """Test created, updated and deleted comments are pushed to the stream."""
+        response = await self.async_client.get(self.url, {"token": self.token})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = response.streaming_content.__aiter__()
+
+        self.assertEqual(await stream.__anext__(), b"retry: 3000\n\n")
+
+        comment = await sync_to_async(self.commit)(
+            lambda: Comment.objects.create(user=self.user1, topic=self.topic, text="Hello")
+        )
+
+        event, data = (await asyncio.wait_for(stream.__anext__(), 1)).decode().strip().split("\n")
+
+        self.assertEqual(event, "event: created")
+        self.assertEqual(json.loads(data.removeprefix("data: "))["text"], "Hello")
+
+        comment.text = "Hello again"
+        await sync_to_async(self.commit)(comment.save)
+
+        event, data = (await asyncio.wait_for(stream.__anext__(), 1)).decode().strip().split("\n")
+
+        self.assertEqual(event, "event: updated")
+        self.assertEqual(json.loads(data.removeprefix("data: "))["text"], "Hello again")
+
+        comment_id = comment.id
+        await sync_to_async(self.commit)(comment.delete)
+
+        message = (await asyncio.wait_for(stream.__anext__(), 1)).decode()
+
+        self.assertEqual(message, f'event: deleted\ndata: {{"id":{comment_id},"topic":{self.topic.id}}}\n\n')
+
+        await stream.aclose()
+
+    @override_settings(EVENT_STREAM_HEARTBEAT=0.01, EVENT_STREAM_TIMEOUT=0.05)
+    async def test_stream_timeout(self):
+        """Test stream sends heartbeats and ends after its lifetime, removing the subscription."""
+        response = await self.async_client.get(self.url, {"token": self.token})
+
+        messages = [message async for message in response.streaming_content]
+
+        self.assertEqual(messages[0], b"retry: 3000\n\n")
+        self.assertIn(b": heartbeat\n\n", messages)
+        self.assertEqual(get_broker().count(get_channel(self.topic.id)), 0)
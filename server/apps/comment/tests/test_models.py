@@ -215,3 +215,19 @@ class CommentActivityModelTest(TransactionTestCase):
         """Test CommentActivity and User Relationship."""
         self.assertEqual(self.user1.comment_activities.count(), 1)
         self.assertEqual(self.user1.comment_activities.first(), self.commentActivity)
+
+    def test_comment_activity_score(self):
+        """Test CommentActivity keeps Comment vote counters in sync."""
+        self.comment1.refresh_from_db()
+        self.assertEqual((self.comment1.upvotes, self.comment1.downvotes, self.comment1.score), (1, 0, 1))
+
+        self.commentActivity.activity = False
+        self.commentActivity.save()
+
+        self.comment1.refresh_from_db()
+        self.assertEqual((self.comment1.upvotes, self.comment1.downvotes, self.comment1.score), (0, 1, -1))
+
+        self.user1.delete()
+
+        self.assertEqual(CommentActivity.objects.count(), 0)
+        self.assertEqual(Comment.objects.filter(score=0).count(), Comment.objects.count())
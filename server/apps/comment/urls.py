@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import comment_stream
+
+app_name = "comment"
+
+urlpatterns = [
+    path("topics/<int:topic_id>/comments/stream/", comment_stream, name="stream"),
+]
@@ -1,17 +1,35 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse, StreamingHttpResponse
 from django_filters import rest_framework as filters
-from rest_framework import viewsets
+from rest_framework import exceptions, viewsets
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
 
+from server.apps.core.logic.cache import CachedListMixin
+from server.apps.core.logic.conditional import ConditionalMixin
+from server.apps.core.logic.delta import DeltaMixin
+from server.apps.core.logic.mixins import BulkCreateMixin, VoteMixin
+from server.apps.core.logic.sparse import SparseFields
+from server.apps.group.logic.membership import is_member
+from server.apps.topic.models import Topic
+
+from .logic.events import stream_comments
 from .logic.filters import CommentFilter
-from .logic.permissions import CommentPermissions
+from .logic.permissions import CommentPermissions, get_topic_group_id
 from .logic.serializers import CommentSerializer
-from .models import Comment
+from .models import Comment, CommentActivity
+
+User = get_user_model()
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(DeltaMixin, ConditionalMixin, CachedListMixin, BulkCreateMixin, VoteMixin, viewsets.ModelViewSet):
     """ViewSet for Comment model"""
 
     model = Comment
     queryset = Comment.objects.all()
+    activity_model = CommentActivity
+    user_relations = ("user",)
 
     serializer_class = CommentSerializer
     permission_classes = [
@@ -22,8 +40,79 @@ class CommentViewSet(viewsets.ModelViewSet):
     ]
     filterset_class = CommentFilter
 
+    def get_queryset(self):
+        """Return queryset with topic, and user if the client asked for it, loaded up front"""
+        queryset = self.queryset.select_related("topic")
+        sparse = SparseFields.from_request(self.request)
+
+        if sparse.wants("user") and sparse.expands("user"):
+            queryset = queryset.select_related("user")
+
+        return queryset
+
+    def get_cache_scopes(self) -> list:
+        """Comment list renders comments of the topic and users of the topic group"""
+        topic_id = self.request.query_params.get("topic")
+
+        return [(Comment, topic_id), (User, get_topic_group_id(self.request, topic_id))]
+
+    def get_user_scopes(self, instance=None) -> list:
+        """Comments render users of the group of their topic"""
+        if instance is not None:
+            return [(User, instance.topic.group_id)]
+
+        return [(User, get_topic_group_id(self.request, self.request.query_params.get("topic")))]
+
+    def can_create(self, validated_data: dict) -> bool:
+        """Comments are created by members of the topic group"""
+        return is_member(self.request, validated_data["topic"].group_id)
+
     def filter_queryset(self, queryset):
         """Use Filter class if it is list action"""
         if self.action != "list":
             self.filterset_class = None
         return super().filter_queryset(queryset)
+
+
+def authenticate(request):
+    """Authenticate plain Django request like API views do, accepting the access token as `token` parameter"""
+
+    if "token" in request.GET and "HTTP_AUTHORIZATION" not in request.META:
+        request.META["HTTP_AUTHORIZATION"] = f"Bearer {request.GET['token']}"
+
+    drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+
+    try:
+        user = drf_request.user
+    except exceptions.AuthenticationFailed:
+        return None
+
+    request.user = user
+
+    return user if user.is_authenticated else None
+
+
+async def comment_stream(request, topic_id):
+    """
+    Stream created, updated and deleted comments of a topic as Server-Sent Events.
+
+    Requires an ASGI server. Browsers cannot set headers on `EventSource`, so the access token may be
+    passed as `token` query parameter.
+    """
+
+    if await sync_to_async(authenticate)(request) is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+    group_id = await Topic.objects.filter(id=topic_id).values_list("group_id", flat=True).afirst()
+
+    if group_id is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    if not await sync_to_async(is_member)(request, group_id):
+        return JsonResponse({"detail": "You do not have permission to perform this action."}, status=403)
+
+    response = StreamingHttpResponse(stream_comments(topic_id), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+
+    return response
@@ -0,0 +1,39 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework import generics
+
+
+class AsyncAPIView(generics.GenericAPIView):
+    """
+    Generic API view with async handlers, for endpoints awaiting work outside the request thread.
+
+    Django serves the view as async view. The request goes through the usual DRF steps like in
+    `APIView.dispatch`: authentication, permissions and throttling run in a sync thread, then the async
+    handler is awaited and the response is finalized for rendering.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Dispatch request to the async handler of its method"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            handler = getattr(self, request.method.lower(), None)
+
+            if request.method.lower() not in self.http_method_names or handler is None:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+
+        return self.response
@@ -0,0 +1,186 @@
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.utils.crypto import get_random_string
+from rest_framework.test import APIClient
+
+from server.apps.core.logic.seeding import CampusSeeder
+from server.apps.topic.models import Topic
+
+User = get_user_model()
+
+PASSWORD = "benchmark-password"
+
+
+class Dataset:
+    """Seeded campus a benchmark runs against, every user is a member of every group."""
+
+    def __init__(self, users: int, groups: int, topics: int, comments: int):
+        self.seeder = CampusSeeder(users, groups, users, topics, comments, password=PASSWORD)
+
+    def seed(self) -> None:
+        """Create the campus and load the users signing in"""
+
+        self.seeder.seed()
+
+        self.users = list(User.objects.filter(id__in=self.seeder.user_ids))
+        self.group_ids = self.seeder.group_ids
+        self.join_codes = self.seeder.join_codes
+        self.topic_ids = self.seeder.topic_ids
+        self.comment_ids = self.seeder.comment_ids
+
+
+class VirtualUser:
+    """API client of one simulated user, recording every request it makes."""
+
+    def __init__(self, dataset: Dataset, user, recorder: "Recorder"):
+        self.dataset = dataset
+        self.user = user
+        self.recorder = recorder
+        self.client = APIClient()
+
+    def authenticate(self) -> None:
+        """Use a fresh access token of the user"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user.get_tokens()['access']}")
+
+    def request(self, method: str, endpoint: str, url: str, data=None):
+        """Send request and record its latency, status and query count under `endpoint`"""
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = getattr(self.client, method)(url, data, format="json")
+            latency = time.perf_counter() - start
+
+        self.recorder.add(f"{method.upper()} {endpoint}", latency, len(queries), response.status_code)
+
+        return response
+
+
+def browse(vu: VirtualUser) -> None:
+    """Read-heavy browsing: groups, a group's topics, a topic and its comments"""
+    group_id = random.choice(vu.dataset.group_ids)
+    topic_id = random.choice(vu.dataset.topic_ids)
+
+    vu.request("get", "/api/groups/", "/api/groups/")
+    vu.request("get", "/api/groups/{id}/", f"/api/groups/{group_id}/")
+    vu.request("get", "/api/topics/?group=", f"/api/topics/?group={group_id}")
+    vu.request("get", "/api/topics/{id}/", f"/api/topics/{topic_id}/")
+    vu.request("get", "/api/comments/?topic=", f"/api/comments/?topic={topic_id}")
+    vu.request("get", "/api/comments/{id}/", f"/api/comments/{random.choice(vu.dataset.comment_ids)}/")
+    vu.request("get", "/api/auth/profile/", "/api/auth/profile/")
+
+
+def comment_burst(vu: VirtualUser) -> None:
+    """Write burst on one hot topic: new topics, comments and votes"""
+    topic_id = vu.dataset.topic_ids[0]
+    group_id = Topic.objects.values_list("group_id", flat=True).get(id=topic_id)
+
+    response = vu.request("post", "/api/comments/", "/api/comments/", {"topic": topic_id, "text": "Burst comment"})
+    comment_id = response.data.get("id", random.choice(vu.dataset.comment_ids))
+
+    vu.request(
+        "post", "/api/topics/", "/api/topics/", {"title": "Burst", "description": "Burst topic", "group": group_id}
+    )
+    vu.request("post", "/api/topics/{id}/vote/", f"/api/topics/{topic_id}/vote/", {"activity": random.randint(0, 1)})
+    vu.request("post", "/api/comments/{id}/vote/", f"/api/comments/{comment_id}/vote/", {"activity": 1})
+    vu.request("get", "/api/groups/join/", f"/api/groups/join/?join_code={random.choice(vu.dataset.join_codes)}")
+
+
+def login_storm(vu: VirtualUser) -> None:
+    """Whole campus signing in: login by username or email, token refresh and registration"""
+    suffix = get_random_string(12)
+
+    username_email = random.choice([vu.user.username, vu.user.email.upper()])
+
+    response = vu.request(
+        "post", "/api/auth/login/", "/api/auth/login/", {"username_email": username_email, "password": PASSWORD}
+    )
+    vu.request(
+        "post", "/api/auth/token/refresh/", "/api/auth/token/refresh/", {"refresh": response.data.get("refresh")}
+    )
+    vu.request(
+        "post",
+        "/api/auth/register/",
+        "/api/auth/register/",
+        {
+            "first_name": "Benchmark",
+            "last_name": "User",
+            "username": f"register-{suffix}",
+            "email": f"register-{suffix}@example.com",
+            "password": PASSWORD,
+            "password_confirmation": PASSWORD,
+        },
+    )
+
+
+SCENARIOS = {
+    "browse": browse,
+    "comment_burst": comment_burst,
+    "login_storm": login_storm,
+}
+
+
+class Recorder:
+    """Thread-safe collection of request samples per endpoint."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(list)
+
+    def add(self, endpoint: str, latency: float, queries: int, status: int) -> None:
+        """Record a request"""
+        with self.lock:
+            self.samples[endpoint].append((latency, queries, status))
+
+    def summarize(self, duration: float) -> dict:
+        """Get throughput, latency percentiles (ms), mean query count and errors per endpoint"""
+
+        endpoints = {}
+
+        for endpoint, samples in sorted(self.samples.items()):
+            latencies = sorted(sample[0] * 1000 for sample in samples)
+
+            endpoints[endpoint] = {
+                "requests": len(samples),
+                "errors": sum(1 for sample in samples if sample[2] >= 400),
+                "throughput": len(samples) / duration,
+                "p50": latencies[len(latencies) // 2],
+                "p95": latencies[min(len(latencies) - 1, len(latencies) * 95 // 100)],
+                "queries": statistics.mean(sample[1] for sample in samples),
+            }
+
+        total = sum(len(samples) for samples in self.samples.values())
+
+        return {"requests": total, "throughput": total / duration, "duration": duration, "endpoints": endpoints}
+
+
+def run_scenario(name: str, dataset: Dataset, concurrency: int, iterations: int) -> dict:
+    """Run scenario `iterations` times in each of `concurrency` threads, one virtual user per thread"""
+
+    recorder = Recorder()
+    scenario = SCENARIOS[name]
+
+    def run(user) -> None:
+        vu = VirtualUser(dataset, user, recorder)
+
+        try:
+            vu.authenticate()
+
+            for _ in range(iterations):
+                scenario(vu)
+        finally:
+            connections.close_all()
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(run, random.sample(dataset.users, min(concurrency, len(dataset.users)))))
+
+    return recorder.summarize(time.perf_counter() - start)
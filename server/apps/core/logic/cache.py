@@ -0,0 +1,136 @@
+import hashlib
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+
+class ResponseCache:
+    """
+    Cross-request cache of serialized list responses.
+
+    A list depends on scopes, `(model, id)` pairs such as the comments of a topic or the users rendered
+    in lists of a group (`(User, group_id)`). Every scope has a version token and a response is stored under the tokens
+    of its scopes, so invalidating a scope replaces its token and every list depending on it misses,
+    as in `MembershipCache`.
+    """
+
+    key_prefix = "response"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    @property
+    def cache(self):
+        """Get configured cache backend"""
+        return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+    @property
+    def timeout(self):
+        """Get configured timeout of cache entries in seconds"""
+        return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 5 * 60)
+
+    def get_version_key(self, model, scope_id) -> str:
+        """Get key of the version token of a scope"""
+        return f"{self.key_prefix}:version:{model._meta.label_lower}:{scope_id}"
+
+    def get_versions(self, scopes) -> list:
+        """Get version tokens of scopes, creating missing ones"""
+
+        keys = [self.get_version_key(*scope) for scope in scopes]
+        versions = self.cache.get_many(keys)
+
+        for key in keys:
+            if key not in versions:
+                version = uuid.uuid4().hex
+                self.cache.add(key, version, timeout=None)
+                versions[key] = self.cache.get(key, version)
+
+        return [versions[key] for key in keys]
+
+    def get_response(self, request, name: str, scopes, respond, variant: str = "") -> Response:
+        """
+        Get cached data of the response to request, calling `respond()` and caching its data on a miss.
+
+        Responses rendering fields only some users see are cached per `variant`, such as `"owner"`.
+        """
+
+        versions = self.get_versions(scopes)
+        key = hashlib.md5("|".join([request.get_full_path(), variant, *versions]).encode()).hexdigest()
+
+        data = self.cache.get(f"{self.key_prefix}:{key}")
+
+        self.count(name, hit=data is not None)
+
+        if data is not None:
+            return Response(data)
+
+        response = respond()
+
+        if response.status_code == 200:
+            self.cache.set(f"{self.key_prefix}:{key}", response.data, timeout=self.timeout)
+
+        return response
+
+    def invalidate(self, scopes) -> None:
+        """Invalidate lists depending on scopes now and again once the current transaction commits"""
+
+        version_keys = [self.get_version_key(*scope) for scope in scopes]
+
+        if version_keys:
+            self.cache.delete_many(version_keys)
+            transaction.on_commit(lambda: self.cache.delete_many(version_keys))
+
+    def count(self, name: str, hit: bool) -> None:
+        """Count a cache hit or miss of list `name`"""
+        with self.lock:
+            stats = self.stats.setdefault(name, {"hits": 0, "misses": 0})
+            stats["hits" if hit else "misses"] += 1
+
+    def get_stats(self) -> dict:
+        """Get hit and miss counters of every list of this process"""
+        with self.lock:
+            return {
+                name: {**stats, "hit_ratio": stats["hits"] / (stats["hits"] + stats["misses"])}
+                for name, stats in self.stats.items()
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit and miss counters of this process"""
+        with self.lock:
+            self.stats = {}
+
+
+response_cache = ResponseCache()
+
+
+class CachedListMixin:
+    """
+    Serves the `list` action of a ViewSet from `response_cache`.
+
+    `get_cache_scopes` returns the scopes the list depends on. Permission checks run before the cache,
+    data rendered differently depending on the user, such as fields only the group owner sees, is
+    cached per `get_cache_variant`.
+    """
+
+    def get_cache_scopes(self) -> list:
+        """Get `(model, id)` scopes the list depends on"""
+        raise NotImplementedError
+
+    def get_cache_variant(self) -> str:
+        """Get name of the variant of the list the requesting user sees"""
+        return ""
+
+    def list(self, request, *args, **kwargs):
+        """List objects from the response cache"""
+        return response_cache.get_response(
+            request,
+            self.model._meta.label_lower,
+            self.get_cache_scopes(),
+            lambda: super(CachedListMixin, self).list(request, *args, **kwargs),
+            self.get_cache_variant(),
+        )
@@ -0,0 +1,121 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from ..models import Tombstone
+from .cache import response_cache
+from .sparse import SparseFields
+
+
+class ConditionalMixin:
+    """
+    Answers `list` and `retrieve` of a ViewSet of `BaseModel`s with `304 Not Modified` before serializing.
+
+    Validators are computed from the `changed_field` of the objects, `updated_at` of the expanded
+    `conditional_relations`, the number of listed objects and the latest tombstone of the list (see
+    `DeltaMixin`), so a list costs one aggregate query instead of loading and serializing every object.
+    Users have no timestamp, the ETag covers the `(User, group_id)` version tokens of `response_cache`
+    from `get_user_scopes` instead, replaced whenever rendered fields of users of the group change, but
+    only when the response renders users as nested objects through `user_relations`. It also covers the
+    query string, renderer and requesting user. `Last-Modified` has second resolution, clients should
+    prefer `If-None-Match`.
+    """
+
+    conditional_relations = ()
+    user_relations = ()
+
+    def get_conditional_relations(self) -> list:
+        """Get relations rendered as nested objects for this request, see `SparseFields`"""
+        sparse = SparseFields.from_request(self.request)
+        return [
+            relation for relation in self.conditional_relations if sparse.wants(relation) and sparse.expands(relation)
+        ]
+
+    def get_user_scopes(self, instance=None) -> list:
+        """Get `(User, group_id)` scopes of the users rendered in the list, or in `instance`"""
+        return []
+
+    def renders_users(self) -> bool:
+        """Check if users are rendered as nested objects for this request, through dotted `user_relations`"""
+        sparse = SparseFields.from_request(self.request)
+        return any(self.renders(sparse, relation.split(".")) for relation in self.user_relations)
+
+    @classmethod
+    def renders(cls, sparse: SparseFields, names: list) -> bool:
+        """Check if the relation path `names` is rendered as nested objects"""
+        name, *rest = names
+
+        if not (sparse.wants(name) and sparse.expands(name)):
+            return False
+
+        return not rest or cls.renders(sparse.nested(name), rest)
+
+    def list(self, request, *args, **kwargs):
+        """List objects unless the client's copy of the list is current"""
+        relations = self.get_conditional_relations()
+        fields = [self.model.changed_field, *(f"{relation}__updated_at" for relation in relations)]
+        state = (
+            self.filter_queryset(self.get_queryset())
+            .order_by()
+            .aggregate(count=Count("pk"), **{field: Max(field) for field in fields})
+        )
+        deleted_at = (
+            Tombstone.objects.filter(model=self.model._meta.label_lower, scope_id=self.get_delta_scope())
+            .aggregate(deleted_at=Max("deleted_at"))
+            .get("deleted_at")
+        )
+
+        return self.get_conditional_response(
+            lambda: super(ConditionalMixin, self).list(request, *args, **kwargs),
+            [*(state[field] for field in fields), deleted_at],
+            self.get_user_scopes() if self.renders_users() else [],
+            state["count"],
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve object unless the client's copy is current"""
+        instance = self.get_object()
+        timestamps = [getattr(instance, self.model.changed_field)]
+
+        for relation in self.get_conditional_relations():
+            timestamps.append(getattr(instance, relation).updated_at)
+
+        return self.get_conditional_response(
+            lambda: Response(self.get_serializer(instance).data),
+            timestamps,
+            self.get_user_scopes(instance),
+            instance.pk,
+        )
+
+    def get_conditional_response(self, respond, timestamps: list, user_scopes: list, *validators):
+        """Get `304 Not Modified` if the client's copy is current, else the response of `respond`"""
+        known = [timestamp for timestamp in timestamps if timestamp is not None]
+        last_modified = int(max(known).timestamp()) if known else None
+
+        key = "|".join(
+            str(value)
+            for value in (
+                self.request.get_full_path(),
+                self.request.accepted_renderer.format,
+                self.request.user.pk,
+                *response_cache.get_versions(user_scopes),
+                *timestamps,
+                *validators,
+            )
+        )
+        etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+
+        if response is None:
+            response = respond()
+
+        response["ETag"] = etag
+
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+
+        return response
@@ -0,0 +1,122 @@
+from django.db.models import Q
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from ..models import Tombstone
+
+SINCE = openapi.Parameter(
+    "since",
+    openapi.IN_QUERY,
+    description="Only return objects changed and ids of objects removed after this time (ISO 8601)",
+    type=openapi.TYPE_STRING,
+    format=openapi.FORMAT_DATETIME,
+)
+AFTER = openapi.Parameter(
+    "after",
+    openapi.IN_QUERY,
+    description="Position within `since` returned with it by the previous page, e.g. `object:12`",
+    type=openapi.TYPE_STRING,
+)
+
+# Kinds of delta entries, in the order entries of the same time are returned
+KINDS = ("object", "deleted")
+
+
+class DeltaMixin:
+    """
+    Adds `?since=` delta mode to the `list` action of a ViewSet of `BaseModel`s.
+
+    With `since`, the list returns objects changed after it in `changed_field` order, ids of objects
+    removed from the list after it (see `Tombstone`) and the `since` and `after` values of the next request.
+    Both are paged on the compound cursor `(time, kind, id)`, so every page is limited to the page size
+    even when many entries share a timestamp, and a client syncing with the returned cursor never skips one.
+    A `since` older than `TOMBSTONE_RETENTION` is rejected, as tombstones before it are pruned.
+    """
+
+    def get_delta_scope(self):
+        """Get id the list is filtered by, tombstones are recorded with it as `scope_id`"""
+        return self.request.query_params.get(self.model.delta_scope)
+
+    def get_since(self):
+        """Parse `since` query parameter, rejecting times before tombstones are kept"""
+        try:
+            since = serializers.DateTimeField().to_internal_value(self.request.query_params["since"])
+        except serializers.ValidationError as error:
+            raise serializers.ValidationError({"since": error.detail})
+
+        if since < Tombstone.get_retention_start():
+            raise serializers.ValidationError(
+                {"since": ["Changes this old are no longer kept, reload the full list."]}
+            )
+
+        return since
+
+    def get_after(self) -> tuple:
+        """Parse `after` query parameter to `(kind index, id)`, entries at `since` are all excluded without it"""
+        if "after" not in self.request.query_params:
+            return len(KINDS), 0
+
+        kind, _, pk = self.request.query_params["after"].partition(":")
+
+        if kind not in KINDS or not pk.isdigit():
+            raise serializers.ValidationError({"after": ["Expected `<kind>:<id>` returned by the previous page."]})
+
+        return KINDS.index(kind), int(pk)
+
+    def get_cursor_filter(self, field: str, kind: str, cursor: tuple) -> Q:
+        """Get filter of entries of `kind` after `cursor`, compared on `(field, kind, id)`"""
+        since, after_kind, after_id = cursor
+
+        if KINDS.index(kind) > after_kind:
+            return Q(**{f"{field}__gte": since})
+
+        if KINDS.index(kind) == after_kind:
+            return Q(**{f"{field}__gt": since}) | Q(**{field: since, "id__gt": after_id})
+
+        return Q(**{f"{field}__gt": since})
+
+    def get_entries(self, cursor: tuple, limit: int) -> list:
+        """Get up to `limit` changed objects and tombstones after `cursor` as `(time, kind, id, entry)`"""
+        field = self.model.changed_field
+
+        queryset = self.filter_queryset(self.get_queryset()).filter(self.get_cursor_filter(field, "object", cursor))
+        tombstones = Tombstone.objects.filter(
+            self.get_cursor_filter("deleted_at", "deleted", cursor),
+            model=self.model._meta.label_lower,
+            scope_id=self.get_delta_scope(),
+        )
+
+        entries = [(getattr(obj, field), 0, obj.id, obj) for obj in queryset.order_by(field, "id")[:limit]]
+        entries += [
+            (tombstone.deleted_at, 1, tombstone.id, tombstone)
+            for tombstone in tombstones.order_by("deleted_at", "id")[:limit]
+        ]
+
+        return sorted(entries, key=lambda entry: entry[:3])
+
+    @swagger_auto_schema(manual_parameters=[SINCE, AFTER])
+    def list(self, request, *args, **kwargs):
+        """List objects, or only the changes after `since`"""
+        if "since" not in request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        cursor = (self.get_since(), *self.get_after())
+        page_size = (self.paginator.get_page_size(request) if self.paginator else None) or None
+
+        entries = self.get_entries(cursor, page_size + 1 if page_size else None)
+        has_more = page_size is not None and len(entries) > page_size
+        entries = entries[:page_size]
+
+        since, last_kind, last_id = entries[-1][:3] if entries else cursor
+
+        return Response(
+            {
+                "results": self.get_serializer([obj for _, kind, _, obj in entries if kind == 0], many=True).data,
+                "deleted": [tombstone.object_id for _, kind, _, tombstone in entries if kind == 1],
+                "since": serializers.DateTimeField().to_representation(since),
+                "after": f"{KINDS[last_kind]}:{last_id}" if last_kind < len(KINDS) else None,
+                "has_more": has_more,
+            }
+        )
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class Broker:
+    """
+    Publish/subscribe interface for pushing events to open streams.
+
+    `publish` is called from synchronous code (views, signal receivers) and `subscribe` from async
+    views. A broker shared by several processes (e.g. on Redis) implements the same two methods.
+    """
+
+    def publish(self, channel: str, event: dict) -> None:
+        """Send event to every subscriber of channel"""
+        raise NotImplementedError
+
+    def subscribe(self, channel: str):
+        """Get async context manager entering a subscription to channel, with an async `get` method"""
+        raise NotImplementedError
+
+
+class Subscription:
+    """
+    Queue of events of one subscriber, bound to the event loop it was entered in.
+
+    Used as async context manager, the broker registers it on enter and removes it on exit.
+    """
+
+    def __init__(self, broker: "InProcessBroker", channel: str, size: int):
+        self.broker = broker
+        self.channel = channel
+        self.queue = asyncio.Queue(maxsize=size)
+        self.overflowed = False
+
+    async def __aenter__(self):
+        self.loop = asyncio.get_running_loop()
+        self.broker.add(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.broker.remove(self)
+
+    def put(self, event: dict) -> None:
+        """Queue event, called in the subscriber's event loop, a full queue ends the subscription"""
+        if self.overflowed:
+            return
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self):
+        """Wait for the next event, `None` once the subscriber fell too far behind"""
+        return await self.queue.get()
+
+
+class InProcessBroker(Broker):
+    """
+    Broker delivering events to subscribers of the same process.
+
+    Every subscriber has a bounded queue, a subscriber that does not keep up gets `None` and should
+    close its stream, clients then reconnect and reload.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.lock = threading.Lock()
+        self.subscriptions = {}
+
+    def publish(self, channel: str, event: dict) -> None:
+        """Hand event over to the event loop of every subscriber"""
+
+        with self.lock:
+            subscriptions = list(self.subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                pass  # event loop closed, subscription is being removed
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Get subscription to channel, registered for the duration of its `async with` block"""
+        return Subscription(self, channel, self.queue_size)
+
+    def add(self, subscription: Subscription) -> None:
+        """Register subscription"""
+        with self.lock:
+            self.subscriptions.setdefault(subscription.channel, set()).add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Unregister subscription"""
+        with self.lock:
+            self.subscriptions[subscription.channel].discard(subscription)
+
+            if not self.subscriptions[subscription.channel]:
+                del self.subscriptions[subscription.channel]
+
+    def count(self, channel: str) -> int:
+        """Get number of subscribers of channel"""
+        with self.lock:
+            return len(self.subscriptions.get(channel, ()))
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> Broker:
+    """Get the broker configured by `EVENT_BROKER`, shared by the whole process"""
+    global _broker
+
+    with _broker_lock:
+        if _broker is None:
+            _broker = import_string(settings.EVENT_BROKER)()
+
+    return _broker
@@ -0,0 +1,137 @@
+from django.db import router, transaction
+from django.db.models.signals import post_save
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .schemas import BAD_REQUEST, BULK_RESULTS
+from .serializers import PreloadedPrimaryKeyRelatedField, VoteSerializer
+
+
+class VoteMixin:
+    """Adds `vote` action to a ViewSet of objects voted through `activity_model`"""
+
+    activity_model = None
+
+    @swagger_auto_schema(
+        methods=["post"],
+        request_body=VoteSerializer,
+        responses={
+            200: openapi.Response(description="Vote already recorded or flipped", schema=VoteSerializer),
+            201: openapi.Response(description="Vote recorded", schema=VoteSerializer),
+            400: openapi.Response(description="Bad request. Invalid data provided", schema=BAD_REQUEST),
+        },
+    )
+    @swagger_auto_schema(methods=["delete"], responses={204: "Vote removed"})
+    @action(detail=True, methods=["post", "delete"])
+    def vote(self, request, pk=None):
+        """Upvote or downvote object, repeating the same vote is a no-op"""
+        target = self.get_object()
+
+        if request.method == "DELETE":
+            lookup = {"user_id": request.user.pk, self.activity_model.target_field: target}
+            self.activity_model.objects.filter(**lookup).delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        serializer = VoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        created = self.activity_model.vote(request.user, target.pk, serializer.validated_data["activity"])
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+
+class BulkCreateMixin:
+    """
+    Adds `bulk` action creating a list of objects in one request and one transaction.
+
+    Every item is validated on its own and checked with `can_create`, valid items are inserted with
+    `bulk_create`. Objects the items refer to through a `PreloadedPrimaryKeyRelatedField` are loaded
+    once per request instead of once per item. The response lists a result per item in request
+    order, with the created object or the errors.
+    """
+
+    bulk_create_limit = 500
+
+    def can_create(self, validated_data: dict) -> bool:
+        """Check if the user may create an object from validated data"""
+        raise NotImplementedError
+
+    @swagger_auto_schema(
+        methods=["post"],
+        request_body=openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT)),
+        responses={
+            201: openapi.Response(description="Every object created", schema=BULK_RESULTS),
+            207: openapi.Response(description="Some objects rejected", schema=BULK_RESULTS),
+            400: openapi.Response(description="Bad request. Not a list or too many objects", schema=BAD_REQUEST),
+        },
+    )
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Create list of objects, skipping invalid items and items in groups the user is not a member of"""
+        self.check_bulk_data(request.data)
+
+        context = {**self.get_serializer_context(), "preloaded": self.preload(request.data)}
+        results, objects = [], []
+
+        for item in request.data:
+            result, obj = self.validate_bulk_item(item, context)
+            results.append(result)
+            objects += [obj] if obj is not None else []
+
+        self.perform_bulk_create(objects)
+
+        created = iter(self.get_serializer(objects, many=True).data)
+
+        for result in results:
+            if result["status"] == status.HTTP_201_CREATED:
+                result["data"] = next(created)
+
+        all_created = len(objects) == len(results)
+
+        return Response(results, status=status.HTTP_201_CREATED if all_created else status.HTTP_207_MULTI_STATUS)
+
+    def check_bulk_data(self, data) -> None:
+        """Check request data is a list of at most `bulk_create_limit` items"""
+        if not isinstance(data, list):
+            raise ValidationError({"non_field_errors": ["Expected a list of objects."]})
+
+        if len(data) > self.bulk_create_limit:
+            raise ValidationError({"non_field_errors": [f"Expected at most {self.bulk_create_limit} objects."]})
+
+    def preload(self, items: list) -> dict:
+        """Load objects the items refer to with one query per related field"""
+        return {
+            name: field.preload(item.get(name) for item in items if isinstance(item, dict))
+            for name, field in self.get_serializer().fields.items()
+            if isinstance(field, PreloadedPrimaryKeyRelatedField) and not field.read_only
+        }
+
+    def validate_bulk_item(self, item, context: dict) -> tuple:
+        """Validate item, returning its result and the unsaved object if it may be created"""
+        serializer = self.get_serializer(data=item, context=context)
+
+        if not serializer.is_valid():
+            return {"status": status.HTTP_400_BAD_REQUEST, "errors": serializer.errors}, None
+
+        if not self.can_create(serializer.validated_data):
+            return {
+                "status": status.HTTP_403_FORBIDDEN,
+                "errors": {"detail": "You do not have permission to perform this action."},
+            }, None
+
+        return {"status": status.HTTP_201_CREATED}, self.model(**serializer.validated_data)
+
+    def perform_bulk_create(self, objects: list) -> None:
+        """Insert objects and send `post_save` for each of them"""
+        with transaction.atomic():
+            self.model.objects.bulk_create(objects)
+
+            # bulk_create skips model signals, receivers (search index, caches, events) run for every object
+            for obj in objects:
+                post_save.send(
+                    sender=self.model, instance=obj, created=True, raw=False, using=router.db_for_write(self.model)
+                )
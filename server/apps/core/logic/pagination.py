@@ -0,0 +1,122 @@
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination over ``(-updated_at, -id)``.
+
+    The cursor stores the full position of the last row (``updated_at`` and ``id``), so every page
+    is fetched with a single index range scan instead of an offset, and deep pages cost the same as
+    the first one.
+    """
+
+    ordering = ("-updated_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    position_separator = "|"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return a single page of results, or `None` if pagination is disabled"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+
+        reverse = self.cursor is not None and self.cursor.reverse
+        position = self.cursor.position if self.cursor is not None else None
+
+        results = list(self.get_page_queryset(queryset, position, reverse)[: self.page_size + 1])
+        self.page = results[: self.page_size]
+
+        self.set_page_links(has_following=len(results) > len(self.page), position=position, reverse=reverse)
+
+        return self.page
+
+    def get_page_queryset(self, queryset, position, reverse):
+        """Order queryset in the direction of the cursor and keep the rows after its position"""
+        if reverse:
+            queryset = queryset.order_by(*[self.reverse_order(order) for order in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(queryset.model, position, reverse))
+
+        return queryset
+
+    def set_page_links(self, has_following, position, reverse):
+        """Set which links the fetched page has and the positions they continue from"""
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_following
+        else:
+            self.has_next, self.has_previous = has_following, position is not None
+
+        if self.page:
+            self.next_position = self._get_position_from_instance(self.page[-1], self.ordering)
+            self.previous_position = self._get_position_from_instance(self.page[0], self.ordering)
+        else:
+            self.has_next = self.has_previous = False
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+    def get_next_link(self):
+        """Get link to the page following the last returned row"""
+        if not self.has_next:
+            return None
+
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self.next_position))
+
+    def get_previous_link(self):
+        """Get link to the page preceding the first returned row"""
+        if not self.has_previous:
+            return None
+
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self.previous_position))
+
+    def get_position_filter(self, model, position, reverse):
+        """Build the keyset condition selecting rows strictly after `position`"""
+        values = position.split(self.position_separator)
+
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        fields = [order.lstrip("-") for order in self.ordering]
+
+        try:
+            values = [model._meta.get_field(field).to_python(value) for field, value in zip(fields, values)]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+        condition = Q()
+
+        for index, order in enumerate(self.ordering):
+            lookup = "lt" if order.startswith("-") != reverse else "gt"
+            equal = dict(zip(fields[:index], values[:index]))
+            condition |= Q(**equal, **{f"{fields[index]}__{lookup}": values[index]})
+
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        """Get position of instance as separated values of all ordering fields"""
+        values = []
+
+        for order in ordering:
+            field = order.lstrip("-")
+            value = instance[field] if isinstance(instance, dict) else getattr(instance, field)
+            values.append(value.isoformat() if hasattr(value, "isoformat") else str(value))
+
+        return self.position_separator.join(values)
+
+    @staticmethod
+    def reverse_order(order):
+        """Flip direction of an ordering expression"""
+        return order[1:] if order.startswith("-") else f"-{order}"
@@ -0,0 +1,26 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """JSON parser backed by `orjson` when it is installed, otherwise the stock `JSONParser`."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse incoming bytestream as JSON and return the resulting data"""
+
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            return orjson.loads(body if encoding.lower() in ("utf-8", "utf8") else body.decode(encoding))
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
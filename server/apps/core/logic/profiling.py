@@ -0,0 +1,115 @@
+import contextvars
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+from django.conf import settings
+
+current_profile = contextvars.ContextVar("current_profile", default=None)
+
+
+class Profile:
+    """SQL, serializer and wall time of a single request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.serializing = False
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """Database execute wrapper counting and timing queries"""
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql_time += time.perf_counter() - start
+
+
+@contextmanager
+def track_serialization():
+    """Add time spent in the block to the serializer time of the current request, ignoring nested blocks"""
+
+    profile = current_profile.get()
+
+    if profile is None or profile.serializing:
+        yield
+        return
+
+    profile.serializing = True
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        profile.serializer_time += time.perf_counter() - start
+        profile.serializing = False
+
+
+class ProfileStats:
+    """Rolling window of request profiles per view, summarized as percentiles."""
+
+    metrics = ("wall_time", "sql_time", "serializer_time", "queries")
+    percentiles = (50, 95, 99)
+
+    def __init__(self, size: int = 1000):
+        self.size = size
+        self.lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=self.size))
+
+    def add(self, view: str, profile: Profile, wall_time: float) -> None:
+        """Record profile of a request served by `view`"""
+        sample = (wall_time * 1000, profile.sql_time * 1000, profile.serializer_time * 1000, profile.queries)
+
+        with self.lock:
+            self.samples[view].append(sample)
+
+    def get(self) -> dict:
+        """Get request count and percentiles of every metric per view, times are in milliseconds"""
+
+        with self.lock:
+            samples = {view: list(values) for view, values in self.samples.items()}
+
+        return {
+            view: {
+                "count": len(values),
+                **{
+                    metric: self.summarize(sorted(value[index] for value in values))
+                    for index, metric in enumerate(self.metrics)
+                },
+            }
+            for view, values in sorted(samples.items())
+        }
+
+    def summarize(self, values: list) -> dict:
+        """Get nearest-rank percentiles of sorted values"""
+        return {f"p{p}": values[min(len(values) - 1, len(values) * p // 100)] for p in self.percentiles}
+
+    def reset(self) -> None:
+        """Drop all samples"""
+        with self.lock:
+            self.samples.clear()
+
+
+profile_stats = ProfileStats(getattr(settings, "PROFILING_SAMPLES", 1000))
+
+
+def get_view_name(request) -> str:
+    """Get name of the view and action handling request, e.g. `TopicViewSet.list`"""
+
+    match = getattr(request, "resolver_match", None)
+
+    if match is None:
+        return "unresolved"
+
+    view = getattr(match.func, "cls", None) or getattr(match.func, "view_class", None)
+
+    if view is None:
+        return match.view_name or match._func_path
+
+    actions = getattr(match.func, "actions", None) or {}
+
+    return f"{view.__name__}.{actions.get(request.method.lower(), request.method.lower())}"
@@ -0,0 +1,30 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by `orjson` when it is installed.
+
+    Datetimes are serialized natively, anything else `orjson` does not know (decimals, lazy strings,
+    querysets, ...) goes through the encoder of Django REST framework. Indented output for the
+    browsable API and installations without `orjson` fall back to the stock `JSONRenderer`.
+    """
+
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring"""
+
+        if orjson is None or self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        return orjson.dumps(data, default=self.encoder.default)
@@ -16,3 +16,22 @@ UNAUTHORIZED = openapi.Schema(
         "detail": openapi.Schema(type=openapi.TYPE_STRING),
     },
 )
+
+SERVICE_UNAVAILABLE = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "detail": openapi.Schema(type=openapi.TYPE_STRING, example="Too many logins in progress, retry shortly."),
+    },
+)
+
+BULK_RESULTS = openapi.Schema(
+    type=openapi.TYPE_ARRAY,
+    items=openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            "status": openapi.Schema(type=openapi.TYPE_INTEGER),
+            "data": openapi.Schema(type=openapi.TYPE_OBJECT),
+            "errors": openapi.Schema(type=openapi.TYPE_OBJECT),
+        },
+    ),
+)
@@ -0,0 +1,207 @@
+import random
+import string
+from io import StringIO
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import transaction
+from django.utils.crypto import get_random_string
+
+from server.apps.comment.models import Comment, CommentActivity
+from server.apps.group.logic.cache import membership_cache
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic, TopicActivity
+
+User = get_user_model()
+
+WORDS = (
+    "algebra analysis assignment biology calculus chemistry deadline essay exam group homework lab lecture "
+    "library notes physics presentation project question quiz reading report schedule seminar slides "
+    "statistics study summary thesis tutorial"
+).split()
+
+
+def batched(iterable, size: int):
+    """Split iterable into lists of at most `size` items"""
+    iterator = iter(iterable)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def sentence(words: int) -> str:
+    """Get random sentence of `words` words"""
+    return " ".join(random.choices(WORDS, k=words)).capitalize()
+
+
+class CampusSeeder:
+    """
+    Generator of a synthetic campus: users, groups, memberships, topics, comments and votes.
+
+    Rows are inserted with `bulk_create` in batches of `batch_size`, each batch in its own transaction,
+    and only primary keys are kept in memory. Model `save()` and signals are bypassed: join codes are
+    pre-generated, owners are inserted into the membership table with the other members, vote counters
+    are rebuilt with `rebuild_scores`, the search index with `reindex_search`, and the membership cache
+    of the seeded users is invalidated.
+    """
+
+    def __init__(
+        self,
+        users: int,
+        groups: int,
+        members: int,
+        topics: int,
+        comments: int,
+        votes: int = 0,
+        password: str = "password",
+        batch_size: int = 5000,
+        log=None,
+    ):
+        self.scale = {"users": users, "groups": groups, "members": members, "topics": topics, "comments": comments}
+        self.votes = votes
+        self.password = password
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.prefix = get_random_string(6, string.ascii_lowercase + string.digits)
+
+    def seed(self) -> None:
+        """Create the whole campus"""
+
+        self.user_ids = self.create_users()
+        self.group_ids, self.join_codes = self.create_groups()
+        self.create_memberships()
+        self.topic_ids = self.create_topics()
+        self.comment_ids = self.create_comments()
+        self.create_votes(TopicActivity, self.topic_ids)
+        self.create_votes(CommentActivity, self.comment_ids)
+
+        if self.votes:
+            call_command("rebuild_scores", batch_size=self.batch_size, stdout=StringIO())
+
+        call_command("reindex_search", batch_size=self.batch_size, stdout=StringIO())
+
+        membership_cache.invalidate(self.user_ids)
+
+    def insert(self, model, objects) -> list:
+        """Insert objects in batches and return their primary keys"""
+
+        pks = []
+
+        for batch in batched(objects, self.batch_size):
+            with transaction.atomic():
+                pks.extend(obj.pk for obj in model.objects.bulk_create(batch))
+
+        self.log(f"Created {len(pks)} {model._meta.verbose_name_plural}")
+
+        return pks
+
+    def create_users(self) -> list:
+        """Create users sharing one password hash"""
+        password = make_password(self.password)
+
+        return self.insert(
+            User,
+            (
+                User(username=f"{self.prefix}-{i}", email=f"{self.prefix}-{i}@example.com", password=password)
+                for i in range(self.scale["users"])
+            ),
+        )
+
+    def create_groups(self):
+        """Create groups with pre-generated join codes, owned by random users"""
+        join_codes = self.generate_join_codes(self.scale["groups"])
+        self.owner_ids = [random.choice(self.user_ids) for _ in join_codes]
+
+        group_ids = self.insert(
+            Group,
+            (
+                Group(
+                    name=f"Group {i}",
+                    description="Seeded group",
+                    owner_id=owner_id,
+                    join_code=join_code,
+                )
+                for i, (join_code, owner_id) in enumerate(zip(join_codes, self.owner_ids))
+            ),
+        )
+
+        return group_ids, join_codes
+
+    def generate_join_codes(self, count: int) -> list:
+        """Generate `count` distinct join codes unused in the database, checked in batches"""
+
+        join_codes = set()
+
+        while len(join_codes) < count:
+            candidates = {get_random_string(length=8) for _ in range(count - len(join_codes))} - join_codes
+
+            for batch in batched(candidates, self.batch_size):
+                used = set(Group.objects.filter(join_code__in=batch).values_list("join_code", flat=True))
+                join_codes.update(set(batch) - used)
+
+        return list(join_codes)
+
+    def create_memberships(self) -> None:
+        """Add owner and random users, `members` in total, to every group"""
+
+        through = Group.members.through
+        size = min(self.scale["members"], len(self.user_ids))
+
+        def generate():
+            for group_id, owner_id in zip(self.group_ids, self.owner_ids):
+                members = random.sample(self.user_ids, size)
+
+                if owner_id not in members:
+                    members[-1:] = [owner_id]
+
+                for user_id in members:
+                    yield through(group_id=group_id, user_id=user_id)
+
+        self.insert(through, generate())
+
+    def create_topics(self) -> list:
+        """Create `topics` topics in every group"""
+        return self.insert(
+            Topic,
+            (
+                Topic(
+                    title=sentence(4),
+                    description=sentence(20),
+                    author_id=random.choice(self.user_ids),
+                    group_id=group_id,
+                )
+                for group_id in self.group_ids
+                for _ in range(self.scale["topics"])
+            ),
+        )
+
+    def create_comments(self) -> list:
+        """Create `comments` comments on every topic"""
+        return self.insert(
+            Comment,
+            (
+                Comment(text=sentence(12), user_id=random.choice(self.user_ids), topic_id=topic_id)
+                for topic_id in self.topic_ids
+                for _ in range(self.scale["comments"])
+            ),
+        )
+
+    def create_votes(self, activity_model, target_ids: list) -> None:
+        """Create `votes` votes of distinct users, three in four of them upvotes, on every target"""
+
+        if not self.votes:
+            return
+
+        target_field = f"{activity_model.target_field}_id"
+        size = min(self.votes, len(self.user_ids))
+
+        self.insert(
+            activity_model,
+            (
+                activity_model(user_id=user_id, activity=random.random() < 0.75, **{target_field: target_id})
+                for target_id in target_ids
+                for user_id in random.sample(self.user_ids, size)
+            ),
+        )
@@ -0,0 +1,40 @@
+from django.core.exceptions import ValidationError
+from rest_framework import serializers
+
+from ..constants import ACTIVITY_CHOICES
+
+
+class VoteSerializer(serializers.Serializer):
+    """Serializer for upvote/downvote"""
+
+    activity = serializers.ChoiceField(choices=ACTIVITY_CHOICES, required=True)
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key field resolving objects from `context["preloaded"]`, filled by `BulkCreateMixin`, first"""
+
+    def preload(self, values) -> dict:
+        """Load objects of every valid primary key in values with one query"""
+        pks = set()
+
+        for value in values:
+            try:
+                pks.add(self.get_queryset().model._meta.pk.to_python(value))
+            except (TypeError, ValidationError):
+                pass
+
+        return self.get_queryset().in_bulk(pks - {None})
+
+    def to_internal_value(self, data):
+        """Get preloaded object of primary key, or load it"""
+        preloaded = self.context.get("preloaded", {}).get(self.field_name)
+
+        if preloaded is None or isinstance(data, bool):
+            return super().to_internal_value(data)
+
+        try:
+            return preloaded[self.get_queryset().model._meta.pk.to_python(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
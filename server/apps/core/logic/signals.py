@@ -0,0 +1,45 @@
+from django.dispatch import Signal
+
+from .cache import response_cache
+
+# Sent by `ScoreModel.add_vote` with the `pk` of the object whose vote counters changed
+votes_changed = Signal()
+
+
+def remove_vote(sender, instance, **kwargs):
+    """Remove deleted vote from counters of the voted object"""
+
+    vote = instance.get_loaded_vote() or instance.get_vote()
+
+    sender.get_target_model().add_vote(*vote, count=-1)
+
+
+def record_deletion(sender, instance, **kwargs):
+    """Record tombstone of a deleted object in the list of its `delta_scope` relation"""
+
+    from ..models import Tombstone
+
+    Tombstone.record(sender, instance.pk, [instance.get_scope_id()])
+
+
+def record_move(sender, instance, **kwargs):
+    """Record tombstone of a saved object in the list of the `delta_scope` relation it moved away from"""
+
+    from ..models import Tombstone
+
+    previous = instance.get_previous_scope_id()
+
+    if previous is not None:
+        Tombstone.record(sender, instance.pk, [previous])
+
+
+def invalidate_cached_list(sender, instance, **kwargs):
+    """Invalidate cached lists of the `delta_scope` relation a saved or deleted object is, or was, listed in"""
+    scope_ids = [instance.get_scope_id(), instance.get_previous_scope_id()]
+    response_cache.invalidate([(sender, scope_id) for scope_id in scope_ids if scope_id is not None])
+
+
+def invalidate_voted_list(sender, pk, **kwargs):
+    """Invalidate cached list an object whose vote counters changed is listed in"""
+    scope_id = sender.objects.filter(pk=pk).values_list(f"{sender.delta_scope}_id", flat=True).first()
+    response_cache.invalidate([(sender, scope_id)])
@@ -0,0 +1,122 @@
+from rest_framework import permissions
+
+from .profiling import track_serialization
+
+
+class SparseFields:
+    """
+    Fields and expanded relations requested with `?fields=` and `?expand=`.
+
+    `None` means "all": without either parameter every field is rendered and every relation is
+    expanded, as before. Once a parameter is given, only the listed fields are rendered and only
+    the listed relations are expanded, the others are rendered as primary keys. Dotted names such
+    as `group.name` select fields of a nested object and imply that the relation is expanded.
+    """
+
+    def __init__(self, fields=None, expand=None):
+        self.fields = fields
+        self.expand = expand
+
+    @classmethod
+    def from_request(cls, request):
+        """Parse `fields` and `expand` query parameters of a read request"""
+
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return cls()
+
+        fields = cls.split(request.query_params.get("fields"))
+        expand = cls.split(request.query_params.get("expand"))
+
+        if fields is None and expand is None:
+            return cls()
+
+        fields_expand = {field.split(".")[0] for field in fields or () if "." in field}
+
+        return cls(fields, (expand or set()) | fields_expand)
+
+    @staticmethod
+    def split(value):
+        """Split comma separated parameter into a set of names"""
+        if value is None:
+            return None
+
+        return {name.strip() for name in value.split(",") if name.strip()}
+
+    @property
+    def is_sparse(self) -> bool:
+        """Check if client asked for a subset of the representation"""
+        return self.fields is not None or self.expand is not None
+
+    def wants(self, name: str) -> bool:
+        """Check if field is rendered"""
+        return self.fields is None or name in self.fields or name in (self.expand or ())
+
+    def expands(self, name: str) -> bool:
+        """Check if relation is rendered as a nested object"""
+        return self.expand is None or name in self.expand
+
+    def nested(self, name: str) -> "SparseFields":
+        """Get fields and relations requested for the nested object of relation `name`"""
+
+        if not self.is_sparse:
+            return SparseFields()
+
+        prefix = f"{name}."
+
+        fields = {field.removeprefix(prefix) for field in self.fields or () if field.startswith(prefix)}
+        expand = {field.removeprefix(prefix) for field in self.expand or () if field.startswith(prefix)}
+
+        return SparseFields(fields or None, expand)
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin honouring `?fields=` and `?expand=`, see `SparseFields`.
+
+    Relations are rendered with `represent`. The root serializer reads the query parameters of the
+    request, nested serializers get `sparse` from their parent.
+    """
+
+    def __init__(self, *args, sparse=None, **kwargs):
+        self._sparse = sparse
+        super().__init__(*args, **kwargs)
+
+    @property
+    def sparse(self) -> SparseFields:
+        """Get fields and relations requested for this serializer"""
+
+        if self._sparse is None:
+            parent = self.parent
+            is_root = parent is None or (parent.parent is None and getattr(parent, "many", False))
+            self._sparse = SparseFields.from_request(self.context.get("request")) if is_root else SparseFields()
+
+        return self._sparse
+
+    def to_representation(self, instance):
+        """Convert instance to representation, timed for request profiling"""
+        with track_serialization():
+            return super().to_representation(instance)
+
+    def get_fields(self):
+        """Drop fields the client did not ask for"""
+        fields = super().get_fields()
+
+        if self.sparse.fields is None:
+            return fields
+
+        return {name: field for name, field in fields.items() if field.write_only or self.sparse.wants(name)}
+
+    def represent(self, data: dict, name: str, serializer_class, value, pk, many=False, context=None) -> None:
+        """Render relation `name` into `data` as nested object(s) if expanded or as primary key(s)"""
+
+        if not self.sparse.wants(name):
+            data.pop(name, None)
+        elif self.sparse.expands(name):
+            data[name] = serializer_class(
+                value() if callable(value) else value,
+                many=many,
+                context=context or {},
+                sparse=self.sparse.nested(name),
+            ).data
+        else:
+            data[name] = pk() if callable(pk) else pk
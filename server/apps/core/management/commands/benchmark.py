@@ -0,0 +1,106 @@
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+from django.utils import timezone
+
+from server.apps.core.logic.benchmark import Dataset, run_scenario, SCENARIOS
+
+
+class Command(BaseCommand):
+    help = "Run concurrent API scenarios against a freshly seeded test database and store the results as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+        parser.add_argument("--users", type=int, default=50, help="Seeded users, members of every group")
+        parser.add_argument("--groups", type=int, default=10, help="Seeded groups")
+        parser.add_argument("--topics", type=int, default=20, help="Seeded topics per group")
+        parser.add_argument("--comments", type=int, default=20, help="Seeded comments per topic")
+        parser.add_argument("--concurrency", type=int, default=8, help="Concurrent virtual users")
+        parser.add_argument("--iterations", type=int, default=10, help="Scenario runs per virtual user")
+        parser.add_argument("--output", type=Path, help="Result file, defaults to benchmarks/<commit>.json")
+        parser.add_argument("--compare", type=Path, help="Earlier result file to compare throughput and queries to")
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as directory:
+            self.use_file_databases(Path(directory))
+            setup_test_environment()
+            old_config = setup_databases(verbosity=0, interactive=False)
+
+            try:
+                dataset = Dataset(options["users"], options["groups"], options["topics"], options["comments"])
+                dataset.seed()
+
+                results = {
+                    name: run_scenario(name, dataset, options["concurrency"], options["iterations"])
+                    for name in options["scenarios"]
+                }
+            finally:
+                connections.close_all()
+                teardown_databases(old_config, verbosity=0)
+                teardown_test_environment()
+
+        commit = self.get_commit()
+        report = {
+            "commit": commit,
+            "date": timezone.now().isoformat(),
+            "options": {
+                name: options[name] for name in ("users", "groups", "topics", "comments", "concurrency", "iterations")
+            },
+            "scenarios": results,
+        }
+
+        output = options["output"] or Path(settings.BASE_DIR) / "benchmarks" / f"{commit or 'results'}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2))
+
+        previous = json.loads(options["compare"].read_text())["scenarios"] if options["compare"] else {}
+
+        for name, result in results.items():
+            self.write_scenario(name, result, previous.get(name, {}).get("endpoints", {}))
+
+        self.stdout.write(f"Results written to {output}")
+
+    def use_file_databases(self, directory: Path) -> None:
+        """Put SQLite test databases in files, in-memory ones cannot be written by concurrent threads"""
+
+        for alias in connections:
+            connection = connections[alias]
+
+            if connection.vendor == "sqlite":
+                connection.settings_dict["TEST"]["NAME"] = str(directory / f"{alias}.sqlite3")
+                connection.settings_dict["OPTIONS"].setdefault("timeout", 30)
+
+    def get_commit(self):
+        """Get short hash of the checked out commit, if running from a git checkout"""
+
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], capture_output=True, check=True, text=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def write_scenario(self, name: str, result: dict, previous: dict) -> None:
+        """Print endpoint table of a scenario, with relative change to `previous` endpoints if given"""
+
+        self.stdout.write(f"\n{name}: {result['requests']} requests, {result['throughput']:.1f} req/s")
+        self.stdout.write(f"{'endpoint':>36} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'queries':>8} {'errors':>7}")
+
+        for endpoint, stats in result["endpoints"].items():
+            line = (
+                f"{endpoint:>36} {stats['throughput']:>8.1f} {stats['p50']:>8.2f} {stats['p95']:>8.2f}"
+                f" {stats['queries']:>8.1f} {stats['errors']:>7}"
+            )
+
+            if endpoint in previous:
+                before = previous[endpoint]
+                change = (stats["throughput"] - before["throughput"]) / before["throughput"] * 100
+                line += f"  {change:+.0f}% req/s, {stats['queries'] - before['queries']:+.1f} queries"
+
+            self.stdout.write(line)
@@ -0,0 +1,61 @@
+import timeit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from server.apps.comment.logic.serializers import CommentSerializer
+from server.apps.comment.models import Comment
+from server.apps.core.logic import renderers
+from server.apps.core.logic.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare time to render a serialized comment list with each JSON renderer"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--comments", type=int, default=500, help="Comments in the payload")
+        parser.add_argument("--repeat", type=int, default=200, help="Renders per renderer")
+
+    def handle(self, *args, **options):
+        data = CommentSerializer(self.build_comments(options["comments"]), many=True).data
+
+        candidates = {"JSONRenderer": JSONRenderer()}
+
+        if renderers.orjson is not None:
+            candidates["FastJSONRenderer"] = FastJSONRenderer()
+        else:
+            self.stdout.write("orjson is not installed, FastJSONRenderer falls back to JSONRenderer")
+
+        for name, renderer in candidates.items():
+            seconds = min(timeit.repeat(lambda: renderer.render(data), number=options["repeat"], repeat=3))
+            size = len(renderer.render(data))
+
+            self.stdout.write(f"{name:>18}: {seconds / options['repeat'] * 1000:.3f} ms per render, {size} bytes")
+
+    def build_comments(self, count: int):
+        """Build unsaved comments with authors, as the comment list endpoint would serialize them"""
+
+        now = timezone.now()
+        users = [
+            User(id=i, username=f"user{i}", first_name="First", last_name="Last", email=f"user{i}@example.com")
+            for i in range(1, 51)
+        ]
+
+        return [
+            Comment(
+                id=i,
+                user=users[i % len(users)],
+                topic_id=1,
+                text=f"Comment number {i} on the topic, with a sentence or two of text in it. " * 2,
+                upvotes=i % 7,
+                downvotes=i % 3,
+                score=i % 7 - i % 3,
+                updated_at=now,
+                created_at=now,
+            )
+            for i in range(1, count + 1)
+        ]
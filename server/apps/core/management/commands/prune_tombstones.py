@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from server.apps.core.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones older than TOMBSTONE_RETENTION in batches, to run on a schedule"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Tombstones deleted per transaction")
+        parser.add_argument("--pause", type=float, default=0.1, help="Seconds to wait between batches")
+
+    def handle(self, *args, **options):
+        start = Tombstone.get_retention_start()
+        expired = Tombstone.objects.filter(deleted_at__lt=start).order_by("deleted_at")
+        count = 0
+
+        while ids := list(expired.values_list("id", flat=True)[: options["batch_size"]]):
+            with transaction.atomic():
+                count += Tombstone.objects.filter(id__in=ids).delete()[0]
+
+            if len(ids) < options["batch_size"]:
+                break
+
+            time.sleep(options["pause"])
+
+        self.stdout.write(f"Deleted {count} tombstones recorded before {start.isoformat()}")
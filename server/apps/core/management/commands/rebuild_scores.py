@@ -0,0 +1,55 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from server.apps.core.models import ActivityModel
+
+
+class Command(BaseCommand):
+    help = "Rebuild upvotes, downvotes and score counters from the activity tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of objects updated per transaction")
+
+    def handle(self, *args, **options):
+        for model in apps.get_models():
+            if issubclass(model, ActivityModel):
+                count = self.rebuild(model, options["batch_size"])
+                self.stdout.write(f"Rebuilt scores of {count} {model.get_target_model()._meta.verbose_name_plural}")
+
+    def rebuild(self, activity_model, batch_size: int) -> int:
+        """Recount votes of every object voted through `activity_model`, in batches of primary keys"""
+
+        target_model = activity_model.get_target_model()
+
+        votes = (
+            activity_model.objects.filter(**{activity_model.target_field: OuterRef("pk")})
+            .order_by()
+            .values(activity_model.target_field)
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        upvotes = Coalesce(Subquery(votes.filter(activity=True)), 0)
+        downvotes = Coalesce(Subquery(votes.filter(activity=False)), 0)
+
+        pks = target_model.objects.order_by("pk").values_list("pk", flat=True)
+        last_pk, count = None, 0
+
+        while True:
+            batch = list((pks.filter(pk__gt=last_pk) if last_pk is not None else pks)[:batch_size])
+
+            if not batch:
+                return count
+
+            with transaction.atomic():
+                target_model.objects.filter(pk__gte=batch[0], pk__lte=batch[-1]).update(
+                    upvotes=upvotes,
+                    downvotes=downvotes,
+                    score=upvotes - downvotes,
+                    changed_at=timezone.now(),
+                )
+
+            last_pk, count = batch[-1], count + len(batch)
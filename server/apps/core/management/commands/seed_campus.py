@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from server.apps.core.logic.seeding import CampusSeeder
+
+
+class Command(BaseCommand):
+    help = "Generate users, groups, memberships, topics, comments and votes with batched bulk inserts"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="Users to create")
+        parser.add_argument("--groups", type=int, default=100, help="Groups to create")
+        parser.add_argument("--members", type=int, default=50, help="Members per group, including the owner")
+        parser.add_argument("--topics", type=int, default=20, help="Topics per group")
+        parser.add_argument("--comments", type=int, default=20, help="Comments per topic")
+        parser.add_argument("--votes", type=int, default=5, help="Votes per topic and per comment")
+        parser.add_argument("--password", default="password", help="Password of every created user")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows inserted per transaction")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+
+        seeder = CampusSeeder(
+            users=options["users"],
+            groups=options["groups"],
+            members=options["members"],
+            topics=options["topics"],
+            comments=options["comments"],
+            votes=options["votes"],
+            password=options["password"],
+            batch_size=options["batch_size"],
+            log=lambda message: self.stdout.write(f"{time.perf_counter() - start:8.1f}s {message}"),
+        )
+        seeder.seed()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded campus in {time.perf_counter() - start:.1f}s, users are named {seeder.prefix}-<number>"
+            )
+        )
@@ -0,0 +1,85 @@
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+
+from .logic.profiling import current_profile, get_view_name, Profile, profile_stats
+
+
+class ProfilingMiddleware:
+    """
+    Profile every request: SQL query count and time, serializer time and wall time.
+
+    Timings are sent back in the `Server-Timing` header and aggregated per view in `profile_stats`.
+    Enabled with the `DJANGO_PROFILING` environment variable.
+    Works on both WSGI and ASGI, in async mode queries are counted on the thread running the sync code.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        profile = Profile()
+        token = current_profile.set(profile)
+        start = time.perf_counter()
+
+        try:
+            with self.instrument(profile):
+                response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+
+        return self.finish(request, response, profile, start)
+
+    async def __acall__(self, request):
+        profile = Profile()
+        token = current_profile.set(profile)
+        start = time.perf_counter()
+
+        try:
+            stack = await sync_to_async(self.instrument)(profile)
+
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            current_profile.reset(token)
+
+        return self.finish(request, response, profile, start)
+
+    def instrument(self, profile: Profile) -> ExitStack:
+        """Wrap query execution of every database connection of the current thread with `profile`"""
+        stack = ExitStack()
+
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(profile.execute_wrapper))
+
+        return stack
+
+    def finish(self, request, response, profile: Profile, start: float):
+        """Record profile of the request and add its timings to the response"""
+        wall_time = time.perf_counter() - start
+
+        profile_stats.add(get_view_name(request), profile, wall_time)
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'sql;dur={profile.sql_time * 1000:.2f};desc="{profile.queries} queries"',
+                f"serializer;dur={profile.serializer_time * 1000:.2f}",
+                f"total;dur={wall_time * 1000:.2f}",
+            ]
+        )
+
+        return response
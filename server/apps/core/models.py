@@ -1,9 +1,21 @@
-from django.db import models
+import datetime
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .logic.signals import votes_changed
 
 
 class BaseModel(models.Model):
     """Base model for all models in the project."""
 
+    # Name of the relation lists of the model are filtered by, see `DeltaMixin`
+    delta_scope = None
+    # Field bumped by every change clients sync and revalidate with, see `DeltaMixin` and `ConditionalMixin`
+    changed_field = "updated_at"
+
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -12,3 +24,195 @@ class BaseModel(models.Model):
 
         abstract = True
         ordering = ["-updated_at"]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the `delta_scope` id as loaded, so a move to another scope can be detected on save"""
+        instance = super().from_db(db, field_names, values)
+
+        if cls.delta_scope and f"{cls.delta_scope}_id" in field_names:
+            instance._loaded_scope_id = instance.get_scope_id()
+
+        return instance
+
+    def get_scope_id(self):
+        """Get id of the `delta_scope` relation"""
+        return getattr(self, f"{self.delta_scope}_id")
+
+    def get_previous_scope_id(self):
+        """Get `delta_scope` id the object was loaded with if it moved to another scope since, else `None`"""
+        previous = getattr(self, "_loaded_scope_id", None)
+        return previous if previous != self.get_scope_id() else None
+
+    def save(self, *args, **kwargs):
+        """Save instance, remembering its saved `delta_scope` id"""
+        super().save(*args, **kwargs)
+
+        if self.delta_scope:
+            self._loaded_scope_id = self.get_scope_id()
+
+
+class ScoreModel(BaseModel):
+    """Base model for objects that can be upvoted and downvoted."""
+
+    upvotes = models.IntegerField(default=0, editable=False)
+    downvotes = models.IntegerField(default=0, editable=False)
+    score = models.IntegerField(default=0, editable=False)
+    # Bumped by edits and votes, while `updated_at`, which lists are ordered by, only changes on edits
+    changed_at = models.DateTimeField(auto_now=True)
+
+    changed_field = "changed_at"
+
+    class Meta(BaseModel.Meta):
+        """Meta class."""
+
+        abstract = True
+
+    counter_fields = ("upvotes", "downvotes", "score")
+
+    def save(self, *args, **kwargs):
+        """Save instance without writing vote counters of an existing row, which only `add_vote` updates"""
+
+        if not self._state.adding and not kwargs.get("force_insert") and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def add_vote(cls, pk, activity: bool, count: int = 1) -> None:
+        """Add `count` votes (negative to remove them) to counters of the object with `pk`, bumping `changed_at`"""
+
+        counter = "upvotes" if activity else "downvotes"
+
+        cls.objects.filter(pk=pk).update(
+            **{counter: F(counter) + count},
+            score=F("score") + (count if activity else -count),
+            changed_at=timezone.now(),
+        )
+        votes_changed.send(sender=cls, pk=pk)
+
+
+class ActivityModel(BaseModel):
+    """
+    Base model for votes on a `ScoreModel`.
+
+    Subclasses set `target_field` to the name of the foreign key to the voted object. Counters of the
+    voted object are updated in the same transaction as the vote itself, removal is handled by the
+    `remove_vote` signal receiver so cascading deletes are counted as well.
+    """
+
+    target_field = None
+
+    class Meta(BaseModel.Meta):
+        """Meta class."""
+
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the vote as loaded, so changes can be applied as deltas on save"""
+        instance = super().from_db(db, field_names, values)
+
+        if {"activity", f"{cls.target_field}_id"}.issubset(field_names):
+            instance._loaded_vote = instance.get_vote()
+
+        return instance
+
+    @classmethod
+    def get_target_model(cls):
+        """Get model of the voted object"""
+        return cls._meta.get_field(cls.target_field).related_model
+
+    def get_vote(self):
+        """Get vote as `(target_id, activity)` pair"""
+        return getattr(self, f"{self.target_field}_id"), bool(self.activity)
+
+    def get_loaded_vote(self):
+        """Get vote as it is currently stored in the database"""
+        return getattr(self, "_loaded_vote", None)
+
+    def save(self, *args, **kwargs):
+        """Save instance and move its vote on the voted object counters"""
+
+        previous, current = self.get_loaded_vote(), self.get_vote()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if previous != current:
+                if previous:
+                    self.get_target_model().add_vote(*previous, count=-1)
+
+                self.get_target_model().add_vote(*current)
+
+        self._loaded_vote = current
+
+    @classmethod
+    def vote(cls, user, target_id, activity: bool) -> bool:
+        """
+        Record vote of `user` on the object with `target_id` without reading the existing vote.
+
+        The vote is inserted first and the unique constraint on `(user, target)` rejects a repeated
+        one, then an existing opposite vote is flipped by a conditional update. Returns `True` if a
+        new vote was created.
+        """
+
+        activity = bool(activity)
+        lookup = {"user_id": user.pk, f"{cls.target_field}_id": target_id}
+
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    cls.objects.create(activity=activity, **lookup)
+                return True
+            except IntegrityError:
+                pass
+
+            flipped = cls.objects.filter(**lookup).exclude(activity=activity)
+
+            if flipped.update(activity=activity, updated_at=timezone.now()):
+                cls.get_target_model().add_vote(target_id, not activity, count=-1)
+                cls.get_target_model().add_vote(target_id, activity)
+
+        return False
+
+
+class Tombstone(models.Model):
+    """
+    Record of an object removed from a list clients sync with `?since=`, see `DeltaMixin`.
+
+    `scope_id` is the id the list is filtered by: the group of a topic, the topic of a comment and the
+    user who lost access for a group.
+    """
+
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    scope_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        """Meta class."""
+
+        indexes = [
+            models.Index(fields=["model", "scope_id", "deleted_at"], name="tombstone_scope_deleted_idx"),
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.model} {self.object_id}"
+
+    @classmethod
+    def get_retention_start(cls):
+        """Get time before which tombstones are pruned, see `prune_tombstones`"""
+        return timezone.now() - datetime.timedelta(seconds=getattr(settings, "TOMBSTONE_RETENTION", 30 * 24 * 60 * 60))
+
+    @classmethod
+    def record(cls, model, object_id, scope_ids) -> None:
+        """Record removal of the object with `object_id` from the lists of every scope"""
+        cls.objects.bulk_create(
+            cls(model=model._meta.label_lower, object_id=object_id, scope_id=scope_id) for scope_id in scope_ids
+        )
@@ -0,0 +1,35 @@
+from django.test import TestCase
+
+from server.apps.core.logic.benchmark import Dataset, Recorder, SCENARIOS, VirtualUser
+
+
+class BenchmarkTest(TestCase):
+    """Test benchmark scenarios against a small seeded dataset."""
+
+    def setUp(self):
+        self.dataset = Dataset(users=3, groups=2, topics=2, comments=2)
+        self.dataset.seed()
+
+    def test_seed(self):
+        """Test dataset ids are collected for every seeded row."""
+        self.assertEqual(len(self.dataset.users), 3)
+        self.assertEqual(len(self.dataset.group_ids), 2)
+        self.assertEqual(len(self.dataset.topic_ids), 4)
+        self.assertEqual(len(self.dataset.comment_ids), 8)
+
+    def test_scenarios(self):
+        """Test every scenario request succeeds and is recorded."""
+        recorder = Recorder()
+        vu = VirtualUser(self.dataset, self.dataset.users[0], recorder)
+        vu.authenticate()
+
+        for scenario in SCENARIOS.values():
+            scenario(vu)
+
+        result = recorder.summarize(1.0)
+
+        self.assertEqual(result["requests"], 15)
+
+        for endpoint, stats in result["endpoints"].items():
+            self.assertEqual(stats["errors"], 0, endpoint)
+            self.assertGreater(stats["queries"], 0, endpoint)
@@ -0,0 +1,185 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+
+from server.apps.comment.models import Comment, CommentActivity
+from server.apps.core.logic.cache import response_cache
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic, TopicActivity
+
+User = get_user_model()
+
+
+class ResponseCacheTest(APITestCase):
+    """Test response cache of topic and comment lists."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user1 = User.objects.create(username="testuser1", password="testpassword", is_staff=True)
+        self.user2 = User.objects.create(username="testuser2", password="testpassword")
+
+        self.group = Group.objects.create(name="Group", description="Description", owner=self.user1)
+        self.group.members.add(self.user2)
+        self.topic = Topic.objects.create(
+            title="Topic", description="Description", author=self.user1, group=self.group
+        )
+        self.comment = Comment.objects.create(user=self.user1, topic=self.topic, text="Hello")
+
+        self.topics_url = f"/api/topics/?group={self.group.id}"
+        self.comments_url = f"/api/comments/?topic={self.topic.id}"
+
+        self.client.force_authenticate(user=self.user1)
+        response_cache.reset_stats()
+
+    def get_stats(self, name: str) -> tuple:
+        """Get hits and misses of list"""
+        stats = response_cache.get_stats().get(name, {"hits": 0, "misses": 0})
+        return stats["hits"], stats["misses"]
+
+    def assertChanges(self, url: str, change, check):
+        """Assert list is cached and `change` invalidates it so `check` holds for the next response"""
+        self.client.get(url)
+        hits = self.get_stats(self.name(url))[0]
+
+        self.client.get(url)
+        self.assertEqual(self.get_stats(self.name(url))[0], hits + 1)
+
+        change()
+        response = self.client.get(url)
+
+        self.assertEqual(self.get_stats(self.name(url))[0], hits + 1)
+        self.assertTrue(check(response.data["results"]), response.data["results"])
+
+    @staticmethod
+    def name(url: str) -> str:
+        """Get statistics name of list"""
+        return "topic.topic" if url.startswith("/api/topics/") else "comment.comment"
+
+    def test_comment_list(self):
+        """Test comment list is cached and invalidated by comments, votes and user profile changes."""
+        self.assertChanges(
+            self.comments_url,
+            lambda: Comment.objects.create(user=self.user2, topic=self.topic, text="Reply"),
+            lambda results: len(results) == 2,
+        )
+        self.assertChanges(
+            self.comments_url,
+            lambda: CommentActivity.vote(self.user2, self.comment.id, True),
+            lambda results: [comment["score"] for comment in results if comment["id"] == self.comment.id] == [1],
+        )
+        self.assertChanges(
+            self.comments_url,
+            lambda: CommentActivity.vote(self.user2, self.comment.id, False),
+            lambda results: [comment["score"] for comment in results if comment["id"] == self.comment.id] == [-1],
+        )
+
+        self.user1.first_name = "Renamed"
+        self.assertChanges(
+            self.comments_url,
+            self.user1.save,
+            lambda results: {comment["user"]["first_name"] for comment in results} == {"Renamed", ""},
+        )
+
+    def test_topic_list(self):
+        """Test topic list is cached and invalidated by topics, votes and group membership changes."""
+        self.assertChanges(
+            self.topics_url,
+            lambda: TopicActivity.vote(self.user2, self.topic.id, True),
+            lambda results: results[0]["score"] == 1,
+        )
+        self.assertChanges(
+            self.topics_url,
+            lambda: self.group.members.remove(self.user2),
+            lambda results: [member["id"] for member in results[0]["group"]["members"]] == [self.user1.id],
+        )
+        self.assertChanges(self.topics_url, self.topic.delete, lambda results: results == [])
+
+    def test_join_code(self):
+        """Test the group owner and other members get their own cached topic list."""
+        for users in [(self.user1, self.user2), (self.user2, self.user1)]:
+            response_cache.invalidate([(Topic, self.group.id)])
+
+            for user in users * 2:
+                self.client.force_authenticate(user=user)
+                group = self.client.get(self.topics_url).data["results"][0]["group"]
+
+                self.assertEqual("join_code" in group, user == self.user1)
+
+    def test_topic_moved(self):
+        """Test moving a topic invalidates the list of its previous group."""
+        group2 = Group.objects.create(name="Group 2", description="Description", owner=self.user1)
+        topic = Topic.objects.get(pk=self.topic.pk)
+
+        def move():
+            topic.group = group2
+            topic.save()
+
+        self.assertChanges(self.topics_url, move, lambda results: results == [])
+
+    def test_user_scopes(self):
+        """Test user changes only invalidate lists of groups rendering the user."""
+        group2 = Group.objects.create(name="Group 2", description="Description", owner=self.user2)
+        self.client.get(self.topics_url)
+        self.client.get(self.comments_url)
+
+        user3 = User.objects.create(username="testuser3", password="testpassword")
+        group2.members.add(user3)
+        user3.first_name = "Renamed"
+        user3.save()
+
+        self.client.get(self.topics_url)
+        self.client.get(self.comments_url)
+
+        self.assertEqual(self.get_stats("topic.topic"), (1, 1))
+        self.assertEqual(self.get_stats("comment.comment"), (1, 1))
+
+        Comment.objects.create(user=user3, topic=self.topic, text="Reply")
+        self.user2.first_name = "Renamed"
+
+        self.assertChanges(
+            self.topics_url,
+            self.user2.save,
+            lambda results: {member["first_name"] for member in results[0]["group"]["members"]} == {"", "Renamed"},
+        )
+
+        user3.first_name = "Commenter"
+
+        self.assertChanges(
+            self.comments_url,
+            user3.save,
+            lambda results: {comment["user"]["first_name"] for comment in results} == {"Commenter", ""},
+        )
+
+    def test_missing_version(self):
+        """Test a version token evicted right after it was added is replaced by a new one."""
+        with mock.patch.object(response_cache.cache, "add"):
+            versions = response_cache.get_versions([(Topic, 0), (User, 0)])
+
+        self.assertEqual([len(version) for version in versions], [32, 32])
+
+    def test_login_keeps_cache(self):
+        """Test saving fields users are not rendered with keeps cached lists."""
+        self.client.get(self.comments_url)
+
+        self.user1.save(update_fields=["last_login"])
+        self.client.get(self.comments_url)
+
+        self.assertEqual(self.get_stats("comment.comment"), (1, 1))
+
+    def test_stats(self):
+        """Test statistics endpoint reports hit ratio per list."""
+        self.client.get(self.comments_url)
+        self.client.get(self.comments_url)
+
+        response = self.client.get("/api/response-cache/")
+
+        self.assertEqual(response.data["comment.comment"], {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+
+        self.client.delete("/api/response-cache/")
+
+        self.assertEqual(self.client.get("/api/response-cache/").data, {})
+
+        self.client.force_authenticate(user=self.user2)
+
+        self.assertEqual(self.client.get("/api/response-cache/").status_code, 403)
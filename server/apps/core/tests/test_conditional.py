@@ -0,0 +1,113 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from server.apps.comment.models import Comment, CommentActivity
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic
+
+User = get_user_model()
+
+
+class ConditionalTest(APITestCase):
+    """Test ETag and Last-Modified handling of list and retrieve endpoints."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user1 = User.objects.create(username="testuser1", password="testpassword")
+        self.user2 = User.objects.create(username="testuser2", password="testpassword")
+
+        self.group = Group.objects.create(name="Group", description="Description", owner=self.user1)
+        self.group.members.add(self.user2)
+        self.topic = Topic.objects.create(
+            title="Topic", description="Description", author=self.user1, group=self.group
+        )
+        self.comment = Comment.objects.create(user=self.user1, topic=self.topic, text="Hello")
+
+        self.client.force_authenticate(user=self.user1)
+
+    def assertNotModified(self, url: str, etag: str):
+        """Assert request with `etag` is answered with 304 without loading the objects"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse([query for query in queries if query["sql"].startswith('SELECT "comment_comment"."id"')])
+
+    def rename(self, user, first_name: str):
+        """Change name of user rendered in lists"""
+        user.first_name = first_name
+        user.save()
+
+    def test_list(self):
+        """Test unchanged list is answered with 304 and changes, deletions, votes and users change the ETag."""
+        url = f"/api/comments/?topic={self.topic.id}"
+
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+        self.assertNotModified(url, etag)
+
+        for change in [
+            lambda: CommentActivity.vote(self.user2, self.comment.id, True),
+            lambda: self.rename(self.user1, "Renamed"),
+            lambda: Comment.objects.create(user=self.user1, topic=self.topic, text="Hello again"),
+            lambda: self.comment.delete(),
+        ]:
+            change()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response["ETag"], etag)
+
+            etag = response["ETag"]
+
+    def test_list_without_users(self):
+        """Test user changes keep the ETag of lists not rendering users."""
+        url = f"/api/comments/?topic={self.topic.id}&fields=id,text,user"
+        etag = self.client.get(url)["ETag"]
+
+        self.rename(self.user1, "Renamed")
+
+        self.assertNotModified(url, etag)
+
+        url = f"/api/topics/?group={self.group.id}&expand=author"
+        etag = self.client.get(url)["ETag"]
+
+        self.rename(self.user1, "Renamed again")
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_variants(self):
+        """Test ETag differs between query strings and users."""
+        url = f"/api/topics/?group={self.group.id}"
+        etag = self.client.get(url)["ETag"]
+
+        self.assertNotEqual(self.client.get(f"{url}&fields=id")["ETag"], etag)
+
+        self.client.force_authenticate(user=self.user2)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_retrieve(self):
+        """Test unchanged object is answered with 304 until it or its expanded group changes."""
+        url = f"/api/topics/{self.topic.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.group.members.remove(self.user2)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_if_modified_since(self):
+        """Test Last-Modified is honoured without an ETag."""
+        url = f"/api/groups/{self.group.id}/"
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 1970 00:00:00 GMT").status_code, 200)
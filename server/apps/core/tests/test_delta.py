@@ -0,0 +1,231 @@
+import datetime
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from server.apps.comment.models import Comment
+from server.apps.core.models import Tombstone
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic, TopicActivity
+
+User = get_user_model()
+
+
+class DeltaTest(APITestCase):
+    """Test `?since=` delta mode of list endpoints."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user1 = User.objects.create(username="testuser1", password="testpassword")
+        self.user2 = User.objects.create(username="testuser2", password="testpassword")
+
+        self.group = Group.objects.create(name="Group", description="Description", owner=self.user1)
+        self.topic1 = Topic.objects.create(
+            title="Topic 1", description="Description", author=self.user1, group=self.group
+        )
+        self.topic2 = Topic.objects.create(
+            title="Topic 2", description="Description", author=self.user1, group=self.group
+        )
+
+        self.client.force_authenticate(user=self.user1)
+
+    def sync(self, url: str, params: dict):
+        """Get delta response data"""
+        response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, 200)
+
+        return response.data
+
+    def test_topics(self):
+        """Test updated topics and ids of deleted ones are returned after `since`."""
+        since = timezone.now()
+
+        self.topic1.title = "Updated"
+        self.topic1.save()
+        topic3 = Topic.objects.create(title="Topic 3", description="Description", author=self.user1, group=self.group)
+        topic2_id = self.topic2.id
+        self.topic2.delete()
+
+        data = self.sync("/api/topics/", {"group": self.group.id, "since": since.isoformat()})
+
+        self.assertEqual([topic["id"] for topic in data["results"]], [self.topic1.id, topic3.id])
+        self.assertEqual(data["deleted"], [topic2_id])
+        self.assertFalse(data["has_more"])
+
+        data = self.sync("/api/topics/", {"group": self.group.id, "since": data["since"]})
+
+        self.assertEqual((data["results"], data["deleted"]), ([], []))
+
+    def next_page(self, url: str, params: dict, data: dict) -> dict:
+        """Get delta response data of the page after `data`"""
+        return self.sync(url, {**params, "since": data["since"], "after": data["after"]})
+
+    def test_pages(self):
+        """Test a sync larger than the page size continues from the returned `since` and `after`."""
+        since = timezone.now()
+        topics = [
+            Topic.objects.create(title=f"Topic {i}", description="Description", author=self.user1, group=self.group)
+            for i in range(5)
+        ]
+        params = {"group": self.group.id, "page_size": 3}
+
+        data = self.sync("/api/topics/", {**params, "since": since.isoformat()})
+
+        self.assertEqual([topic["id"] for topic in data["results"]], [topic.id for topic in topics[:3]])
+        self.assertEqual(data["after"], f"object:{topics[2].id}")
+        self.assertTrue(data["has_more"])
+
+        data = self.next_page("/api/topics/", params, data)
+
+        self.assertEqual([topic["id"] for topic in data["results"]], [topic.id for topic in topics[3:]])
+        self.assertFalse(data["has_more"])
+
+        data = self.next_page("/api/topics/", params, data)
+
+        self.assertEqual((data["results"], data["deleted"], data["after"]), ([], [], f"object:{topics[4].id}"))
+
+    def test_pages_tied(self):
+        """Test pages of objects and tombstones sharing a timestamp are limited to the page size."""
+        since = timezone.now()
+        changed_at = since + datetime.timedelta(seconds=1)
+        topics = [
+            Topic.objects.create(title=f"Topic {i}", description="Description", author=self.user1, group=self.group)
+            for i in range(3)
+        ]
+        deleted_ids = [self.topic1.id, self.topic2.id]
+        self.topic1.delete()
+        self.topic2.delete()
+
+        Topic.objects.update(changed_at=changed_at)
+        Tombstone.objects.update(deleted_at=changed_at)
+
+        params = {"group": self.group.id, "page_size": 2}
+        pages = [self.sync("/api/topics/", {**params, "since": since.isoformat()})]
+
+        while pages[-1]["has_more"]:
+            pages.append(self.next_page("/api/topics/", params, pages[-1]))
+
+        self.assertEqual([len(page["results"]) + len(page["deleted"]) for page in pages], [2, 2, 1])
+        self.assertEqual([topic["id"] for page in pages for topic in page["results"]], [topic.id for topic in topics])
+        self.assertEqual([object_id for page in pages for object_id in page["deleted"]], deleted_ids)
+        self.assertEqual({page["since"] for page in pages}, {changed_at.isoformat().replace("+00:00", "Z")})
+
+    def test_comments(self):
+        """Test comments are synced per topic."""
+        since = timezone.now()
+
+        comment = Comment.objects.create(user=self.user1, topic=self.topic1, text="Hello")
+        Comment.objects.create(user=self.user1, topic=self.topic2, text="Other topic")
+        deleted = Comment.objects.create(user=self.user1, topic=self.topic1, text="Bye")
+        deleted_id = deleted.id
+        deleted.delete()
+
+        data = self.sync("/api/comments/", {"topic": self.topic1.id, "since": since.isoformat()})
+
+        self.assertEqual([comment["id"] for comment in data["results"]], [comment.id])
+        self.assertEqual(data["deleted"], [deleted_id])
+
+    def test_groups(self):
+        """Test joined groups are returned and groups left or deleted are reported to the member."""
+        group2 = Group.objects.create(name="Group 2", description="Description", owner=self.user2)
+        group3 = Group.objects.create(name="Group 3", description="Description", owner=self.user2)
+        group3.members.add(self.user1)
+
+        since = timezone.now()
+
+        group2.members.add(self.user1)
+        self.group.members.remove(self.user1)
+        group3_id = group3.id
+        group3.delete()
+
+        data = self.sync("/api/groups/", {"since": since.isoformat()})
+
+        self.assertEqual([group["id"] for group in data["results"]], [group2.id])
+        self.assertCountEqual(data["deleted"], [self.group.id, group3_id])
+
+        self.client.force_authenticate(user=self.user2)
+
+        self.assertEqual(self.sync("/api/groups/", {"since": since.isoformat()})["deleted"], [group3_id])
+
+    def test_votes(self):
+        """Test voted topics are synced without moving in the list order."""
+        updated_at = self.topic1.updated_at
+        since = timezone.now()
+
+        TopicActivity.vote(self.user1, self.topic1.id, True)
+
+        data = self.sync("/api/topics/", {"group": self.group.id, "since": since.isoformat()})
+
+        self.assertEqual([(topic["id"], topic["score"]) for topic in data["results"]], [(self.topic1.id, 1)])
+
+        self.topic1.refresh_from_db()
+        self.assertEqual(self.topic1.updated_at, updated_at)
+        self.assertEqual(
+            [topic["id"] for topic in self.sync("/api/topics/", {"group": self.group.id})["results"]],
+            [self.topic2.id, self.topic1.id],
+        )
+
+    def test_moved(self):
+        """Test an object moved to another scope is reported as deleted from the previous one."""
+        group2 = Group.objects.create(name="Group 2", description="Description", owner=self.user1)
+        group2.members.add(self.user1)
+        since = timezone.now()
+
+        topic = Topic.objects.get(pk=self.topic1.pk)
+        topic.group = group2
+        topic.save()
+        topic.title = "Updated"
+        topic.save()
+
+        data = self.sync("/api/topics/", {"group": self.group.id, "since": since.isoformat()})
+
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["deleted"], [self.topic1.id])
+
+        data = self.sync("/api/topics/", {"group": group2.id, "since": since.isoformat()})
+
+        self.assertEqual([topic["id"] for topic in data["results"]], [self.topic1.id])
+        self.assertEqual(data["deleted"], [])
+
+    @override_settings(TOMBSTONE_RETENTION=60 * 60)
+    def test_retention(self):
+        """Test tombstones older than the retention are pruned and syncs from before it rejected."""
+        self.topic2.delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - datetime.timedelta(hours=2))
+        self.topic1.delete()
+
+        stdout = io.StringIO()
+        call_command("prune_tombstones", batch_size=1, pause=0, stdout=stdout)
+
+        self.assertEqual(Tombstone.objects.count(), 1)
+        self.assertIn("Deleted 1 tombstones", stdout.getvalue())
+
+        since = timezone.now() - datetime.timedelta(hours=2)
+        response = self.client.get("/api/topics/", {"group": self.group.id, "since": since.isoformat()})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.data)
+
+    def test_invalid_since(self):
+        """Test invalid `since` is rejected and lists without it are unchanged."""
+        response = self.client.get("/api/topics/", {"group": self.group.id, "since": "yesterday"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.data)
+
+        response = self.client.get(
+            "/api/topics/", {"group": self.group.id, "since": timezone.now().isoformat(), "after": "topic:1"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("after", response.data)
+
+        response = self.client.get("/api/topics/", {"group": self.group.id})
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertNotIn("deleted", response.data)
@@ -19,7 +19,7 @@ class BaseModelTest(TransactionTestCase):
     )
 
     @classmethod
-    def setUpTestData(self) -> None:
+    def setUpClass(self) -> None:
         """Set up test."""
 
         with connection.schema_editor() as schema_editor:
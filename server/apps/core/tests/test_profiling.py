@@ -0,0 +1,84 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import modify_settings
+from rest_framework.test import APITestCase
+
+from server.apps.core.logic.profiling import profile_stats
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic
+
+User = get_user_model()
+
+
+@modify_settings(MIDDLEWARE={"prepend": "server.apps.core.middleware.ProfilingMiddleware"})
+class TestProfiling(APITestCase):
+    """Test ProfilingMiddleware and Profiling Endpoint."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+
+        self.user1 = User.objects.create(username="testuser1", password="testpassword", is_staff=True)
+        self.user2 = User.objects.create(username="testuser2", password="testpassword")
+
+        self.group = Group.objects.create(name="Test Group", description="Test Group Description", owner=self.user1)
+
+        Topic.objects.create(
+            title="Test Topic", description="Test Topic Description", author=self.user1, group=self.group
+        )
+
+        profile_stats.reset()
+
+    def test_server_timing_header(self):
+        """Test profiled responses carry Server-Timing header."""
+
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.get(f"/api/topics/?group={self.group.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(
+            response["Server-Timing"], r'^sql;dur=[\d.]+;desc="\d+ queries", serializer;dur=[\d.]+, total;dur='
+        )
+
+    async def test_async_server_timing_header(self):
+        """Test requests served through the async handler are profiled too."""
+
+        token = await sync_to_async(self.user1.get_tokens)()
+
+        response = await self.async_client.get(
+            f"/api/topics/?group={self.group.id}", AUTHORIZATION=f"Bearer {token['access']}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r'^sql;dur=[\d.]+;desc="[1-9]\d* queries"')
+        self.assertEqual(profile_stats.get()["TopicViewSet.list"]["count"], 1)
+
+    def test_profiling_endpoint(self):
+        """Test Profiling Endpoint aggregates timings per view and is staff only."""
+
+        self.client.force_authenticate(user=self.user1)
+
+        for _ in range(3):
+            self.client.get(f"/api/topics/?group={self.group.id}")
+
+        self.client.post(f"/api/topics/{self.group.topics.get().id}/vote/", {"activity": 1})
+
+        response = self.client.get("/api/profiling/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["TopicViewSet.list"]["count"], 3)
+        self.assertEqual(response.data["TopicViewSet.vote"]["count"], 1)
+        self.assertGreater(response.data["TopicViewSet.list"]["queries"]["p50"], 0)
+        self.assertGreater(response.data["TopicViewSet.list"]["serializer_time"]["p99"], 0)
+        self.assertEqual(set(response.data["TopicViewSet.list"]["wall_time"]), {"p50", "p95", "p99"})
+
+        response = self.client.delete("/api/profiling/")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertNotIn("TopicViewSet.list", profile_stats.get())
+
+        self.client.force_authenticate(user=self.user2)
+
+        response = self.client.get("/api/profiling/")
+
+        self.assertEqual(response.status_code, 403)
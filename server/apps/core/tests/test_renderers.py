@@ -0,0 +1,54 @@
+import datetime
+import decimal
+import io
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from server.apps.core.logic.parsers import FastJSONParser
+from server.apps.core.logic.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    """Test FastJSONRenderer and FastJSONParser."""
+
+    data = {
+        "id": 1,
+        "text": "Ünïcode text",
+        "score": decimal.Decimal("1.5"),
+        "items": [1, None, True],
+        "created_at": datetime.datetime(2023, 11, 21, 8, 6, tzinfo=datetime.timezone.utc),
+    }
+
+    def test_render(self):
+        """Test rendered JSON parses back to the same data."""
+        rendered = FastJSONRenderer().render(self.data)
+
+        parsed = FastJSONParser().parse(io.BytesIO(rendered))
+
+        self.assertEqual(parsed["text"], "Ünïcode text")
+        self.assertEqual(parsed["score"], 1.5)
+        self.assertEqual(parsed["items"], [1, None, True])
+        self.assertTrue(parsed["created_at"].startswith("2023-11-21T08:06:00"))
+
+    def test_render_matches_json_renderer(self):
+        """Test rendered serializer output is identical to JSONRenderer."""
+        data = {"id": 1, "text": "Ünïcode text", "nested": [{"a": 1.25}, {"b": None}]}
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_fallback(self):
+        """Test renderer and parser fall back to Django REST framework without orjson."""
+        with mock.patch("server.apps.core.logic.renderers.orjson", None):
+            self.assertEqual(FastJSONRenderer().render({"a": 1}), JSONRenderer().render({"a": 1}))
+
+        with mock.patch("server.apps.core.logic.parsers.orjson", None):
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(b'{"a": 1}')), {"a": 1})
+
+    def test_parse_error(self):
+        """Test invalid JSON raises ParseError."""
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"a": '))
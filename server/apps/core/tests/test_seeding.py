@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+
+from server.apps.comment.models import Comment, CommentActivity
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic, TopicActivity
+
+User = get_user_model()
+
+
+class SeedCampusTest(TestCase):
+    """Test seed_campus command."""
+
+    def setUp(self):
+        call_command(
+            "seed_campus",
+            users=20,
+            groups=4,
+            members=5,
+            topics=3,
+            comments=2,
+            votes=4,
+            batch_size=7,
+            stdout=StringIO(),
+        )
+
+    def test_counts(self):
+        """Test every requested row is created."""
+        self.assertEqual(User.objects.count(), 20)
+        self.assertEqual(Group.objects.count(), 4)
+        self.assertEqual(Group.members.through.objects.count(), 20)
+        self.assertEqual(Topic.objects.count(), 12)
+        self.assertEqual(Comment.objects.count(), 24)
+        self.assertEqual(TopicActivity.objects.count(), 48)
+        self.assertEqual(CommentActivity.objects.count(), 96)
+
+    def test_owner_is_member(self):
+        """Test every group owner is one of its members."""
+        for group in Group.objects.all():
+            self.assertTrue(group.has_member(group.owner))
+
+    def test_join_codes(self):
+        """Test join codes are set and unique."""
+        join_codes = list(Group.objects.values_list("join_code", flat=True))
+
+        self.assertEqual(len(set(join_codes)), 4)
+        self.assertTrue(all(len(join_code) == 8 for join_code in join_codes))
+
+    def test_scores(self):
+        """Test vote counters match the seeded votes."""
+        topics = Topic.objects.annotate(
+            up=Count("activities", filter=Q(activities__activity=True)),
+            down=Count("activities", filter=Q(activities__activity=False)),
+        )
+
+        for topic in topics:
+            self.assertEqual(
+                (topic.upvotes, topic.downvotes, topic.score), (topic.up, topic.down, topic.up - topic.down)
+            )
+
+    def test_login(self):
+        """Test seeded users can log in with the given password."""
+        user = User.objects.first()
+
+        self.assertTrue(user.check_password("password"))
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from .views import ProfilingView, ResponseCacheView
+
+app_name = "core"
+
+urlpatterns = [
+    path("profiling/", ProfilingView.as_view(), name="profiling"),
+    path("response-cache/", ResponseCacheView.as_view(), name="response-cache"),
+]
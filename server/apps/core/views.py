@@ -0,0 +1,59 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+
+from .logic.cache import response_cache
+from .logic.profiling import profile_stats
+
+
+class ProfilingView(generics.GenericAPIView):
+    """Request profiling statistics view."""
+
+    permission_classes = [permissions.IsAdminUser]
+    pagination_class = None
+
+    @swagger_auto_schema(
+        responses={
+            200: openapi.Response(
+                description="Request count and p50/p95/p99 of wall, SQL and serializer time (ms) and queries per view",
+                schema=openapi.Schema(type=openapi.TYPE_OBJECT),
+            ),
+        },
+    )
+    def get(self, request):
+        """Get profiling statistics of this process"""
+        return Response(profile_stats.get(), status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(responses={204: "Profiling statistics reset"})
+    def delete(self, request):
+        """Reset profiling statistics of this process"""
+        profile_stats.reset()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ResponseCacheView(generics.GenericAPIView):
+    """Response cache statistics view."""
+
+    permission_classes = [permissions.IsAdminUser]
+    pagination_class = None
+
+    @swagger_auto_schema(
+        responses={
+            200: openapi.Response(
+                description="Hits, misses and hit ratio of the response cache per list",
+                schema=openapi.Schema(type=openapi.TYPE_OBJECT),
+            ),
+        },
+    )
+    def get(self, request):
+        """Get response cache statistics of this process"""
+        return Response(response_cache.get_stats(), status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(responses={204: "Response cache statistics reset"})
+    def delete(self, request):
+        """Reset response cache statistics of this process"""
+        response_cache.reset_stats()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,6 +1,32 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
 
 class GroupConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.group"
+
+    def ready(self):
+        """Connect signal receivers"""
+        from .logic.signals import (
+            invalidate_deleted_group,
+            invalidate_group,
+            invalidate_members,
+            invalidate_user,
+            record_deleted_group,
+            record_membership_changes,
+            remember_members,
+        )
+
+        Group = self.get_model("Group")
+
+        m2m_changed.connect(invalidate_members, sender=Group.members.through)
+        m2m_changed.connect(record_membership_changes, sender=Group.members.through)
+        pre_delete.connect(remember_members, sender=Group)
+        post_delete.connect(invalidate_deleted_group, sender=Group)
+        post_delete.connect(record_deleted_group, sender=Group)
+        post_save.connect(invalidate_group, sender=Group)
+        post_delete.connect(invalidate_group, sender=Group)
+        post_save.connect(invalidate_user, sender=settings.AUTH_USER_MODEL)
+        post_delete.connect(invalidate_user, sender=settings.AUTH_USER_MODEL)
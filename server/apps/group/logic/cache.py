@@ -0,0 +1,87 @@
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class MembershipCache:
+    """
+    Cross-request cache of the set of group ids a user is a member of.
+
+    Entries are stored under a per-user version token, invalidation replaces the token instead of
+    deleting the entry, so a set loaded from the database before an invalidation can never be
+    written back under the current version.
+    """
+
+    key_prefix = "membership"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        """Get configured cache backend"""
+        return caches[getattr(settings, "MEMBERSHIP_CACHE_ALIAS", "default")]
+
+    @property
+    def timeout(self):
+        """Get configured timeout of cache entries in seconds"""
+        return getattr(settings, "MEMBERSHIP_CACHE_TIMEOUT", 60 * 60)
+
+    def get(self, user_id, load) -> frozenset:
+        """Get group ids of user, calling `load()` and caching the result on a miss"""
+
+        version_key = f"{self.key_prefix}:version:{user_id}"
+
+        self.cache.add(version_key, uuid.uuid4().hex, timeout=None)
+        version = self.cache.get(version_key)
+
+        group_ids = self.cache.get(f"{self.key_prefix}:{user_id}", version=version)
+
+        self.count(hit=group_ids is not None)
+
+        if group_ids is None:
+            group_ids = frozenset(load())
+            self.cache.set(f"{self.key_prefix}:{user_id}", group_ids, timeout=self.timeout, version=version)
+
+        return group_ids
+
+    def invalidate(self, user_ids) -> None:
+        """Invalidate cached group ids of users now and again once the current transaction commits"""
+
+        version_keys = [f"{self.key_prefix}:version:{user_id}" for user_id in user_ids]
+
+        if version_keys:
+            self.cache.delete_many(version_keys)
+            transaction.on_commit(lambda: self.cache.delete_many(version_keys))
+
+    def count(self, hit: bool) -> None:
+        """Count a cache hit or miss"""
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_stats(self) -> dict:
+        """Get hit and miss counters of this process"""
+        with self.lock:
+            total = self.hits + self.misses
+
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else None,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit and miss counters of this process"""
+        with self.lock:
+            self.hits = self.misses = 0
+
+
+membership_cache = MembershipCache()
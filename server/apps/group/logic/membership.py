@@ -0,0 +1,42 @@
+from ..models import Group
+from .cache import membership_cache
+from .signals import touch_groups
+
+
+def load_group_ids(user) -> frozenset:
+    """Load ids of groups the user is a member of, through the membership cache"""
+
+    memberships = Group.members.through.objects.filter(user_id=user.pk)
+
+    return membership_cache.get(user.pk, lambda: memberships.values_list("group_id", flat=True))
+
+
+def get_group_ids(request) -> frozenset:
+    """Get ids of groups the requesting user is a member of, loaded once per request"""
+
+    http_request = getattr(request, "_request", request)
+
+    if not hasattr(http_request, "_group_ids"):
+        user = request.user
+        http_request._group_ids = load_group_ids(user) if user.is_authenticated else frozenset()
+
+    return http_request._group_ids
+
+
+def is_member(request, group_id) -> bool:
+    """Check if the requesting user is a member of the group with `group_id`"""
+
+    try:
+        return int(group_id) in get_group_ids(request)
+    except (TypeError, ValueError):
+        return False
+
+
+def add_member(group_id, user_id) -> None:
+    """Insert membership, ignoring an existing one, without reading the member list first"""
+
+    Group.members.through.objects.bulk_create(
+        [Group.members.through(group_id=group_id, user_id=user_id)], ignore_conflicts=True
+    )
+    membership_cache.invalidate([user_id])
+    touch_groups([group_id])
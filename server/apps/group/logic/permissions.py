@@ -18,4 +18,4 @@ class GroupPermissions(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return request.user.is_authenticated
 
-        return request.user == obj.owner
+        return request.user.id == obj.owner_id
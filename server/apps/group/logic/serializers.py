@@ -1,11 +1,12 @@
 from rest_framework import serializers
 
+from server.apps.core.logic.sparse import SparseFieldsMixin
 from server.apps.user.logic.serializers import UserSerializer
 
 from ..models import Group
 
 
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Group model"""
 
     owner = serializers.HiddenField(default=serializers.CurrentUserDefault())
@@ -29,16 +30,19 @@ class GroupSerializer(serializers.ModelSerializer):
         """Convert instance to representation"""
         data = super().to_representation(instance)
 
-        data["owner"] = UserSerializer(instance.owner).data
+        self.represent(data, "owner", UserSerializer, lambda: instance.owner, instance.owner_id)
 
-        if self.context.get("request").user != instance.owner:
-            data.pop("join_code")
+        if self.context.get("request").user.id != instance.owner_id:
+            data.pop("join_code", None)
 
         return data
 
     def get_members(self, obj):
         """Get members"""
-        return UserSerializer(obj.members.all(), many=True).data
+        if not self.sparse.expands("members"):
+            return [member.id for member in obj.members.all()]
+
+        return UserSerializer(obj.members.all(), many=True, sparse=self.sparse.nested("members")).data
 
 
 class JoinSerializer(serializers.Serializer):
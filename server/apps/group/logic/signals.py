@@ -0,0 +1,91 @@
+from django.utils import timezone
+
+from server.apps.core.logic.cache import response_cache
+from server.apps.core.models import Tombstone
+
+from ..models import Group
+from .cache import membership_cache
+
+MEMBERSHIP_CHANGES = ("post_add", "post_remove", "post_clear")
+
+
+def get_changed_ids(instance, action, pk_set, cleared_attribute) -> list:
+    """Get ids on the other side of a membership change, cleared ones are remembered in `cleared_attribute`"""
+    return getattr(instance, cleared_attribute) if action == "post_clear" else pk_set
+
+
+def invalidate_members(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate cached group ids of users whose memberships changed"""
+
+    if action == "pre_clear" and not reverse:
+        instance._cleared_member_ids = list(instance.members.values_list("id", flat=True))
+    elif action in MEMBERSHIP_CHANGES:
+        user_ids = [instance.pk] if reverse else get_changed_ids(instance, action, pk_set, "_cleared_member_ids")
+        membership_cache.invalidate(user_ids)
+
+
+def remember_members(sender, instance, **kwargs):
+    """Remember members of a group about to be deleted"""
+    instance._deleted_member_ids = list(instance.members.values_list("id", flat=True))
+
+
+def invalidate_deleted_group(sender, instance, **kwargs):
+    """Invalidate cached group ids of members of a deleted group"""
+    membership_cache.invalidate(getattr(instance, "_deleted_member_ids", []))
+
+
+def invalidate_user(sender, instance, created=True, **kwargs):
+    """Invalidate cached group ids of a created or deleted user, whose id may be reused"""
+    if created:
+        membership_cache.invalidate([instance.pk])
+
+
+def touch_groups(group_ids) -> None:
+    """Bump `updated_at` of groups and invalidate lists rendering them, so members see membership changes"""
+    Group.objects.filter(id__in=group_ids).update(updated_at=timezone.now())
+    response_cache.invalidate([(Group, group_id) for group_id in group_ids])
+
+
+def record_membership_changes(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Bump groups whose members changed and record tombstones of groups users lost.
+
+    Cleared members of a group are remembered by `invalidate_members`, connected before.
+    """
+
+    if reverse and action == "pre_clear":
+        instance._cleared_group_ids = list(instance.belonged_groups.values_list("id", flat=True))
+    elif action in MEMBERSHIP_CHANGES:
+        record = record_user_membership_changes if reverse else record_group_membership_changes
+        record(instance, action, pk_set)
+
+
+def record_user_membership_changes(user, action, pk_set):
+    """Bump groups a user joined or left, recording tombstones of the groups left"""
+
+    group_ids = get_changed_ids(user, action, pk_set, "_cleared_group_ids")
+
+    if action != "post_add":
+        for group_id in group_ids:
+            Tombstone.record(Group, group_id, [user.pk])
+
+    touch_groups(group_ids)
+
+
+def record_group_membership_changes(group, action, pk_set):
+    """Bump a group whose members changed, recording tombstones of it for members who left"""
+
+    if action != "post_add":
+        Tombstone.record(Group, group.pk, get_changed_ids(group, action, pk_set, "_cleared_member_ids"))
+
+    touch_groups([group.pk])
+
+
+def record_deleted_group(sender, instance, **kwargs):
+    """Record tombstones of a deleted group for its members"""
+    Tombstone.record(sender, instance.pk, getattr(instance, "_deleted_member_ids", []))
+
+
+def invalidate_group(sender, instance, **kwargs):
+    """Invalidate cached lists rendering a saved or deleted group"""
+    response_cache.invalidate([(sender, instance.pk)])
@@ -0,0 +1,52 @@
+from rest_framework.throttling import UserRateThrottle
+
+
+class FailedJoinThrottle(UserRateThrottle):
+    """
+    Throttle join code guesses of a user.
+
+    Only failed attempts count towards the rate, they are recorded by the view with `record_failure`,
+    so members joining groups with valid codes are never throttled.
+    Attempts are counted per fixed window of the rate duration with atomic cache increments,
+    so concurrent failures of the same user are never lost.
+    """
+
+    scope = "join_failure"
+
+    def get_window_key(self, request, view) -> str:
+        """Get cache key of the failure counter of the current window"""
+        return f"{self.get_cache_key(request, view)}:{int(self.now // self.duration)}"
+
+    def allow_request(self, request, view):
+        """Allow request unless the user has used up the rate of failed attempts"""
+
+        if self.rate is None:
+            return True
+
+        self.now = self.timer()
+
+        if self.cache.get(self.get_window_key(request, view), 0) >= self.num_requests:
+            return self.throttle_failure()
+
+        return True
+
+    def wait(self):
+        """Get seconds until the current window ends"""
+        return self.duration - self.now % self.duration
+
+    def record_failure(self, request, view) -> None:
+        """Count a failed attempt of the requesting user"""
+
+        if self.rate is None:
+            return
+
+        self.now = self.timer()
+        key = self.get_window_key(request, view)
+
+        self.cache.add(key, 0, self.duration)
+
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # The counter expired between `add` and `incr`
+            self.cache.add(key, 1, self.duration)
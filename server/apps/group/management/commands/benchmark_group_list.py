@@ -0,0 +1,86 @@
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.crypto import get_random_string
+from rest_framework.test import APIClient
+
+from server.apps.group.logic.cache import membership_cache
+from server.apps.group.models import Group
+
+User = get_user_model()
+
+MODES = {
+    "full": "",
+    "names": "?fields=id,name",
+    "member ids": "?fields=id,name,members",
+    "members": "?fields=id,name&expand=members",
+}
+
+
+class Command(BaseCommand):
+    help = "Measure latency and query count of GET /api/groups/ as group sizes grow, inside a rolled back transaction"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Members per group")
+        parser.add_argument("--groups", type=int, default=20, help="Groups of the requesting user")
+        parser.add_argument("--repeat", type=int, default=10, help="Requests per measurement")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'members':>8} {'mode':>12} {'median ms':>10} {'queries':>8}")
+
+        with transaction.atomic():
+            user = User.objects.create(username=f"benchmark-{get_random_string(8)}")
+            others = User.objects.bulk_create(
+                User(username=f"benchmark-{get_random_string(12)}") for _ in range(max(options["sizes"]))
+            )
+
+            client = APIClient(HTTP_HOST="localhost")
+            client.force_authenticate(user=user)
+
+            for size in options["sizes"]:
+                Group.objects.filter(owner=user).delete()
+                self.seed(user, others[: size - 1], options["groups"])
+
+                for mode, query in MODES.items():
+                    latency, queries = self.measure(client, f"/api/groups/{query}", options["repeat"])
+                    self.stdout.write(f"{size:>8} {mode:>12} {latency:>10.2f} {queries:>8}")
+
+            transaction.set_rollback(True)
+
+        membership_cache.invalidate([user.pk])
+
+    def seed(self, owner, members, count: int) -> None:
+        """Create `count` groups owned by `owner` with `members` and the owner as members"""
+
+        groups = Group.objects.bulk_create(
+            Group(name=f"Group {i}", description="Benchmark group", owner=owner, join_code=get_random_string(8))
+            for i in range(count)
+        )
+
+        Group.members.through.objects.bulk_create(
+            Group.members.through(group_id=group.id, user_id=member.id)
+            for group in groups
+            for member in [owner, *members]
+        )
+
+        membership_cache.invalidate([owner.pk])
+
+    def measure(self, client, url: str, repeat: int):
+        """Get median latency in milliseconds and query count of `repeat` requests to `url`"""
+
+        timings = []
+
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            if response.status_code != 200:
+                raise CommandError(f"GET {url} answered {response.status_code}")
+
+        return statistics.median(timings), len(queries)
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("group", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(fields=["updated_at", "id"], name="group_updated_idx"),
+        ),
+    ]
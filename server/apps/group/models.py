@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils.crypto import get_random_string
 
 from server.apps.core.models import BaseModel
@@ -16,11 +16,16 @@ class Group(BaseModel):
     members = models.ManyToManyField(User, related_name="belonged_groups")
     join_code = models.CharField(max_length=8, unique=True)
 
+    join_code_attempts = 5
+
     class Meta:
         """Meta definition for Group."""
 
         verbose_name = "Group"
         verbose_name_plural = "Groups"
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="group_updated_idx"),
+        ]
 
     def __str__(self) -> str:
         """Unicode representation of Group."""
@@ -32,25 +37,39 @@ class Group(BaseModel):
         return self.members.filter(id=user.id).exists()
 
     def save(self, *args, **kwargs):
-        """Save instance"""
+        """Save instance, a new group is inserted together with the owner membership"""
 
         isNew = self.pk is None
 
-        if not self.join_code:
-            self.join_code = self.generate_join_code()
+        with transaction.atomic():
+            if self.join_code:
+                super().save(*args, **kwargs)
+            else:
+                self.save_with_join_code(*args, **kwargs)
 
-        super().save(*args, **kwargs)
+            if isNew:
+                self.members.add(self.owner)
 
-        if isNew:
-            self.members.add(self.owner)
+    def save_with_join_code(self, *args, **kwargs):
+        """Save instance with a random join code, drawing a new one when the unique constraint rejects it"""
 
-    @classmethod
-    def generate_join_code(self) -> str:
-        """Generate join code"""
+        for attempt in range(self.join_code_attempts):
+            self.join_code = self.generate_join_code()
 
-        join_code = get_random_string(length=8)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                if attempt + 1 == self.join_code_attempts or not self.is_join_code_taken(self.join_code):
+                    self.join_code = ""
+                    raise
 
-        while self.objects.filter(join_code=join_code).exists():
-            join_code = get_random_string(length=8)
+    @staticmethod
+    def generate_join_code() -> str:
+        """Generate join code"""
+        return get_random_string(length=8)
 
-        return join_code
+    @classmethod
+    def is_join_code_taken(cls, join_code: str) -> bool:
+        """Check if join code is used by a group, only after an insert failed"""
+        return cls.objects.filter(join_code=join_code).exists()
@@ -1,6 +1,14 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 
+from server.apps.group.logic.cache import membership_cache
+from server.apps.group.logic.throttling import FailedJoinThrottle
 from server.apps.group.models import Group
 
 User = get_user_model()
@@ -52,14 +60,14 @@ class TestGroupEndpoints(APITestCase):
         response = self.client.get("/api/groups/")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
         self.client.force_authenticate(user=self.user2)
 
         response = self.client.get("/api/groups/")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
     def test_group_create(self):
         """Test Group Create Endpoint."""
@@ -145,9 +153,149 @@ class TestGroupEndpoints(APITestCase):
         response = self.client.get(f"/api/groups/join/?join_code={self.group1.join_code}")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data["detail"], "Joined group")
+        self.assertEqual(response.data["id"], self.group1.id)
+        self.assertIn(self.user3.id, [member["id"] for member in response.data["members"]])
+        self.assertNotIn("join_code", response.data)
+        self.assertTrue(self.group1.has_member(self.user3))
 
         response = self.client.get("/api/groups/join/?join_code=invalidjoincode")
 
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.data["detail"], "Group not found")
+
+    def test_group_join_member(self):
+        """Test Group Join Endpoint writes nothing for an existing member."""
+
+        self.client.force_authenticate(user=self.user1)
+        self.client.get(f"/api/groups/{self.group1.id}/")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/api/groups/join/?join_code={self.group1.join_code}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["join_code"], self.group1.join_code)
+        self.assertFalse(any(query["sql"].startswith("INSERT") for query in queries))
+        self.assertFalse(any("ORDER BY" in query["sql"] and "join_code" in query["sql"] for query in queries))
+
+    def test_group_join_throttle(self):
+        """Test Group Join Endpoint rate limits failed join code guesses only."""
+
+        cache.clear()
+        self.client.force_authenticate(user=self.user3)
+
+        with mock.patch.dict(FailedJoinThrottle.THROTTLE_RATES, {"join_failure": "2/hour"}):
+            for _ in range(2):
+                response = self.client.get("/api/groups/join/?join_code=invalid")
+                self.assertEqual(response.status_code, 404)
+
+            response = self.client.get("/api/groups/join/?join_code=invalid")
+            self.assertEqual(response.status_code, 429)
+
+            response = self.client.get(f"/api/groups/join/?join_code={self.group1.join_code}")
+            self.assertEqual(response.status_code, 429)
+
+            self.client.force_authenticate(user=self.user2)
+
+            response = self.client.get(f"/api/groups/join/?join_code={self.group1.join_code}")
+            self.assertEqual(response.status_code, 200)
+
+    def test_group_join_throttle_window(self):
+        """Test failed join attempts are counted atomically per window and reset with the next window."""
+
+        cache.clear()
+
+        request = RequestFactory().get("/api/groups/join/?join_code=invalid")
+        request.user = self.user3
+
+        with mock.patch.dict(FailedJoinThrottle.THROTTLE_RATES, {"join_failure": "3/hour"}):
+            throttle = FailedJoinThrottle()
+            throttle.timer = lambda: 7200.0
+
+            for _ in range(3):
+                throttle.record_failure(request, None)
+
+            self.assertEqual(cache.get(throttle.get_window_key(request, None)), 3)
+            self.assertFalse(throttle.allow_request(request, None))
+            self.assertEqual(throttle.wait(), 3600)
+
+            throttle.timer = lambda: 10800.0
+
+            self.assertTrue(throttle.allow_request(request, None))
+
+    def test_group_membership_cache(self):
+        """Test cached group memberships are invalidated when memberships change."""
+
+        membership_cache.reset_stats()
+
+        self.client.force_authenticate(user=self.user3)
+
+        response = self.client.get(f"/api/topics/?group={self.group1.id}")
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.get(f"/api/groups/join/?join_code={self.group1.join_code}")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f"/api/topics/?group={self.group1.id}")
+        self.assertEqual(response.status_code, 200)
+
+        self.group1.members.remove(self.user3)
+
+        response = self.client.get(f"/api/topics/?group={self.group1.id}")
+        self.assertEqual(response.status_code, 403)
+
+        self.user3.belonged_groups.add(self.group1)
+        response = self.client.get(f"/api/topics/?group={self.group1.id}")
+        response = self.client.get(f"/api/topics/?group={self.group1.id}")
+        self.assertEqual(response.status_code, 200)
+
+        group_id = self.group1.id
+        self.group1.delete()
+
+        response = self.client.get(f"/api/topics/?group={group_id}")
+        self.assertEqual(response.status_code, 403)
+
+        self.assertEqual(membership_cache.get_stats()["hits"], 2)
+        self.assertEqual(membership_cache.get_stats()["misses"], 5)
+
+        response = self.client.get("/api/groups/membership-cache/")
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.get("/api/groups/membership-cache/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["hits"], 2)
+
+    def test_group_list_sparse_fields(self):
+        """Test Group List Endpoint renders and loads only requested fields."""
+
+        self.client.force_authenticate(user=self.user2)
+
+        response = self.client.get("/api/groups/?fields=id,name")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([set(group) for group in response.data["results"]], [{"id", "name"}] * 2)
+
+        response = self.client.get(f"/api/groups/{self.group1.id}/?expand=members&fields=id,members.username")
+
+        self.assertEqual(sorted(member["username"] for member in response.data["members"]), ["testuser1", "testuser2"])
+        self.assertEqual(set(response.data["members"][0]), {"username"})
+        self.assertNotIn("owner", response.data)
+
+        response = self.client.get(f"/api/groups/{self.group1.id}/?expand=owner")
+
+        self.assertEqual(response.data["owner"]["id"], self.user1.id)
+        self.assertEqual(sorted(response.data["members"]), [self.user1.id, self.user2.id])
+
+        with CaptureQueriesContext(connection) as few_members:
+            self.client.get("/api/groups/?fields=id,name")
+
+        for i in range(10):
+            self.group1.members.add(User.objects.create(username=f"member{i}", password="testpassword"))
+
+        with CaptureQueriesContext(connection) as many_members:
+            response = self.client.get("/api/groups/?fields=id,name")
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(len(many_members.captured_queries), len(few_members.captured_queries))
+        self.assertFalse([query for query in many_members if "user_user" in query["sql"]])
@@ -1,6 +1,10 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.db.utils import IntegrityError
 from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
 from ..models import Group
 
@@ -104,3 +108,30 @@ class GroupModelTest(TransactionTestCase):
                 owner=self.user2,
                 join_code="123456",
             )
+
+    def test_group_join_code_generated(self):
+        """Test Group join code is generated without checking it first."""
+        with CaptureQueriesContext(connection) as queries:
+            group = Group.objects.create(name="Test Group 2", description="Description", owner=self.user2)
+
+        self.assertEqual(len(group.join_code), 8)
+        self.assertTrue(group.has_member(self.user2))
+        self.assertFalse(any("SELECT" in query["sql"] and "join_code" in query["sql"] for query in queries))
+
+    def test_group_join_code_collision(self):
+        """Test Group join code is drawn again when it is taken."""
+        with mock.patch.object(Group, "generate_join_code", side_effect=["123456", "abcdefgh"]):
+            group = Group.objects.create(name="Test Group 2", description="Description", owner=self.user2)
+
+        self.assertEqual(group.join_code, "abcdefgh")
+        self.assertEqual(Group.objects.count(), 2)
+        self.assertEqual(group.members.count(), 1)
+
+    def test_group_join_code_attempts(self):
+        """Test Group creation fails once every join code attempt is taken."""
+        with mock.patch.object(Group, "generate_join_code", return_value="123456"):
+            with self.assertRaises(IntegrityError):
+                Group.objects.create(name="Test Group 2", description="Description", owner=self.user2)
+
+        self.assertEqual(Group.objects.count(), 1)
+        self.assertEqual(self.user2.belonged_groups.count(), 0)
@@ -1,40 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import viewsets
-from rest_framework.response import Response
+from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from server.apps.core.logic.conditional import ConditionalMixin
+from server.apps.core.logic.delta import DeltaMixin
+from server.apps.core.logic.sparse import SparseFields
 
+from .logic.cache import membership_cache
+from .logic.membership import add_member, get_group_ids, is_member
 from .logic.permissions import GroupPermissions
 from .logic.serializers import GroupSerializer, JoinSerializer
+from .logic.throttling import FailedJoinThrottle
 from .models import Group
 
+User = get_user_model()
 
-class GroupViewSet(viewsets.ModelViewSet):
+
+class GroupViewSet(DeltaMixin, ConditionalMixin, viewsets.ModelViewSet):
     """ViewSet for Group model"""
 
     model = Group
     queryset = Group.objects.all()
+    user_relations = ("owner", "members")
 
     serializer_class = GroupSerializer
 
     permission_classes = [GroupPermissions]
 
     def get_queryset(self):
-        """Return queryset for current user"""
-        if self.request.user.is_authenticated:
-            return self.queryset.filter(members__in=[self.request.user])
-        return self.queryset.none()
+        """Return groups of current user, loading only the relations the client asked for"""
+        if not self.request.user.is_authenticated:
+            return self.queryset.none()
+
+        queryset = self.queryset.filter(id__in=get_group_ids(self.request))
+        sparse = SparseFields.from_request(self.request)
+
+        if sparse.wants("owner") and sparse.expands("owner"):
+            queryset = queryset.select_related("owner")
 
-    @swagger_auto_schema(methods=["get"], operation_id="Join group", query_serializer=JoinSerializer)
-    @action(detail=False, methods=["get"])
+        if sparse.wants("members"):
+            members = User.objects.all() if sparse.expands("members") else User.objects.only("id")
+            queryset = queryset.prefetch_related(Prefetch("members", queryset=members))
+
+        return queryset
+
+    def get_user_scopes(self, instance=None) -> list:
+        """Groups render their owner and members"""
+        group_ids = [instance.id] if instance else sorted(get_group_ids(self.request))
+
+        return [(User, group_id) for group_id in group_ids]
+
+    def get_delta_scope(self):
+        """Groups a user lost are recorded with the user id as scope"""
+        return self.request.user.id
+
+    @swagger_auto_schema(
+        methods=["get"],
+        operation_id="Join group",
+        query_serializer=JoinSerializer,
+        responses={200: GroupSerializer},
+    )
+    @action(detail=False, methods=["get"], throttle_classes=[FailedJoinThrottle])
     def join(self, request):
-        """Join group with join_code"""
+        """Join group with join_code and return it, failed attempts are rate limited"""
         serializer = JoinSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
 
-        group = Group.objects.filter(join_code=serializer.validated_data["join_code"]).first()
+        try:
+            group = Group.objects.get(join_code=serializer.validated_data["join_code"])
+        except Group.DoesNotExist:
+            FailedJoinThrottle().record_failure(request, self)
+            return Response({"detail": "Group not found"}, status=404)
+
+        if not is_member(request, group.id):
+            add_member(group.id, request.user.id)
 
-        if group:
-            group.members.add(request.user)
-            return Response({"detail": "Joined group"}, status=200)
+        return Response(self.get_serializer(group).data, status=200)
 
-        return Response({"detail": "Group not found"}, status=404)
+    @action(detail=False, methods=["get"], url_path="membership-cache", permission_classes=[permissions.IsAdminUser])
+    def membership_cache(self, request):
+        """Get hit and miss counters of the group membership cache of this process"""
+        return Response(membership_cache.get_stats(), status=200)
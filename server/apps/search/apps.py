@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "server.apps.search"
+
+    def ready(self):
+        """Connect signal receivers keeping the search index up to date"""
+        from server.apps.comment.models import Comment
+        from server.apps.topic.models import Topic
+
+        from .logic.index import remove_from_index, update_index
+
+        for model in (Topic, Comment):
+            post_save.connect(update_index, sender=model, dispatch_uid=f"search_update_{model.__name__}")
+            post_delete.connect(remove_from_index, sender=model, dispatch_uid=f"search_remove_{model.__name__}")
@@ -0,0 +1,270 @@
+import html
+import re
+from collections import namedtuple
+from functools import reduce
+from operator import and_
+
+from django.db import connection
+from django.db.models import Q, Value
+
+from server.apps.comment.models import Comment
+from server.apps.topic.models import Topic
+
+KINDS = ("topic", "comment")
+
+# Searchable text of a topic or comment, `topic_id` is the topic itself for topics
+Document = namedtuple("Document", "kind id topic_id group_id title body")
+
+# Search result, `snippet` is the matching part of the text as escaped HTML with terms wrapped in <mark> tags
+Hit = namedtuple("Hit", "kind id topic_id snippet")
+
+# Control characters the full-text index wraps matched terms in, replaced by <mark> tags after escaping
+MARK_START, MARK_END = "\x02", "\x03"
+
+
+def get_terms(query: str) -> list:
+    """Split search query into words, dropping operators and punctuation"""
+    return re.findall(r"\w+", query)
+
+
+def mark_snippet(snippet: str) -> str:
+    """Escape snippet of user text as HTML, turning `MARK_START` and `MARK_END` into <mark> tags"""
+    return html.escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+class SearchBackend:
+    """
+    Base class of search backends.
+
+    Backends keep an index of `Document`s up to date through `index` and `remove`, called when topics
+    and comments are saved and deleted, and answer `search` restricted to topics of the given groups.
+    """
+
+    def index(self, documents: list) -> None:
+        """Add or replace documents in the index"""
+        raise NotImplementedError
+
+    def remove(self, kind: str, ids: list) -> None:
+        """Remove documents of `kind` with `ids` from the index"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every document from the index"""
+        raise NotImplementedError
+
+    def rebuild(self, batch_size: int = 1000, log=None) -> None:
+        """Index every topic and comment again, in batches of primary keys"""
+
+        self.clear()
+
+        for kind, documents in (
+            ("topic", Topic.objects.values_list("id", "id", "group_id", "title", "description")),
+            ("comment", Comment.objects.values_list("id", "topic_id", "topic__group_id", Value(""), "text")),
+        ):
+            documents = documents.order_by("pk")
+            last_pk, count = 0, 0
+
+            while batch := list(documents.filter(pk__gt=last_pk)[:batch_size]):
+                self.index([Document(kind, *row) for row in batch])
+                last_pk, count = batch[-1][0], count + len(batch)
+
+            if log:
+                log(f"Indexed {count} {kind}s")
+
+    def search(self, query: str, group_ids, kinds=KINDS, limit: int = 20) -> list:
+        """Get best matching hits in topics of `group_ids`"""
+        raise NotImplementedError
+
+
+class DatabaseSearchBackend(SearchBackend):
+    """
+    Search backend querying the topic and comment tables with `icontains`, for any database.
+
+    There is no separate index to maintain, but every search scans the tables of the user's groups,
+    use a full-text backend for large datasets.
+    """
+
+    def index(self, documents: list) -> None:
+        """Nothing to do, the tables are the index"""
+
+    def remove(self, kind: str, ids: list) -> None:
+        """Nothing to do, the tables are the index"""
+
+    def clear(self) -> None:
+        """Nothing to do, the tables are the index"""
+
+    def rebuild(self, batch_size: int = 1000, log=None) -> None:
+        """Nothing to do, the tables are the index"""
+
+    def search(self, query: str, group_ids, kinds=KINDS, limit: int = 20) -> list:
+        """Get most recently updated topics and comments containing every term"""
+
+        terms = get_terms(query)
+
+        if not terms or not group_ids:
+            return []
+
+        hits = []
+
+        if "topic" in kinds:
+            topics = Topic.objects.filter(
+                reduce(and_, (Q(title__icontains=term) | Q(description__icontains=term) for term in terms)),
+                group_id__in=group_ids,
+            ).order_by("-updated_at", "-id")[:limit]
+
+            hits += [
+                (topic.updated_at, Hit("topic", topic.id, topic.id, html.escape(topic.title))) for topic in topics
+            ]
+
+        if "comment" in kinds:
+            comments = Comment.objects.filter(
+                reduce(and_, (Q(text__icontains=term) for term in terms)),
+                topic__group_id__in=group_ids,
+            ).order_by("-updated_at", "-id")[:limit]
+
+            hits += [
+                (comment.updated_at, Hit("comment", comment.id, comment.topic_id, html.escape(comment.text)))
+                for comment in comments
+            ]
+
+        return [hit for _, hit in sorted(hits, key=lambda hit: hit[0], reverse=True)[:limit]]
+
+
+class FTS5SearchBackend(SearchBackend):
+    """
+    Search backend on an SQLite FTS5 table, ranked by BM25.
+
+    Topics and comments share the `search_index` table, the kind is encoded in the rowid
+    (`id * 2 + kind`) so documents are replaced and removed by rowid without scanning. The group of
+    every document is indexed as a `g<id>` token of the `scope` column, so the user's groups are part
+    of the full-text query and only matches in those groups are ranked.
+    """
+
+    table = "search_index"
+
+    @classmethod
+    def fill_table(cls, execute, start: int = None, stop: int = None) -> None:
+        """Index topics and comments with primary keys in `[start, stop)` with `INSERT ... SELECT`"""
+
+        topics = Topic._meta.db_table
+        comments = Comment._meta.db_table
+        where = "WHERE %s <= {table}.id AND {table}.id < %s" if start is not None else ""
+        params = [start, stop] if start is not None else []
+
+        execute(
+            f"INSERT INTO {cls.table} (rowid, title, body, scope, topic_id) "
+            f"SELECT id * 2, title, description, 'g' || group_id, id FROM {topics} {where.format(table=topics)}",
+            params,
+        )
+        execute(
+            f"INSERT INTO {cls.table} (rowid, title, body, scope, topic_id) "
+            f"SELECT {comments}.id * 2 + 1, '', {comments}.text, 'g' || {topics}.group_id, {comments}.topic_id "
+            f"FROM {comments} INNER JOIN {topics} ON {topics}.id = {comments}.topic_id {where.format(table=comments)}",
+            params,
+        )
+
+    @staticmethod
+    def get_rowid(kind: str, pk: int) -> int:
+        """Get rowid of document"""
+        return pk * 2 + KINDS.index(kind)
+
+    def index(self, documents: list) -> None:
+        """Replace documents by rowid, moving comments of topics that changed group"""
+
+        rows = [
+            (self.get_rowid(doc.kind, doc.id), doc.title, doc.body, f"g{doc.group_id}", doc.topic_id)
+            for doc in documents
+        ]
+
+        with connection.cursor() as cursor:
+            moved = self.get_moved_topics(cursor, [doc for doc in documents if doc.kind == "topic"])
+
+            cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [row[:1] for row in rows])
+            cursor.executemany(
+                f"INSERT INTO {self.table} (rowid, title, body, scope, topic_id) VALUES (%s, %s, %s, %s, %s)",
+                rows,
+            )
+
+            for topic_id, group_id in moved.items():
+                comment_ids = Comment.objects.filter(topic_id=topic_id).values_list("id", flat=True)
+                cursor.executemany(
+                    f"UPDATE {self.table} SET scope = %s WHERE rowid = %s",
+                    [(f"g{group_id}", self.get_rowid("comment", pk)) for pk in comment_ids],
+                )
+
+    def get_moved_topics(self, cursor, documents: list) -> dict:
+        """Get new group id of indexed topics whose group changed"""
+
+        if not documents:
+            return {}
+
+        groups = {self.get_rowid("topic", doc.id): f"g{doc.group_id}" for doc in documents}
+
+        cursor.execute(
+            f"SELECT rowid, scope FROM {self.table} WHERE rowid IN ({', '.join(['%s'] * len(groups))})",
+            list(groups),
+        )
+
+        return {rowid // 2: groups[rowid][1:] for rowid, scope in cursor.fetchall() if scope != groups[rowid]}
+
+    def remove(self, kind: str, ids: list) -> None:
+        """Delete documents by rowid"""
+
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {self.table} WHERE rowid = %s", [(self.get_rowid(kind, pk),) for pk in ids]
+            )
+
+    def clear(self) -> None:
+        """Delete every document"""
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+
+    def rebuild(self, batch_size: int = 1000, log=None) -> None:
+        """Index every topic and comment again with `INSERT ... SELECT` over ranges of primary keys"""
+
+        self.clear()
+
+        last_pk = max(
+            Topic.objects.order_by("-pk").values_list("pk", flat=True).first() or 0,
+            Comment.objects.order_by("-pk").values_list("pk", flat=True).first() or 0,
+        )
+
+        with connection.cursor() as cursor:
+            for start in range(0, last_pk + 1, batch_size):
+                self.fill_table(cursor.execute, start, start + batch_size)
+
+        if log:
+            log(f"Indexed topics and comments up to id {last_pk}")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.table} ({self.table}) VALUES ('optimize')")
+
+    def search(self, query: str, group_ids, kinds=KINDS, limit: int = 20) -> list:
+        """Get best ranked documents in the groups matching every term, the last one as a prefix"""
+
+        terms = get_terms(query)
+
+        if not terms or not group_ids or not kinds:
+            return []
+
+        terms = " ".join(f'"{term}"' for term in terms) + "*"
+        scope = " OR ".join(f'"g{group_id}"' for group_id in group_ids)
+        kind_codes = [KINDS.index(kind) for kind in kinds]
+
+        sql = f"""
+            SELECT rowid, topic_id, snippet({self.table}, -1, '{MARK_START}', '{MARK_END}', '…', 16)
+            FROM {self.table}
+            WHERE {self.table} MATCH %s AND rowid %% 2 IN ({", ".join(["%s"] * len(kind_codes))})
+            ORDER BY rank
+            LIMIT %s
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [f"{{title body}} : ({terms}) AND scope : ({scope})", *kind_codes, limit])
+            rows = cursor.fetchall()
+
+        return [
+            Hit(KINDS[rowid % 2], rowid // 2, topic_id, mark_snippet(snippet)) for rowid, topic_id, snippet in rows
+        ]
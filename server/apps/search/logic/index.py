@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from server.apps.topic.models import Topic
+
+from .backends import Document
+
+
+def get_backend():
+    """Get instance of the backend configured by `SEARCH_BACKEND`"""
+    return import_string(settings.SEARCH_BACKEND)()
+
+
+def get_document(instance) -> Document:
+    """Get searchable text of a topic or comment"""
+
+    if isinstance(instance, Topic):
+        return Document("topic", instance.id, instance.id, instance.group_id, instance.title, instance.description)
+
+    return Document("comment", instance.id, instance.topic_id, instance.topic.group_id, "", instance.text)
+
+
+def update_index(sender, instance, raw=False, **kwargs):
+    """Index saved topic or comment, in the transaction of the save"""
+    if not raw:
+        get_backend().index([get_document(instance)])
+
+
+def remove_from_index(sender, instance, **kwargs):
+    """Remove deleted topic or comment from the index"""
+    get_backend().remove("topic" if isinstance(instance, Topic) else "comment", [instance.id])
+
+
+def reindex(batch_size: int = 1000, log=None) -> None:
+    """Rebuild the whole index from the topic and comment tables"""
+    get_backend().rebuild(batch_size, log)
@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from .backends import KINDS
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """Serializer for search query parameters"""
+
+    q = serializers.CharField(required=True)
+    type = serializers.ChoiceField(choices=KINDS, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+class SearchHitSerializer(serializers.Serializer):
+    """Serializer for search hit"""
+
+    type = serializers.CharField(source="kind")
+    id = serializers.IntegerField()
+    topic = serializers.IntegerField(source="topic_id")
+    snippet = serializers.CharField()
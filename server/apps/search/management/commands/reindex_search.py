@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from server.apps.search.logic.index import reindex
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search index of topics and comments, e.g. after loading data without signals"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of objects indexed per batch")
+
+    def handle(self, *args, **options):
+        reindex(options["batch_size"], log=self.stdout.write)
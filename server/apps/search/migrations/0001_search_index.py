@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """Create and fill the FTS5 table on SQLite, other databases use a backend without a table"""
+
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    topics = apps.get_model("topic", "Topic")._meta.db_table
+    comments = apps.get_model("comment", "Comment")._meta.db_table
+
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index "
+        "USING fts5(title, body, scope, topic_id UNINDEXED, tokenize='unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO search_index (rowid, title, body, scope, topic_id) "
+        f"SELECT id * 2, title, description, 'g' || group_id, id FROM {topics}"
+    )
+    schema_editor.execute(
+        "INSERT INTO search_index (rowid, title, body, scope, topic_id) "
+        f"SELECT {comments}.id * 2 + 1, '', {comments}.text, 'g' || {topics}.group_id, {comments}.topic_id "
+        f"FROM {comments} INNER JOIN {topics} ON {topics}.id = {comments}.topic_id"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the FTS5 table"""
+
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS search_index")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("topic", "0005_topicactivity_unique_user"),
+        ("comment", "0005_commentactivity_unique_user"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
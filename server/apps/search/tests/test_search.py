@@ -0,0 +1,146 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from server.apps.comment.models import Comment
+from server.apps.group.models import Group
+from server.apps.search.logic.backends import FTS5SearchBackend
+from server.apps.topic.models import Topic
+
+User = get_user_model()
+
+
+class SearchTest(APITestCase):
+    """Test search endpoint and index updates."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user1 = User.objects.create(username="testuser1", password="testpassword")
+        self.user2 = User.objects.create(username="testuser2", password="testpassword")
+
+        self.group1 = Group.objects.create(name="Group 1", description="Description", owner=self.user1)
+        self.group2 = Group.objects.create(name="Group 2", description="Description", owner=self.user2)
+
+        self.topic1 = Topic.objects.create(
+            title="Linear algebra exam", description="Eigenvalues recap", author=self.user1, group=self.group1
+        )
+        self.topic2 = Topic.objects.create(
+            title="Algebra party", description="Secret", author=self.user2, group=self.group2
+        )
+        self.comment1 = Comment.objects.create(
+            text="Bring a calculator to the exam", user=self.user1, topic=self.topic1
+        )
+
+        self.client.force_authenticate(user=self.user1)
+
+    def search(self, query: str):
+        """Get hits of query as (type, id) pairs"""
+        response = self.client.get("/api/search/", query)
+
+        self.assertEqual(response.status_code, 200)
+
+        return [(hit["type"], hit["id"]) for hit in response.data["results"]]
+
+    def test_search(self):
+        """Test topics and comments of the user's groups are found."""
+        self.assertCountEqual(self.search({"q": "exam"}), [("topic", self.topic1.id), ("comment", self.comment1.id)])
+        self.assertEqual(self.search({"q": "eigenvalues"}), [("topic", self.topic1.id)])
+        self.assertEqual(self.search({"q": "calcul"}), [("comment", self.comment1.id)])
+        self.assertEqual(self.search({"q": "exam", "type": "comment"}), [("comment", self.comment1.id)])
+
+    def test_search_hit(self):
+        """Test hit contains topic and highlighted snippet."""
+        response = self.client.get("/api/search/", {"q": "calculator"})
+
+        self.assertEqual(
+            response.data["results"][0],
+            {
+                "type": "comment",
+                "id": self.comment1.id,
+                "topic": self.topic1.id,
+                "snippet": "Bring a <mark>calculator</mark> to the exam",
+            },
+        )
+
+        response = self.client.get("/api/search/", {"q": "linear"})
+
+        self.assertEqual(response.data["results"][0]["snippet"], "<mark>Linear</mark> algebra exam")
+
+    def test_search_escaped(self):
+        """Test snippets escape HTML of the text around highlighted terms."""
+        Comment.objects.create(text="<script>alert('exam')</script> notes", user=self.user1, topic=self.topic1)
+
+        response = self.client.get("/api/search/", {"q": "notes"})
+
+        self.assertEqual(
+            response.data["results"][0]["snippet"],
+            "&lt;script&gt;alert(&#x27;exam&#x27;)&lt;/script&gt; <mark>notes</mark>",
+        )
+
+    def test_search_scope(self):
+        """Test topics of other groups are not found."""
+        self.assertEqual(self.search({"q": "algebra"}), [("topic", self.topic1.id)])
+        self.assertEqual(self.search({"q": "secret"}), [])
+
+    def test_search_query(self):
+        """Test query operators are treated as words and invalid parameters are rejected."""
+        self.assertEqual(self.search({"q": 'exam" OR NOT (party'}), [])
+        self.assertEqual(self.search({"q": "***"}), [])
+
+        self.assertEqual(self.client.get("/api/search/").status_code, 400)
+        self.assertEqual(self.client.get("/api/search/", {"q": "exam", "type": "user"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/search/", {"q": "exam", "limit": 1000}).status_code, 400)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get("/api/search/", {"q": "exam"}).status_code, 401)
+
+    def test_index_update(self):
+        """Test index follows saved and deleted topics and comments."""
+        self.comment1.text = "Bring a pencil"
+        self.comment1.save()
+
+        self.assertEqual(self.search({"q": "calculator"}), [])
+        self.assertEqual(self.search({"q": "pencil"}), [("comment", self.comment1.id)])
+
+        self.topic1.delete()
+
+        self.assertEqual(self.search({"q": "exam"}), [])
+        self.assertEqual(self.search({"q": "pencil"}), [])
+
+    def test_index_topic_moved(self):
+        """Test topic and its comments follow the topic to another group."""
+        self.topic1.group = self.group2
+        self.topic1.save()
+
+        self.assertEqual(self.search({"q": "exam"}), [])
+
+        self.client.force_authenticate(user=self.user2)
+
+        self.assertCountEqual(self.search({"q": "exam"}), [("topic", self.topic1.id), ("comment", self.comment1.id)])
+
+    def test_reindex(self):
+        """Test reindex command rebuilds the index from the tables."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS5SearchBackend.table}")
+
+        self.assertEqual(self.search({"q": "exam"}), [])
+
+        call_command("reindex_search", batch_size=1, stdout=StringIO())
+
+        self.assertCountEqual(self.search({"q": "exam"}), [("topic", self.topic1.id), ("comment", self.comment1.id)])
+
+    @override_settings(SEARCH_BACKEND="server.apps.search.logic.backends.DatabaseSearchBackend")
+    def test_database_backend(self):
+        """Test search without full-text index."""
+        self.assertEqual(self.search({"q": "exam"}), [("comment", self.comment1.id), ("topic", self.topic1.id)])
+        self.assertEqual(self.search({"q": "algebra"}), [("topic", self.topic1.id)])
+        self.assertEqual(self.search({"q": "exam", "type": "topic"}), [("topic", self.topic1.id)])
+
+        Comment.objects.create(text="<img src=x onerror=alert(1)> exam", user=self.user1, topic=self.topic1)
+        response = self.client.get("/api/search/", {"q": "onerror"})
+
+        self.assertEqual(response.data["results"][0]["snippet"], "&lt;img src=x onerror=alert(1)&gt; exam")
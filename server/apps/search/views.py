@@ -0,0 +1,32 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import generics, status
+from rest_framework.response import Response
+
+from server.apps.group.logic.membership import get_group_ids
+
+from .logic.backends import KINDS
+from .logic.index import get_backend
+from .logic.serializers import SearchHitSerializer, SearchQuerySerializer
+
+
+class SearchView(generics.GenericAPIView):
+    """Full-text search over topics and comments of the user's groups."""
+
+    serializer_class = SearchHitSerializer
+    pagination_class = None
+
+    @swagger_auto_schema(query_serializer=SearchQuerySerializer, responses={200: SearchHitSerializer(many=True)})
+    def get(self, request):
+        """Search topic titles and descriptions and comment texts, best matches first"""
+        query = SearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        kind = query.validated_data.get("type")
+        hits = get_backend().search(
+            query.validated_data["q"],
+            get_group_ids(request),
+            kinds=(kind,) if kind else KINDS,
+            limit=query.validated_data["limit"],
+        )
+
+        return Response({"results": self.get_serializer(hits, many=True).data}, status=status.HTTP_200_OK)
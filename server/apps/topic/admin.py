@@ -18,6 +18,3 @@ class TopicAdmin(admin.ModelAdmin):
 
     def comments(self, obj):
         return obj.comments.count()
-
-    def score(self, obj):
-        return obj.activities.filter(activity=1).count() - obj.activities.filter(activity=0).count()
@@ -1,6 +1,27 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+from server.apps.core.logic.signals import (
+    invalidate_cached_list,
+    invalidate_voted_list,
+    record_deletion,
+    record_move,
+    remove_vote,
+    votes_changed,
+)
 
 
 class TopicConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.topic"
+
+    def ready(self):
+        """Connect signal receivers"""
+        Topic = self.get_model("Topic")
+
+        post_delete.connect(remove_vote, sender=self.get_model("TopicActivity"))
+        post_delete.connect(record_deletion, sender=Topic)
+        post_save.connect(record_move, sender=Topic)
+        post_save.connect(invalidate_cached_list, sender=Topic)
+        post_delete.connect(invalidate_cached_list, sender=Topic)
+        votes_changed.connect(invalidate_voted_list, sender=Topic)
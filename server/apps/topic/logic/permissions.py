@@ -1,6 +1,6 @@
 from rest_framework import permissions
 
-from server.apps.group.models import Group
+from server.apps.group.logic.membership import is_member
 
 
 class TopicPermissions(permissions.BasePermission):
@@ -8,24 +8,19 @@ class TopicPermissions(permissions.BasePermission):
 
     def has_permission(self, request, view):
         """Check permissions for Topic viewset."""
+        if view.action == "bulk":
+            return request.user.is_authenticated
+
         if view.action not in ["list", "create"]:
             return True
 
         group_id = request.data.get("group") or request.query_params.get("group")
 
-        if not group_id or not Group.objects.filter(id=group_id).exists():
-            return False
-
-        group = Group.objects.get(id=group_id)
-
-        if request.method in permissions.SAFE_METHODS:
-            return group.has_member(request.user) and request.user.is_authenticated
-
-        return group.has_member(request.user) and request.user.is_authenticated
+        return request.user.is_authenticated and is_member(request, group_id)
 
     def has_object_permission(self, request, view, obj):
         """Check permissions for Topic viewset object."""
-        if request.method in permissions.SAFE_METHODS:
-            return request.user.is_authenticated and obj.group.has_member(request.user)
+        if request.method in permissions.SAFE_METHODS or view.action == "vote":
+            return request.user.is_authenticated and is_member(request, obj.group_id)
 
-        return request.user == obj.author or request.user == obj.group.owner
+        return request.user.id == obj.author_id or request.user.id == obj.group.owner_id
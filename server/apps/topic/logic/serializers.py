@@ -1,14 +1,17 @@
 from rest_framework import serializers
 
+from server.apps.core.logic.serializers import PreloadedPrimaryKeyRelatedField
+from server.apps.core.logic.sparse import SparseFieldsMixin
 from server.apps.group.logic.serializers import GroupSerializer
 from server.apps.user.logic.serializers import UserSerializer
 
 from ..models import Topic
 
 
-class TopicSerializer(serializers.ModelSerializer):
+class TopicSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Group model"""
 
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
     author = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
@@ -19,17 +22,32 @@ class TopicSerializer(serializers.ModelSerializer):
             "description",
             "author",
             "group",
+            "upvotes",
+            "downvotes",
+            "score",
             "updated_at",
             "created_at",
         )
-        read_only_fields = ("id", "author", "updated_at", "created_at")
+        read_only_fields = ("id", "author", "upvotes", "downvotes", "score", "updated_at", "created_at")
 
     def to_representation(self, instance):
         """Convert instance to representation"""
         data = super().to_representation(instance)
 
-        data["author"] = UserSerializer(instance.author).data
+        self.represent(data, "author", UserSerializer, lambda: instance.author, instance.author_id)
 
-        data["group"] = GroupSerializer(instance.group, context=self.context).data
+        if self.sparse.wants("group") and self.sparse.expands("group"):
+            data["group"] = self.get_group(instance.group)
 
         return data
+
+    def get_group(self, group):
+        """Get group, serialized once per request and shared by all topics of that group"""
+        rendered_groups = self.context.setdefault("rendered_groups", {})
+
+        if group.id not in rendered_groups:
+            rendered_groups[group.id] = GroupSerializer(
+                group, context=self.context, sparse=self.sparse.nested("group")
+            ).data
+
+        return rendered_groups[group.id]
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("topic", "0002_topicactivity"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(fields=["group", "updated_at", "id"], name="topic_group_updated_idx"),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:51
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def remove_duplicate_votes(apps, schema_editor):
+    """Keep only the latest vote of every user on a topic, scores are recounted by `rebuild_scores`"""
+    TopicActivity = apps.get_model("topic", "TopicActivity")
+
+    latest = TopicActivity.objects.values("user", "topic").annotate(latest_id=Max("id")).values("latest_id")
+
+    TopicActivity.objects.exclude(id__in=list(latest)).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("topic", "0004_topic_scores"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_votes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="topicactivity",
+            constraint=models.UniqueConstraint(fields=("user", "topic"), name="unique_topic_activity_user"),
+        ),
+    ]
@@ -2,15 +2,17 @@ from django.contrib.auth import get_user_model
 from django.db import models
 
 from server.apps.core.constants import ACTIVITY_CHOICES
-from server.apps.core.models import BaseModel
+from server.apps.core.models import ActivityModel, ScoreModel
 from server.apps.group.models import Group
 
 User = get_user_model()
 
 
-class Topic(BaseModel):
+class Topic(ScoreModel):
     """Model definition for Group."""
 
+    delta_scope = "group"
+
     title = models.CharField(max_length=255)
     description = models.TextField()
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="topics")
@@ -21,15 +23,21 @@ class Topic(BaseModel):
 
         verbose_name = "Topic"
         verbose_name_plural = "Topics"
+        indexes = [
+            models.Index(fields=["group", "updated_at", "id"], name="topic_group_updated_idx"),
+            models.Index(fields=["group", "changed_at", "id"], name="topic_group_changed_idx"),
+        ]
 
     def __str__(self) -> str:
         """Unicode representation of Topic"""
         return self.title
 
 
-class TopicActivity(BaseModel):
+class TopicActivity(ActivityModel):
     """Model definition for TopicActivity."""
 
+    target_field = "topic"
+
     activity = models.BooleanField(choices=ACTIVITY_CHOICES)
     topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name="activities")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="topic_activities")
@@ -39,6 +47,9 @@ class TopicActivity(BaseModel):
 
         verbose_name = "TopicActivity"
         verbose_name_plural = "TopicActivities"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "topic"], name="unique_topic_activity_user"),
+        ]
 
     def __str__(self) -> str:
         return self.get_activity_display()
@@ -1,8 +1,11 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 
+from server.apps.core.logic.cache import response_cache
 from server.apps.group.models import Group
-from server.apps.topic.models import Topic
+from server.apps.topic.models import Topic, TopicActivity
 
 User = get_user_model()
 
@@ -74,21 +77,21 @@ class TestTopicEndpoints(APITestCase):
         response = self.client.get(f"/api/topics/?group={self.group1.id}")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
         # --------------------------------------- #
         self.client.force_authenticate(user=self.user2)
 
         response = self.client.get(f"/api/topics/?group={self.group1.id}")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
         # --------------------------------------- #
         self.client.force_authenticate(user=self.user3)
 
         response = self.client.get(f"/api/topics/?group={self.group2.id}")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
         # --------------------------------------- #
         self.client.force_authenticate(user=self.user3)
 
@@ -119,7 +122,7 @@ class TestTopicEndpoints(APITestCase):
         response = self.client.get(f"/api/topics/?group={self.group1.id}")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data["results"]), 3)
         # -------------------------------------------#
         self.client.force_authenticate(user=self.user1)
 
@@ -192,5 +195,138 @@ class TestTopicEndpoints(APITestCase):
         self.assertEqual(responseFirstGroup.status_code, 200)
         self.assertEqual(responseSecondGroup.status_code, 200)
 
-        self.assertEqual(len(responseFirstGroup.data), 2)
-        self.assertEqual(len(responseSecondGroup.data), 1)
+        self.assertEqual(len(responseFirstGroup.data["results"]), 2)
+        self.assertEqual(len(responseSecondGroup.data["results"]), 1)
+
+    def test_topic_list_query_count(self):
+        """Test Topic List Endpoint query count does not grow with topics and members."""
+
+        self.client.force_authenticate(user=self.user1)
+
+        self.client.get(f"/api/topics/?group={self.group1.id}")
+        response_cache.invalidate([(Topic, self.group1.id)])
+
+        with CaptureQueriesContext(connection) as few_topics:
+            response = self.client.get(f"/api/topics/?group={self.group1.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        for i in range(10):
+            member = User.objects.create(username=f"member{i}", password="testpassword")
+            self.group1.members.add(member)
+
+            Topic.objects.create(
+                title=f"Member Topic {i}",
+                description=f"Member Topic {i} Description",
+                author=member,
+                group=self.group1,
+            )
+
+        with CaptureQueriesContext(connection) as many_topics:
+            response = self.client.get(f"/api/topics/?group={self.group1.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 12)
+        self.assertEqual(len(response.data["results"][0]["group"]["members"]), 12)
+        self.assertEqual(len(many_topics.captured_queries), len(few_topics.captured_queries))
+
+    def test_topic_vote(self):
+        """Test Topic Vote Endpoint."""
+
+        self.client.force_authenticate(user=self.user2)
+
+        response = self.client.post(f"/api/topics/{self.topic1.id}/vote/", {"activity": 1})
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.post(f"/api/topics/{self.topic1.id}/vote/", {"activity": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(TopicActivity.objects.filter(topic=self.topic1).count(), 1)
+
+        response = self.client.get(f"/api/topics/{self.topic1.id}/")
+        self.assertEqual((response.data["upvotes"], response.data["downvotes"], response.data["score"]), (1, 0, 1))
+
+        response = self.client.post(f"/api/topics/{self.topic1.id}/vote/", {"activity": 0})
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f"/api/topics/{self.topic1.id}/")
+        self.assertEqual((response.data["upvotes"], response.data["downvotes"], response.data["score"]), (0, 1, -1))
+
+        response = self.client.delete(f"/api/topics/{self.topic1.id}/vote/")
+        self.assertEqual(response.status_code, 204)
+
+        response = self.client.get(f"/api/topics/{self.topic1.id}/")
+        self.assertEqual((response.data["upvotes"], response.data["downvotes"], response.data["score"]), (0, 0, 0))
+
+        response = self.client.post(f"/api/topics/{self.topic1.id}/vote/", {"activity": 2})
+        self.assertEqual(response.status_code, 400)
+        # --------------------------------------- #
+        self.client.force_authenticate(user=self.user3)
+
+        response = self.client.post(f"/api/topics/{self.topic1.id}/vote/", {"activity": 1})
+        self.assertEqual(response.status_code, 403)
+
+    def test_topic_list_sparse_fields(self):
+        """Test Topic List Endpoint renders and loads only requested fields."""
+
+        self.client.force_authenticate(user=self.user1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/api/topics/?group={self.group1.id}&fields=id,title,author,group")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {(topic["title"], topic["author"], topic["group"]) for topic in response.data["results"]},
+            {("Test Topic", self.user1.id, self.group1.id), ("Test Topic 2", self.user2.id, self.group1.id)},
+        )
+        self.assertFalse(
+            [query for query in queries if '"user_user"' in query["sql"] or '"group_group"' in query["sql"]]
+        )
+
+        response = self.client.get(f"/api/topics/{self.topic1.id}/?fields=id,author.username,group.name")
+
+        self.assertEqual(
+            response.data, {"id": self.topic1.id, "author": {"username": "testuser1"}, "group": {"name": "Test Group"}}
+        )
+
+        response = self.client.get(f"/api/topics/{self.topic1.id}/?expand=group")
+
+        self.assertEqual(response.data["author"], self.user1.id)
+        self.assertEqual(response.data["group"]["owner"], self.user1.id)
+        self.assertEqual(sorted(response.data["group"]["members"]), [self.user1.id, self.user2.id])
+
+    def test_topic_bulk_create(self):
+        """Test Topic Bulk Create Endpoint creates topics of the user's groups in one request."""
+        self.client.force_authenticate(user=self.user2)
+
+        data = [
+            {"title": "Imported 1", "description": "Description", "group": self.group1.id},
+            {"title": "Imported 2", "description": "Description", "group": self.group2.id},
+            {"title": "Imported 3", "description": "Description", "group": self.group1.id},
+        ]
+
+        response = self.client.post("/api/topics/bulk/", data, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([result["status"] for result in response.data], [201, 403, 201])
+        self.assertEqual(response.data[2]["data"]["title"], "Imported 3")
+        self.assertEqual(response.data[2]["data"]["author"]["id"], self.user2.id)
+
+        data = [{"title": f"Imported {i}", "description": "Description", "group": self.group1.id} for i in range(5)]
+
+        with CaptureQueriesContext(connection) as few_topics:
+            response = self.client.post("/api/topics/bulk/", data[:1], format="json")
+
+        with CaptureQueriesContext(connection) as many_topics:
+            response = self.client.post("/api/topics/bulk/", data, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Topic.objects.filter(title__startswith="Imported").count(), 8)
+        self.assertEqual(
+            len([query for query in many_topics if query["sql"].startswith('INSERT INTO "topic_topic"')]),
+            len([query for query in few_topics if query["sql"].startswith('INSERT INTO "topic_topic"')]),
+        )
+        self.assertEqual(
+            len([query for query in many_topics if query["sql"].startswith('SELECT "group_group"')]),
+            len([query for query in few_topics if query["sql"].startswith('SELECT "group_group"')]),
+        )
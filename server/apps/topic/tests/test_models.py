@@ -1,4 +1,7 @@
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TransactionTestCase
 
 from server.apps.group.models import Group
@@ -186,3 +189,58 @@ class TopicActivityModelTest(TransactionTestCase):
         """Test TopicActivity and User Relationship"""
         self.assertEqual(self.user1.topic_activities.count(), 1)
         self.assertEqual(self.user1.topic_activities.first(), self.topicActivity)
+
+    def test_topic_activity_score(self):
+        """Test TopicActivity keeps Topic vote counters in sync."""
+        self.topic1.refresh_from_db()
+        self.assertEqual((self.topic1.upvotes, self.topic1.downvotes, self.topic1.score), (1, 0, 1))
+
+        TopicActivity.objects.create(activity=False, topic=self.topic1, user=self.user2)
+        self.topicActivity.activity = False
+        self.topicActivity.save()
+
+        self.topic1.refresh_from_db()
+        self.assertEqual((self.topic1.upvotes, self.topic1.downvotes, self.topic1.score), (0, 2, -2))
+
+        self.topicActivity.topic = self.topic2
+        self.topicActivity.save()
+
+        self.topic1.refresh_from_db()
+        self.topic2.refresh_from_db()
+        self.assertEqual((self.topic1.upvotes, self.topic1.downvotes, self.topic1.score), (0, 1, -1))
+        self.assertEqual((self.topic2.upvotes, self.topic2.downvotes, self.topic2.score), (0, 1, -1))
+
+        TopicActivity.objects.get(pk=self.topicActivity.pk).delete()
+
+        self.topic2.refresh_from_db()
+        self.assertEqual((self.topic2.upvotes, self.topic2.downvotes, self.topic2.score), (0, 0, 0))
+
+        self.user2.delete()
+
+        self.topic1.refresh_from_db()
+        self.assertEqual((self.topic1.upvotes, self.topic1.downvotes, self.topic1.score), (0, 0, 0))
+
+    def test_topic_save_keeps_votes(self):
+        """Test saving a Topic loaded before a vote keeps the vote counters."""
+        topic = Topic.objects.get(pk=self.topic1.pk)
+
+        TopicActivity.objects.create(activity=True, topic=self.topic1, user=self.user2)
+
+        topic.title = "Updated Topic"
+        topic.save()
+
+        topic.refresh_from_db()
+        self.assertEqual(topic.title, "Updated Topic")
+        self.assertEqual((topic.upvotes, topic.downvotes, topic.score), (2, 0, 2))
+
+    def test_rebuild_scores_command(self):
+        """Test rebuild_scores command recounts Topic votes from TopicActivity."""
+        TopicActivity.objects.create(activity=False, topic=self.topic1, user=self.user2)
+        Topic.objects.update(upvotes=10, downvotes=10, score=10)
+
+        call_command("rebuild_scores", batch_size=1, stdout=StringIO())
+
+        self.topic1.refresh_from_db()
+        self.topic2.refresh_from_db()
+        self.assertEqual((self.topic1.upvotes, self.topic1.downvotes, self.topic1.score), (1, 1, 0))
+        self.assertEqual((self.topic2.upvotes, self.topic2.downvotes, self.topic2.score), (0, 0, 0))
@@ -1,17 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
 
+from server.apps.core.logic.cache import CachedListMixin
+from server.apps.core.logic.conditional import ConditionalMixin
+from server.apps.core.logic.delta import DeltaMixin
+from server.apps.core.logic.mixins import BulkCreateMixin, VoteMixin
+from server.apps.core.logic.sparse import SparseFields
+from server.apps.group.logic.membership import is_member
+from server.apps.group.models import Group
+
 from .logic.filters import TopicFilter
 from .logic.permissions import TopicPermissions
 from .logic.serializers import TopicSerializer
-from .models import Topic
+from .models import Topic, TopicActivity
+
+User = get_user_model()
 
 
-class TopicViewSet(viewsets.ModelViewSet):
+class TopicViewSet(DeltaMixin, ConditionalMixin, CachedListMixin, BulkCreateMixin, VoteMixin, viewsets.ModelViewSet):
     """ViewSet for Topic model"""
 
     model = Topic
     queryset = Topic.objects.all()
+    activity_model = TopicActivity
+    conditional_relations = ("group",)
+    user_relations = ("author", "group.owner", "group.members")
 
     serializer_class = TopicSerializer
 
@@ -20,6 +35,49 @@ class TopicViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = TopicFilter
 
+    def get_queryset(self):
+        """Return queryset with the author and group relations the client asked for loaded up front"""
+        queryset = self.queryset
+        sparse = SparseFields.from_request(self.request)
+
+        if sparse.wants("author") and sparse.expands("author"):
+            queryset = queryset.select_related("author")
+
+        if sparse.wants("group") and sparse.expands("group"):
+            group = sparse.nested("group")
+            queryset = queryset.select_related("group__owner" if group.expands("owner") else "group")
+
+            if group.wants("members"):
+                members = User.objects.all() if group.expands("members") else User.objects.only("id")
+                queryset = queryset.prefetch_related(Prefetch("group__members", queryset=members))
+
+        return queryset
+
+    def get_cache_scopes(self) -> list:
+        """Topic list renders topics of the group, the group itself and users of the group"""
+        group_id = self.request.query_params.get("group")
+
+        return [(Topic, group_id), (Group, group_id), (User, group_id)]
+
+    def get_user_scopes(self, instance=None) -> list:
+        """Topics render users of their group"""
+        return [(User, instance.group_id if instance else self.request.query_params.get("group"))]
+
+    def get_cache_variant(self) -> str:
+        """Topic list renders the join code of an expanded group to its owner"""
+        sparse = SparseFields.from_request(self.request)
+
+        if not (sparse.wants("group") and sparse.expands("group") and sparse.nested("group").wants("join_code")):
+            return ""
+
+        owned = Group.objects.filter(pk=self.request.query_params.get("group"), owner_id=self.request.user.id)
+
+        return "owner" if owned.exists() else ""
+
+    def can_create(self, validated_data: dict) -> bool:
+        """Topics are created by members of the group"""
+        return is_member(self.request, validated_data["group"].id)
+
     def filter_queryset(self, queryset):
         """Use Filter class if it is list action"""
         if self.action != "list":
@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, pre_delete
 
 
 class UserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.user"
+
+    def ready(self):
+        """Connect signal receivers"""
+        from .logic.signals import invalidate_user_lists
+
+        User = self.get_model("User")
+
+        post_save.connect(invalidate_user_lists, sender=User)
+        pre_delete.connect(invalidate_user_lists, sender=User)
@@ -0,0 +1,117 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import user_login_failed
+from django.contrib.auth.hashers import make_password
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils.functional import empty, SimpleLazyObject
+from rest_framework import exceptions
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from ..models import User
+from .hashing import hashing_pool, verify_password
+
+
+def get_login_user(username_email: str):
+    """
+    Get active user by case-insensitive email or username in one query on the lowercase indexes.
+
+    An email match wins over a username match, then an exact-case username.
+    """
+
+    value = username_email.lower()
+
+    users = User.objects.alias(email_lower=Lower("email"), username_lower=Lower("username")).filter(
+        Q(email_lower=value) | Q(username_lower=value), is_active=True
+    )
+
+    return min(
+        users.order_by()[:3],
+        key=lambda user: (user.email.lower() != value, user.username != username_email),
+        default=None,
+    )
+
+
+async def authenticate_login(request, username_email: str, password: str):
+    """
+    Verify credentials of a login against the user resolved by `get_login_user`, without a second lookup.
+
+    Hashing runs in `hashing_pool`. A password hashed with an outdated policy is replaced by its hash with
+    the current one. Like `ModelBackend`, the password is hashed once for an unknown user, so response
+    time does not tell which usernames exist.
+    """
+
+    user = await sync_to_async(get_login_user)(username_email)
+
+    if user is None:
+        await hashing_pool.run(make_password, password)
+    else:
+        is_correct, updated = await hashing_pool.run(verify_password, password, user.password)
+
+        if updated:
+            user.password = updated
+            await sync_to_async(user.save)(update_fields=["password"])
+
+        if is_correct:
+            return user
+
+    await sync_to_async(user_login_failed.send)(
+        sender=__name__, credentials={"username": username_email}, request=request
+    )
+
+    return None
+
+
+def claim_property(name: str, attribute: str):
+    """Get property reading `attribute` from token claim `name` until the user row is loaded"""
+
+    def get(self):
+        if self._wrapped is empty:
+            return self.claims[name]
+        return getattr(self._wrapped, attribute)
+
+    return property(get)
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    User of a request authenticated by `StatelessJWTAuthentication`.
+
+    `id` and `pk` are read from the token. Any other attribute loads the active user row once, like
+    `request.user` of `AuthenticationMiddleware`, so does assigning the user to a relation or comparing
+    it to a `User`; compare ids instead. The `username` and `is_staff` claims are not trusted, so
+    permission checks and renames take effect immediately.
+    """
+
+    id = claim_property(api_settings.USER_ID_CLAIM, "id")
+    pk = claim_property(api_settings.USER_ID_CLAIM, "pk")
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, token):
+        self.__dict__["claims"] = {api_settings.USER_ID_CLAIM: int(token[api_settings.USER_ID_CLAIM])}
+        super().__init__(self.load)
+
+    def load(self) -> User:
+        """Load the user row of the token, rejecting deleted and deactivated users"""
+        try:
+            return User.objects.get(pk=self.claims[api_settings.USER_ID_CLAIM], is_active=True)
+        except User.DoesNotExist:
+            raise exceptions.AuthenticationFailed("User not found", code="user_not_found")
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication building `request.user` from the token instead of loading it on every request.
+
+    Requests reading only the user id, such as listing topics of a group, skip the user row. A deleted
+    or deactivated user is rejected as soon as a request loads the row, otherwise it keeps access until
+    the access token expires, which is why `ACCESS_TOKEN_LIFETIME` is short.
+    """
+
+    def get_user(self, validated_token):
+        """Get user of validated token"""
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        return ClaimsUser(validated_token)
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class ConfigurableHasherMixin:
+    """
+    Password hasher taking its cost parameters from `PASSWORD_HASHER_OPTIONS[algorithm]`, or from
+    keyword arguments (used by `benchmark_hashers`).
+
+    Verification reads the parameters of the stored hash, and `must_update` compares them with the
+    configured ones, so `User.check_password` rehashes a password with the current policy on login.
+    """
+
+    def __init__(self, **options):
+        self.__dict__.update({**getattr(settings, "PASSWORD_HASHER_OPTIONS", {}).get(self.algorithm, {}), **options})
+
+
+class PBKDF2PasswordHasher(ConfigurableHasherMixin, hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with configurable `iterations`"""
+
+
+class ScryptPasswordHasher(ConfigurableHasherMixin, hashers.ScryptPasswordHasher):
+    """scrypt with configurable `work_factor`, `block_size`, `parallelism` and `maxmem`"""
+
+
+class Argon2PasswordHasher(ConfigurableHasherMixin, hashers.Argon2PasswordHasher):
+    """Argon2id with configurable `time_cost`, `memory_cost` and `parallelism`, requires `argon2-cffi`"""
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from rest_framework import exceptions, status
+
+
+class HashingPoolBusy(exceptions.APIException):
+    """Raised when the hashing pool has no room left, answered with `503 Service Unavailable`"""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many logins in progress, retry shortly."
+    default_code = "hashing_pool_busy"
+    wait = 1
+
+
+class HashingPool:
+    """
+    Bounded pool of threads running password hashing for async views.
+
+    Hashing keeps a CPU busy for hundreds of milliseconds, run on the event loop or on the single
+    thread serving sync views under ASGI it would stall every other request of the worker. The hash
+    functions of `hashlib` release the GIL, so `PASSWORD_HASHING_WORKERS` threads hash in parallel.
+    Once `PASSWORD_HASHING_QUEUE` calls wait for a thread on top of the running ones, further calls
+    raise `HashingPoolBusy` instead of queueing without bound.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pending = 0
+
+    @property
+    def workers(self) -> int:
+        """Get configured number of hashing threads"""
+        return settings.PASSWORD_HASHING_WORKERS
+
+    @property
+    def queue_size(self) -> int:
+        """Get configured number of calls waiting for a thread"""
+        return settings.PASSWORD_HASHING_QUEUE
+
+    async def run(self, func, *args):
+        """Run `func(*args)` in the pool and return its result, raise `HashingPoolBusy` if the queue is full"""
+
+        with self.lock:
+            if self.pending >= self.workers + self.queue_size:
+                raise HashingPoolBusy()
+
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hashing")
+
+            self.pending += 1
+            future = self.executor.submit(func, *args)
+
+        # Released when the thread is done, a cancelled caller does not free a thread still hashing
+        future.add_done_callback(self.release)
+
+        return await asyncio.wrap_future(future)
+
+    def release(self, future) -> None:
+        """Stop counting a call once its thread is done with it"""
+        with self.lock:
+            self.pending -= 1
+
+
+hashing_pool = HashingPool()
+
+
+def verify_password(password: str, encoded: str) -> tuple:
+    """Check password against hash, returning if it matches and its hash with the current policy if that changed"""
+
+    updated = []
+    is_correct = check_password(password, encoded, setter=lambda raw: updated.append(make_password(raw)))
+
+    return is_correct, updated[0] if updated else None
@@ -1,6 +1,11 @@
-from rest_framework import serializers
+from rest_framework import exceptions, serializers
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.settings import api_settings
+
+from server.apps.core.logic.sparse import SparseFieldsMixin
 
 from ..models import User
+from .tokens import RefreshToken
 
 
 class RegistrationSerializer(serializers.ModelSerializer):
@@ -38,9 +43,21 @@ class RegistrationSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
-        """Create a new user with encrypted password and return it."""
+        """Create a new user with encrypted password, or `encoded_password` hashed beforehand, and return it."""
         validated_data.pop("password_confirmation")
-        return User.objects.create_user(**validated_data)
+        encoded_password = validated_data.pop("encoded_password", None)
+
+        if encoded_password is None:
+            return User.objects.create_user(**validated_data)
+
+        validated_data.pop("password")
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
+        user.password = encoded_password
+        user.save()
+
+        return user
 
 
 class LoginSerializer(serializers.Serializer):
@@ -54,20 +71,8 @@ class LoginSerializer(serializers.Serializer):
 
         fields = ["username_email", "password"]
 
-    def validate_username_email(self, value):
-        """Check if user exist with this email or username"""
-
-        value = value.lower()
-
-        user = User.objects.filter(email=value).first() or User.objects.filter(username=value).first()
 
-        if not user:
-            return value
-
-        return user.username
-
-
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for the user object."""
 
     class Meta:
@@ -75,3 +80,40 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ("id", "photo", "first_name", "last_name", "username", "email", "is_staff")
         read_only_fields = ("id", "is_staff")
         extra_kwargs = {"username": {"required": False}}
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """
+    Serializer for refreshing tokens, with the claims of `User.get_token_claims` read from the user row.
+
+    Refreshed tokens would otherwise copy the claims of the first token of the login, so a rename
+    would not reach clients until the user logs in again.
+    """
+
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        """Check refresh token and user, return new access token and rotated refresh token."""
+        refresh = self.token_class(attrs["refresh"])
+        user = User.objects.filter(pk=refresh.get(api_settings.USER_ID_CLAIM)).first()
+
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise exceptions.AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            refresh.blacklist()
+
+        for claim, value in user.get_token_claims().items():
+            refresh[claim] = value
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+
+            data["refresh"] = str(refresh)
+
+        return data
@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.db.models import Q
+
+from server.apps.core.logic.cache import response_cache
+
+from .serializers import UserSerializer
+
+
+def get_rendered_group_ids(user) -> set:
+    """Get ids of groups whose lists render the user: as owner, member, topic author or commenter"""
+
+    Group = apps.get_model("group", "Group")
+    Topic = apps.get_model("topic", "Topic")
+
+    return {
+        *Group.objects.filter(Q(owner=user) | Q(members=user)).values_list("id", flat=True),
+        *Topic.objects.filter(Q(author=user) | Q(comments__user=user)).values_list("group_id", flat=True),
+    }
+
+
+def invalidate_user_lists(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Invalidate cached lists rendering the user, scoped per group as `(User, group_id)`.
+
+    New users are not rendered anywhere yet, and saves of fields users are not rendered with
+    (e.g. `last_login`) keep the lists.
+    """
+
+    if created or update_fields is not None and not set(update_fields) & set(UserSerializer.Meta.fields):
+        return
+
+    response_cache.invalidate([(sender, group_id) for group_id in get_rendered_group_ids(instance)])
@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+class BlacklistCache:
+    """
+    Cache of blacklisted refresh token ids in front of the `token_blacklist` tables.
+
+    A token id is added when the token is blacklisted and kept until the token expires, so a rotated
+    refresh token presented again is rejected without a query. Ids missing from the cache are still
+    checked in the database, the cache only ever answers "blacklisted".
+    """
+
+    key_prefix = "blacklist"
+
+    @property
+    def cache(self):
+        """Get configured cache backend"""
+        return caches[getattr(settings, "TOKEN_BLACKLIST_CACHE_ALIAS", "default")]
+
+    def add(self, jti: str, expires_at) -> None:
+        """Add id of a token blacklisted until `expires_at`"""
+        timeout = (expires_at - timezone.now()).total_seconds()
+
+        if timeout > 0:
+            self.cache.set(f"{self.key_prefix}:{jti}", True, timeout=timeout)
+
+    def contains(self, jti: str) -> bool:
+        """Check if token id is known to be blacklisted"""
+        return self.cache.get(f"{self.key_prefix}:{jti}", False)
+
+
+blacklist_cache = BlacklistCache()
+
+
+class RefreshToken(tokens.RefreshToken):
+    """
+    Refresh token checked against `blacklist_cache` before the blacklist table.
+
+    Blacklisting and outstanding a token write its user id as is, instead of loading the user row
+    for the foreign key first.
+    """
+
+    def get_outstanding(self) -> OutstandingToken:
+        """Get or create outstanding token row of this token"""
+        outstanding, _ = OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults={
+                "user_id": self.payload.get(api_settings.USER_ID_CLAIM),
+                "created_at": self.current_time,
+                "token": str(self),
+                "expires_at": datetime_from_epoch(self.payload["exp"]),
+            },
+        )
+
+        return outstanding
+
+    def check_blacklist(self) -> None:
+        """Raise `TokenError` if this token is blacklisted"""
+        if blacklist_cache.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+
+        super().check_blacklist()
+
+    def blacklist(self) -> BlacklistedToken:
+        """Add this token to the blacklist"""
+        outstanding = self.get_outstanding()
+        blacklisted, _ = BlacklistedToken.objects.get_or_create(token=outstanding)
+
+        blacklist_cache.add(outstanding.jti, outstanding.expires_at)
+
+        return blacklisted
+
+    def outstand(self) -> OutstandingToken:
+        """Add this token to the outstanding tokens"""
+        return self.get_outstanding()
@@ -0,0 +1,79 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from server.apps.user.logic.hashers import ConfigurableHasherMixin
+
+PASSWORD = "benchmark-password"
+
+
+class Command(BaseCommand):
+    help = "Measure password verifications (logins) per second and core for each password hashing policy"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=10, help="Verifications per policy")
+        parser.add_argument(
+            "--option",
+            action="append",
+            default=[],
+            metavar="ALGORITHM:NAME=VALUE[,NAME=VALUE]",
+            help="Also measure an algorithm with other options, e.g. pbkdf2_sha256:iterations=300000",
+        )
+
+    def handle(self, *args, **options):
+        hashers = {
+            hasher.algorithm: hasher
+            for hasher in map(import_string, settings.PASSWORD_HASHERS)
+            if issubclass(hasher, ConfigurableHasherMixin)
+        }
+
+        policies = [(algorithm, {}) for algorithm in hashers]
+        policies += [self.parse_option(option, hashers) for option in options["option"]]
+
+        cores = os.cpu_count() or 1
+
+        self.stdout.write(f"Current policy: {settings.PASSWORD_HASHER}, {cores} cores")
+
+        for algorithm, overrides in policies:
+            hasher = hashers[algorithm](**overrides)
+            name = f"{algorithm}({', '.join(f'{key}={value}' for key, value in self.get_params(hasher).items())})"
+
+            try:
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+            except ValueError as error:
+                self.stdout.write(f"{name}: skipped, {error}")
+                continue
+
+            start = time.perf_counter()
+
+            for _ in range(options["samples"]):
+                hasher.verify(PASSWORD, encoded)
+
+            seconds = (time.perf_counter() - start) / options["samples"]
+
+            self.stdout.write(
+                f"{name}: {seconds * 1000:.1f} ms per login, {1 / seconds:.1f} logins/s per core, "
+                f"{cores / seconds:.1f} logins/s on {cores} cores"
+            )
+
+    @staticmethod
+    def parse_option(option: str, hashers: dict) -> tuple:
+        """Parse `--option` value into an algorithm and its integer options"""
+        algorithm, _, values = option.partition(":")
+
+        if algorithm not in hashers:
+            raise CommandError(f"Unknown algorithm {algorithm!r}, expected one of {', '.join(hashers)}")
+
+        try:
+            return algorithm, {key: int(value) for key, value in (pair.split("=") for pair in values.split(","))}
+        except ValueError:
+            raise CommandError(f"Invalid options {values!r}, expected NAME=VALUE pairs of integers")
+
+    @staticmethod
+    def get_params(hasher) -> dict:
+        """Get cost parameters of hasher"""
+        names = ("iterations", "work_factor", "block_size", "parallelism", "time_cost", "memory_cost")
+        return {name: getattr(hasher, name) for name in names if hasattr(hasher, name)}
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted refresh tokens in batches, to run on a schedule"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Tokens deleted per transaction")
+        parser.add_argument("--pause", type=float, default=0.1, help="Seconds to wait between batches")
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by("expires_at")
+        deleted = {}
+
+        while ids := list(expired.values_list("id", flat=True)[: options["batch_size"]]):
+            with transaction.atomic():
+                _, counts = OutstandingToken.objects.filter(id__in=ids).delete()
+
+            for label, count in counts.items():
+                deleted[label] = deleted.get(label, 0) + count
+
+            if len(ids) < options["batch_size"]:
+                break
+
+            time.sleep(options["pause"])
+
+        self.stdout.write(
+            f"Deleted {deleted.get(OutstandingToken._meta.label, 0)} outstanding and "
+            f"{deleted.get(BlacklistedToken._meta.label, 0)} blacklisted tokens expired before {now.isoformat()}"
+        )
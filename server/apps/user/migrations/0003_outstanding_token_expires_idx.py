@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Index expiry of outstanding tokens, which `prune_tokens` deletes by, on the table of `token_blacklist`."""
+
+    dependencies = [
+        ("user", "0002_lower_login_indexes"),
+        ("token_blacklist", "0012_alter_outstandingtoken_user"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX token_outstanding_expires_idx ON token_blacklist_outstandingtoken (expires_at)",
+            "DROP INDEX token_outstanding_expires_idx",
+        ),
+    ]
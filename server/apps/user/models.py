@@ -1,16 +1,33 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.db.models.functions import Lower
+
+from .logic.tokens import RefreshToken
 
 
 class User(AbstractUser):
     photo = models.ImageField(upload_to="users/", blank=True, null=True)
 
+    class Meta(AbstractUser.Meta):
+        """Meta definition for User."""
+
+        indexes = [
+            models.Index(Lower("email"), name="user_email_lower_idx"),
+            models.Index(Lower("username"), name="user_username_lower_idx"),
+        ]
+
+    def get_token_claims(self) -> dict:
+        """Get claims tokens carry besides the user id, for clients to show the user without a request."""
+        return {"username": self.username, "is_staff": self.is_staff}
+
     def get_tokens(self):
         """Get access and refresh tokens for user."""
 
         refresh = RefreshToken.for_user(self)
 
+        for claim, value in self.get_token_claims().items():
+            refresh[claim] = value
+
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
@@ -0,0 +1,109 @@
+from django.test import RequestFactory
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from server.apps.group.models import Group
+from server.apps.topic.models import Topic
+from server.apps.user.logic.authentication import ClaimsUser, StatelessJWTAuthentication
+from server.apps.user.models import User
+
+
+class StatelessJWTAuthenticationTest(APITestCase):
+    """Test StatelessJWTAuthentication and the token claims it reads."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpassword")
+        self.tokens = self.user.get_tokens()
+
+    def authenticate(self, token: str):
+        """Authenticate request with access token"""
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return StatelessJWTAuthentication().authenticate(request)[0]
+
+    def test_claims(self):
+        """Test user is built from the token and its row is only loaded for other attributes."""
+        with self.assertNumQueries(0):
+            user = self.authenticate(self.tokens["access"])
+
+            self.assertIsInstance(user, ClaimsUser)
+            self.assertEqual((user.id, user.pk), (self.user.id, self.user.id))
+            self.assertTrue(user.is_authenticated)
+
+        with self.assertNumQueries(1):
+            self.assertEqual((user.username, user.is_staff, user.email), ("testuser", False, "test@example.com"))
+
+        self.assertIsInstance(user, User)
+
+    def test_token_without_claims(self):
+        """Test tokens issued without claims are authenticated the same way."""
+        token = RefreshToken.for_user(self.user).access_token
+
+        with self.assertNumQueries(0):
+            user = self.authenticate(str(token))
+
+        self.assertEqual(user.username, "testuser")
+
+    def test_staff_revoked(self):
+        """Test admin checks read the user row, not the claims of the token."""
+        self.user.is_staff = True
+        self.user.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user.get_tokens()['access']}")
+
+        self.assertEqual(self.client.get("/api/response-cache/").status_code, 200)
+
+        self.user.is_staff = False
+        self.user.save()
+
+        self.assertEqual(self.client.get("/api/response-cache/").status_code, 403)
+
+    def test_deactivated(self):
+        """Test requests loading the row of a deactivated user are rejected."""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get("/api/auth/profile/").status_code, 401)
+
+    def test_requests(self):
+        """Test views updating or relating the user work with the lazy user."""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+
+        response = self.client.patch("/api/auth/profile/", {"username": "renamed"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["username"], "renamed")
+
+        group = Group.objects.create(name="Group", description="Description", owner=self.user)
+        group.members.add(self.user)
+
+        response = self.client.post(
+            "/api/topics/", {"title": "Topic", "description": "Description", "group": group.id}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Topic.objects.get().author, self.user)
+
+    def test_refresh_claims(self):
+        """Test refreshed tokens carry the current claims of the user."""
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.client.post("/api/auth/token/refresh/", {"refresh": self.tokens["refresh"]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(AccessToken(response.data["access"])["is_staff"])
+        self.assertTrue(RefreshToken(response.data["refresh"])["is_staff"])
+
+        response = self.client.post("/api/auth/token/refresh/", {"refresh": self.tokens["refresh"]})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_inactive(self):
+        """Test tokens of inactive users are not refreshed."""
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.post("/api/auth/token/refresh/", {"refresh": self.tokens["refresh"]})
+
+        self.assertEqual(response.status_code, 401)
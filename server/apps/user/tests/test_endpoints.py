@@ -2,7 +2,9 @@ import pathlib
 import shutil
 import tempfile
 
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from PIL import Image
 from rest_framework.test import APITestCase
 
@@ -179,6 +181,34 @@ class TestLogin(APITestCase):
 
         self.assertEqual(set(response.data.keys()), set(["detail"]))
 
+    def test_case_insensitive(self):
+        """Test username and email match regardless of case."""
+        User.objects.create_user(username="MixedCase", email="Mixed@Example.com", password="testpassword")
+
+        for username_email in ["mixedcase", "MIXEDCASE", "mixed@example.com", "TEST@example.com"]:
+            response = self.client.post(self.endpoint, {"username_email": username_email, "password": "testpassword"})
+
+            self.assertEqual(response.status_code, 200, username_email)
+
+    def test_single_lookup(self):
+        """Test user is looked up with one query and not again to check the password."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self.endpoint, {"username_email": "Test@Example.com", "password": "testpassword"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len([query for query in queries if 'FROM "user_user"' in query["sql"]]), 1)
+
+    def test_inactive_user(self):
+        """Test inactive user cannot login."""
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.post(self.endpoint, {"username_email": "testuser", "password": "testpassword"})
+
+        self.assertEqual(response.status_code, 401)
+
 
 @override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
 class TestProfile(APITestCase):
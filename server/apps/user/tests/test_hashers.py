@@ -0,0 +1,91 @@
+import os
+import runpy
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from server.apps.user.models import User
+from server.settings.components import BASE_DIR
+
+HASHERS = [
+    "server.apps.user.logic.hashers.PBKDF2PasswordHasher",
+    "server.apps.user.logic.hashers.ScryptPasswordHasher",
+]
+
+
+@override_settings(PASSWORD_HASHERS=HASHERS, PASSWORD_HASHER_OPTIONS={"pbkdf2_sha256": {"iterations": 1000}})
+class TestPasswordHashing(APITestCase):
+    """Test password hashing policy."""
+
+    endpoint = "/api/auth/login/"
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpassword")
+
+    def login(self):
+        """Login and get stored password hash"""
+        response = self.client.post(self.endpoint, {"username_email": "testuser", "password": "testpassword"})
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+
+        return self.user.password
+
+    def test_configured_options(self):
+        """Test new passwords are hashed with the configured options."""
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+        self.assertEqual(self.login(), self.user.password)
+
+    def test_rehash_on_login(self):
+        """Test password is rehashed with changed options and algorithm on login."""
+        with override_settings(
+            PASSWORD_HASHERS=HASHERS, PASSWORD_HASHER_OPTIONS={"pbkdf2_sha256": {"iterations": 2000}}
+        ):
+            self.assertTrue(self.login().startswith("pbkdf2_sha256$2000$"))
+
+        with override_settings(
+            PASSWORD_HASHERS=HASHERS[::-1], PASSWORD_HASHER_OPTIONS={"scrypt": {"work_factor": 2**10}}
+        ):
+            self.assertTrue(self.login().startswith("scrypt$"))
+            self.assertIn("$1024$", self.user.password)
+
+
+class TestPasswordHasherSetting(APITestCase):
+    """Test `DJANGO_PASSWORD_HASHER` setting."""
+
+    def test_unknown_hasher(self):
+        """Test an unknown hasher fails at startup naming the valid choices."""
+        path = BASE_DIR.joinpath("server", "settings", "components", "common.py")
+
+        with mock.patch.dict(os.environ, {"DJANGO_PASSWORD_HASHER": "md5"}):
+            with self.assertRaisesMessage(
+                ImproperlyConfigured, "'md5', expected one of: pbkdf2_sha256, scrypt, argon2"
+            ):
+                runpy.run_path(path)
+
+
+class TestBenchmarkHashers(APITestCase):
+    """Test benchmark_hashers command."""
+
+    @override_settings(PASSWORD_HASHERS=HASHERS, PASSWORD_HASHER="scrypt")
+    def test_benchmark(self):
+        """Test every policy and extra option set is reported."""
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_hashers",
+            samples=1,
+            option=["pbkdf2_sha256:iterations=1000", "scrypt:work_factor=1024"],
+            stdout=stdout,
+        )
+
+        output = stdout.getvalue()
+
+        self.assertIn("Current policy: scrypt", output)
+        self.assertIn("pbkdf2_sha256(iterations=1000): ", output)
+        self.assertIn("scrypt(work_factor=1024, block_size=8, parallelism=1): ", output)
+        self.assertIn("logins/s per core", output)
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+from unittest import mock
+
+from django.test import override_settings, SimpleTestCase
+from rest_framework.test import APITestCase
+
+from server.apps.user.logic.hashing import hashing_pool, HashingPool, HashingPoolBusy
+from server.apps.user.models import User
+
+
+@override_settings(PASSWORD_HASHING_WORKERS=1, PASSWORD_HASHING_QUEUE=1)
+class HashingPoolTest(SimpleTestCase):
+    """Test HashingPool."""
+
+    async def test_run(self):
+        """Test calls run in pool threads."""
+        pool = HashingPool()
+
+        self.assertTrue((await pool.run(lambda: threading.current_thread().name)).startswith("hashing"))
+        self.assertEqual(pool.pending, 0)
+
+    async def test_back_pressure(self):
+        """Test calls beyond running and queued ones are rejected until the pool drains."""
+        pool = HashingPool()
+        release = threading.Event()
+
+        running = asyncio.ensure_future(pool.run(release.wait, 5))
+        queued = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(HashingPoolBusy):
+            await pool.run(release.wait, 5)
+
+        release.set()
+
+        self.assertEqual(await asyncio.gather(running, queued), [True, True])
+        self.assertTrue(await pool.run(release.wait, 5))
+
+    async def test_cancelled(self):
+        """Test a cancelled call keeps its place in the pool until its thread is done."""
+        pool = HashingPool()
+        started = threading.Event()
+        release = threading.Event()
+
+        def hash_password():
+            started.set()
+            return release.wait(5)
+
+        call = asyncio.ensure_future(pool.run(hash_password))
+        await asyncio.sleep(0)
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        call.cancel()
+        await asyncio.sleep(0)
+
+        self.assertEqual(pool.pending, 1)
+
+        release.set()
+        pool.executor.shutdown(wait=True)
+
+        self.assertEqual(pool.pending, 0)
+
+
+class HashingEndpointsTest(APITestCase):
+    """Test login and registration hash passwords in the hashing pool."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpassword")
+
+    def test_busy(self):
+        """Test login and registration are answered with 503 and Retry-After when the pool is full."""
+        with mock.patch.object(hashing_pool, "pending", 10**6):
+            response = self.client.post("/api/auth/login/", {"username_email": "testuser", "password": "testpassword"})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+        with mock.patch.object(hashing_pool, "pending", 10**6):
+            response = self.client.post(
+                "/api/auth/register/",
+                {
+                    "first_name": "New",
+                    "last_name": "User",
+                    "username": "newuser",
+                    "email": "new@example.com",
+                    "password": "newpassword",
+                    "password_confirmation": "newpassword",
+                },
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(User.objects.filter(username="newuser").exists())
+
+    def test_register(self):
+        """Test registered user can login with the password hashed in the pool."""
+        response = self.client.post(
+            "/api/auth/register/",
+            {
+                "first_name": "New",
+                "last_name": "User",
+                "username": "newuser",
+                "email": "New@EXAMPLE.com",
+                "password": "newpassword",
+                "password_confirmation": "newpassword",
+            },
+        )
+
+        self.assertEqual(response.status_code, 201)
+
+        user = User.objects.get(username="newuser")
+
+        self.assertEqual(user.email, "New@example.com")
+        self.assertTrue(user.check_password("newpassword"))
+
+        response = self.client.post("/api/auth/login/", {"username_email": "newuser", "password": "newpassword"})
+
+        self.assertEqual(response.status_code, 200)
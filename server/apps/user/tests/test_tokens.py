@@ -0,0 +1,73 @@
+import datetime
+import io
+
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from server.apps.user.logic.tokens import blacklist_cache, RefreshToken
+from server.apps.user.models import User
+
+
+class RefreshTokenTest(APITestCase):
+    """Test RefreshToken and the blacklist cache."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpassword")
+        self.tokens = self.user.get_tokens()
+
+    def test_rotation(self):
+        """Test rotated token is rejected from the cache and, once evicted, from the database."""
+        response = self.client.post("/api/auth/token/refresh/", {"refresh": self.tokens["refresh"]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("user_id", flat=True)),
+            {self.user.id},
+        )
+        self.assertEqual(OutstandingToken.objects.count(), 2)
+
+        with self.assertNumQueries(0), self.assertRaises(TokenError):
+            RefreshToken(self.tokens["refresh"])
+
+        blacklist_cache.cache.clear()
+
+        with self.assertNumQueries(1), self.assertRaises(TokenError):
+            RefreshToken(self.tokens["refresh"])
+
+        RefreshToken(response.data["refresh"])
+
+
+class PruneTokensTest(APITestCase):
+    """Test prune_tokens command."""
+
+    def setUp(self):
+        """Setup Example Data for the Test Class."""
+        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpassword")
+
+        for _ in range(5):
+            self.user.get_tokens()
+
+        tokens = list(OutstandingToken.objects.order_by("id"))
+
+        OutstandingToken.objects.filter(id__in=[token.id for token in tokens[:3]]).update(
+            expires_at=timezone.now() - datetime.timedelta(days=1)
+        )
+
+        BlacklistedToken.objects.create(token=tokens[0])
+        BlacklistedToken.objects.create(token=tokens[4])
+
+        self.kept = [tokens[3].id, tokens[4].id]
+
+    def test_prune(self):
+        """Test expired tokens are deleted in batches and unexpired ones kept."""
+        stdout = io.StringIO()
+
+        call_command("prune_tokens", batch_size=2, pause=0, stdout=stdout)
+
+        self.assertEqual(list(OutstandingToken.objects.order_by("id").values_list("id", flat=True)), self.kept)
+        self.assertEqual(list(BlacklistedToken.objects.values_list("token_id", flat=True)), [self.kept[1]])
+        self.assertIn("Deleted 3 outstanding and 1 blacklisted tokens", stdout.getvalue())
@@ -1,17 +1,21 @@
-from django.contrib.auth import authenticate
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import make_password
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 
-from server.apps.core.logic.schemas import BAD_REQUEST, UNAUTHORIZED
+from server.apps.core.logic.async_views import AsyncAPIView
+from server.apps.core.logic.schemas import BAD_REQUEST, SERVICE_UNAVAILABLE, UNAUTHORIZED
 
+from .logic.authentication import authenticate_login
+from .logic.hashing import hashing_pool
 from .logic.schemas import AUTH_TOKENS
 from .logic.serializers import LoginSerializer, RegistrationSerializer, UserSerializer
 
 
-class RegistrationView(generics.CreateAPIView):
-    """Registration view."""
+class RegistrationView(AsyncAPIView):
+    """Registration view, hashing the password in the hashing pool."""
 
     serializer_class = RegistrationSerializer
     permission_classes = [permissions.AllowAny]
@@ -26,19 +30,25 @@ class RegistrationView(generics.CreateAPIView):
                 description="Bad request. Invalid data provided",
                 schema=BAD_REQUEST,
             ),
+            503: openapi.Response(
+                description="Too many logins and registrations in progress, retry after `Retry-After` seconds",
+                schema=SERVICE_UNAVAILABLE,
+            ),
         },
     )
-    def post(self, request):
+    async def post(self, request):
         """Handle User registration request"""
         serializer = RegistrationSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
 
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        encoded_password = await hashing_pool.run(make_password, serializer.validated_data["password"])
+        await sync_to_async(serializer.save)(encoded_password=encoded_password)
 
+        return Response(await sync_to_async(lambda: serializer.data)(), status=status.HTTP_201_CREATED)
 
-class LoginView(generics.GenericAPIView):
-    """Login view."""
+
+class LoginView(AsyncAPIView):
+    """Login view, hashing the password in the hashing pool."""
 
     serializer_class = LoginSerializer
     permission_classes = [permissions.AllowAny]
@@ -53,19 +63,23 @@ class LoginView(generics.GenericAPIView):
                 description="Unauthorized. Invalid credentials provided",
                 schema=UNAUTHORIZED,
             ),
+            503: openapi.Response(
+                description="Too many logins and registrations in progress, retry after `Retry-After` seconds",
+                schema=SERVICE_UNAVAILABLE,
+            ),
         },
     )
-    def post(self, request):
+    async def post(self, request):
         """Login view for user."""
 
         serializer = LoginSerializer(data=request.data)
 
         serializer.is_valid(raise_exception=True)
 
-        user = authenticate(
+        user = await authenticate_login(
             request,
-            username=serializer.validated_data["username_email"],
-            password=serializer.validated_data["password"],
+            serializer.validated_data["username_email"],
+            serializer.validated_data["password"],
         )
 
         if not user:
@@ -73,7 +87,7 @@ class LoginView(generics.GenericAPIView):
                 {"detail": "Username/email or password is incorrect."}, status=status.HTTP_401_UNAUTHORIZED
             )
 
-        return Response(user.get_tokens(), status=status.HTTP_200_OK)
+        return Response(await sync_to_async(user.get_tokens)(), status=status.HTTP_200_OK)
 
 
 class ProfileView(generics.RetrieveUpdateAPIView):
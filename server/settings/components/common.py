@@ -1,3 +1,9 @@
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from server.settings.components import config
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -13,6 +19,7 @@ INSTALLED_APPS = [
     "server.apps.user",
     "server.apps.topic",
     "server.apps.comment",
+    "server.apps.search",
 ]
 
 MIDDLEWARE = [
@@ -25,6 +32,15 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Request profiling (Server-Timing headers and per view percentiles at /api/profiling/)
+# See `server.apps.core.middleware.ProfilingMiddleware`
+
+PROFILING = config("DJANGO_PROFILING", default=False, cast=bool)
+PROFILING_SAMPLES = 1000
+
+if PROFILING:
+    MIDDLEWARE.insert(0, "server.apps.core.middleware.ProfilingMiddleware")
+
 ROOT_URLCONF = "server.urls"
 
 TEMPLATES = [
@@ -45,6 +61,49 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "server.wsgi.application"
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+    },
+}
+
+# Cache alias and timeout (in seconds) for group ids of users, see `server.apps.group.logic.cache`
+
+MEMBERSHIP_CACHE_ALIAS = "default"
+MEMBERSHIP_CACHE_TIMEOUT = 60 * 60
+
+# Cache alias and timeout (in seconds) for serialized topic and comment lists, see `server.apps.core.logic.cache`
+
+RESPONSE_CACHE_ALIAS = "responses"
+RESPONSE_CACHE_TIMEOUT = 5 * 60
+
+# Time (in seconds) tombstones of removed objects are kept for `?since=` syncs, see `prune_tombstones`
+
+TOMBSTONE_RETENTION = 30 * 24 * 60 * 60
+
+# Cache alias for ids of blacklisted refresh tokens, see `server.apps.user.logic.tokens`
+
+TOKEN_BLACKLIST_CACHE_ALIAS = "default"
+
+# Search backend of topics and comments, see `server.apps.search.logic.backends`
+
+SEARCH_BACKEND = "server.apps.search.logic.backends.DatabaseSearchBackend"
+
+# Broker of events pushed to open streams, see `server.apps.core.logic.events`
+# Reconnect delay (ms), heartbeat interval (s) and lifetime (s) of Server-Sent Events streams
+
+EVENT_BROKER = "server.apps.core.logic.events.InProcessBroker"
+EVENT_STREAM_RETRY = 3000
+EVENT_STREAM_HEARTBEAT = 15
+EVENT_STREAM_TIMEOUT = 5 * 60
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -65,6 +124,43 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing policy, see `server.apps.user.logic.hashers`
+# New passwords are hashed with `PASSWORD_HASHER` ("pbkdf2_sha256", "scrypt" or "argon2") and the
+# options of its algorithm. Hashes of other algorithms or options still verify and are replaced by the
+# policy on the next login. Compare policies with `python manage.py benchmark_hashers`.
+
+PASSWORD_HASHER = config("DJANGO_PASSWORD_HASHER", default="pbkdf2_sha256")
+
+PASSWORD_HASHER_OPTIONS = {
+    "pbkdf2_sha256": {"iterations": config("DJANGO_PBKDF2_ITERATIONS", default=600_000, cast=int)},
+    "scrypt": {"work_factor": 2**14, "block_size": 8, "parallelism": 1},
+    "argon2": {"time_cost": 2, "memory_cost": 19 * 1024, "parallelism": 1},
+}
+
+password_hashers = {
+    "pbkdf2_sha256": "server.apps.user.logic.hashers.PBKDF2PasswordHasher",
+    "scrypt": "server.apps.user.logic.hashers.ScryptPasswordHasher",
+    "argon2": "server.apps.user.logic.hashers.Argon2PasswordHasher",
+}
+
+if PASSWORD_HASHER not in password_hashers:
+    raise ImproperlyConfigured(
+        f"Unknown DJANGO_PASSWORD_HASHER {PASSWORD_HASHER!r}, expected one of: {', '.join(password_hashers)}"
+    )
+
+PASSWORD_HASHERS = [
+    password_hashers[PASSWORD_HASHER],
+    *(hasher for algorithm, hasher in password_hashers.items() if algorithm != PASSWORD_HASHER),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+
+# Threads hashing passwords of logins and registrations, and calls allowed to wait for one before
+# further requests are answered with 503, see `server.apps.user.logic.hashing`
+
+PASSWORD_HASHING_WORKERS = config("DJANGO_PASSWORD_HASHING_WORKERS", default=os.cpu_count() or 1, cast=int)
+PASSWORD_HASHING_QUEUE = config("DJANGO_PASSWORD_HASHING_QUEUE", default=32, cast=int)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -24,12 +24,22 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "server.apps.user.logic.authentication.StatelessJWTAuthentication",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "server.apps.core.logic.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
+        "server.apps.core.logic.parsers.FastJSONParser",
         "rest_framework.parsers.MultiPartParser",
         "rest_framework.parsers.FormParser",
     ],
+    "DEFAULT_PAGINATION_CLASS": "server.apps.core.logic.pagination.KeysetPagination",
+    "PAGE_SIZE": 20,
+    "DEFAULT_THROTTLE_RATES": {
+        "join_failure": "20/hour",
+    },
 }
 
 # CORS settings
@@ -43,10 +53,12 @@ CORS_ALLOW_ALL_ORIGINS = True
 # https://django-rest-framework-simplejwt.readthedocs.io/en/latest/settings.html
 
 SIMPLE_JWT = {
-    "ACCESS_TOKEN_LIFETIME": datetime.timedelta(days=1),
+    # Short, as `StatelessJWTAuthentication` only checks the user row when a request loads it
+    "ACCESS_TOKEN_LIFETIME": datetime.timedelta(minutes=15),
     "REFRESH_TOKEN_LIFETIME": datetime.timedelta(days=90),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "server.apps.user.logic.serializers.TokenRefreshSerializer",
 }
 
 # DRF YASG (Yet Another Swagger Generator)
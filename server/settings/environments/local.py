@@ -28,6 +28,10 @@ DATABASES = {
     }
 }
 
+# Search backend, SQLite full-text search
+
+SEARCH_BACKEND = "server.apps.search.logic.backends.FTS5SearchBackend"
+
 # Media files
 # https://docs.djangoproject.com/en/4.2/topics/files/
 
@@ -36,6 +36,24 @@ urlpatterns += [
     path("api/auth/", include("server.apps.user.urls")),
 ]
 
+# Profiling URLs
+
+urlpatterns += [
+    path("api/", include("server.apps.core.urls")),
+]
+
+# Search URLs
+
+urlpatterns += [
+    path("api/", include("server.apps.search.urls")),
+]
+
+# Comment event stream URLs
+
+urlpatterns += [
+    path("api/", include("server.apps.comment.urls")),
+]
+
 # DRF Router for ViewSets
 
 router = SimpleRouter()